@@ -20,6 +20,7 @@ DEFAULTS = dict(
         sf2_m=6.0, sf2_a=1.0, sf2_b=1.0, sf2_n1=0.5, sf2_n2=0.5, sf2_n3=0.5,
         density_pdf="1",
         poisson_dmin=0.05,
+        poisson_seed=0,
         lissajous_a=3.0, lissajous_b=2.0, lissajous_phase=0.0,
         vogel_k=2.3999632,
         se_n1=1.0, se_n2=1.0,
@@ -105,6 +106,11 @@ DEFAULTS = dict(
         orbiterColorFromButton=False,
         redCircleHalo=False,
         showImprints=True,
+        frameProfiler=False,
+        simulationThread=False,
+        simRateHz=60,
+        adaptivePacing=False,
+        targetFrameMs=0,
         orbiterOpacity=0.9,
         orbiterSizePx=2.5,
         orbiterSizeSameAsModel=True,
@@ -498,7 +504,7 @@ SUBPROFILE_PRESETS = dict(
                     topology="schwarz_P",
                     R=1.0,
                     N=3600,
-                    schwarz_scale=1.2,
+                    schwarz_scale=3.8,
                     schwarz_iso=0.08,
                 ),
                 "Metaballs organiques": dict(
@@ -1178,6 +1184,7 @@ TOOLTIPS = {
     "geometry.sf2_n3":"Exposant n3 de la superformule 2D.",
     "geometry.density_pdf":"Fonction de densité radiale utilisée pour répartir les points sur le disque.",
     "geometry.poisson_dmin":"Distance minimale entre deux points du disque de Poisson.",
+    "geometry.poisson_seed":"Graine de l'échantillonnage de Poisson : une même graine redonne exactement les mêmes points.",
     "geometry.lissajous_a":"Fréquence horizontale de la courbe de Lissajous plane.",
     "geometry.lissajous_b":"Fréquence verticale de la courbe de Lissajous plane.",
     "geometry.lissajous_phase":"Décalage de phase (rad) pour la courbe de Lissajous plane.",
@@ -1311,6 +1318,11 @@ TOOLTIPS = {
     "system.orbiterColorFromButton":"Fait adopter aux particules orbitales la couleur dominante du bouton qu’elles accompagnent.",
     "system.redCircleHalo":"Affiche un halo fluorescent autour du cercle rouge pour renforcer le repère visuel.",
     "system.showImprints":"Affiche ou masque les empreintes laissées au franchissement du cercle rouge.",
+    "system.frameProfiler":"Mesure le temps de chaque étape du rendu et l’affiche en surimpression (moyenne des 60 dernières frames).",
+    "system.simulationThread":"Calcule les frames dans un thread dédié ; la vue ne fait que dessiner la dernière frame terminée.",
+    "system.simRateHz":"Fréquence fixe de la simulation (orbiters, caméra) ; le rendu interpole entre les deux derniers pas. 0 = pas variable, lié à la frame.",
+    "system.adaptivePacing":"Allonge l’intervalle entre frames quand le rendu dépasse son budget, et revient à l’intervalle réglé dès que la charge baisse.",
+    "system.targetFrameMs":"Durée de frame visée : au-delà, le nombre de particules dessinées baisse (puis l’anticrénelage et les cercles), et remonte quand la marge revient. 0 = désactivé.",
     "system.orbiterOpacity":"Règle la transparence maximale appliquée aux particules orbitales.",
     "system.orbiterSizePx":"Fixe le diamètre des particules orbitales lorsqu’elles ne reprennent pas la taille du modèle.",
     "system.orbiterSizeSameAsModel":"Fait correspondre la taille des particules orbitales à celle du modèle principal.",
@@ -18,7 +18,7 @@ try:
     from .orbit_tab import OrbitTab
     from .indicator_tab import IndicatorTab
     from .link_controller_tab import LinkControllerTab
-    from .profile_manager import ProfileManager, SubProfileManager
+    from .profile_manager import ProfileManager, StateHash, SubProfileManager
     from ..donut_hub import default_donut_config, sanitize_donut_state
 except ImportError:  # pragma: no cover - compatibilité exécution directe
     from core.control.config import DEFAULTS, PROFILE_PRESET_DESCRIPTIONS  # type: ignore
@@ -31,7 +31,7 @@ except ImportError:  # pragma: no cover - compatibilité exécution directe
     from core.control.orbit_tab import OrbitTab  # type: ignore
     from core.control.indicator_tab import IndicatorTab  # type: ignore
     from core.control.link_controller_tab import LinkControllerTab  # type: ignore
-    from core.control.profile_manager import ProfileManager, SubProfileManager  # type: ignore
+    from core.control.profile_manager import ProfileManager, StateHash, SubProfileManager  # type: ignore
     from core.donut_hub import default_donut_config, sanitize_donut_state  # type: ignore
 
 
@@ -62,6 +62,9 @@ class ControlWindow(QtWidgets.QMainWindow):
         self._dirty = False
         self._view_ready = True
         self.state = {"donut": default_donut_config()}
+        # Hash structurel de self.state, mis à jour à chaque delta pour le suivi
+        # des modifications (comparé à celui du profil courant).
+        self._state_hash = StateHash(self.state)
         self.current_profile = ProfileManager.DEFAULT_PROFILE
         
         # Debouncing pour éviter les mises à jour trop fréquentes
@@ -70,6 +73,10 @@ class ControlWindow(QtWidgets.QMainWindow):
         self._push_params_timer.setInterval(50)  # 50ms de debounce
         self._push_params_timer.timeout.connect(self._do_push_params)
         self._pending_push = False
+        # Clés modifiées depuis le dernier envoi ({section: {clé: valeur}} ou
+        # section entière) ; un envoi complet est forcé au chargement de profil.
+        self._pending_changes: dict = {}
+        self._push_full_state = True
 
         self._apply_theme()
 
@@ -376,6 +383,7 @@ class ControlWindow(QtWidgets.QMainWindow):
                 for key, value in profile.items()
             }
             self._migrate_state(self.state)
+            self._state_hash.reset(self.state)
             self.tab_camera.set_defaults(self.state.get("camera"))
             self.tab_geometry.set_defaults(self.state.get("geometry"))
             self.tab_appearance.set_defaults(self.state.get("appearance"))
@@ -438,6 +446,7 @@ class ControlWindow(QtWidgets.QMainWindow):
             self.save_profile_as()
             return
         self.state = self.collect_state()
+        self._state_hash.reset(self.state)
         try:
             self.profile_mgr.save_profile(self.current_profile, self.state)
         except Exception as exc:  # pragma: no cover - retour utilisateur
@@ -474,6 +483,7 @@ class ControlWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "Erreur", str(exc))
             return
         self.state = state
+        self._state_hash.reset(self.state)
         self.current_profile = name
         self.refresh_profiles(select=name)
         self.set_dirty(False)
@@ -567,18 +577,37 @@ class ControlWindow(QtWidgets.QMainWindow):
             pass
 
     def on_delta(self, delta: dict):
+        pending = self._pending_changes
         for key, value in delta.items():
             if key == "donut":
                 self.state["donut"] = sanitize_donut_state(value)
+                self._state_hash.assign("donut", self.state["donut"])
+                pending["donut"] = self.state["donut"]
                 continue
             if isinstance(value, dict):
-                self.state.setdefault(key, {}).update(value)
+                section = self.state.setdefault(key, {})
+                # Les onglets renvoient leur section entière : on ne garde que
+                # les clés dont la valeur a réellement changé.
+                changes = {k: v for k, v in value.items() if k not in section or section[k] != v}
+                if not changes:
+                    continue
+                section.update(changes)
+                self._state_hash.merge(key, changes, section)
+                target = pending.get(key)
+                if isinstance(target, dict):
+                    target.update(changes)
+                else:
+                    pending[key] = dict(changes)
             else:
                 self.state[key] = value
+                self._state_hash.assign(key, value)
+                pending[key] = value
         self._apply_transparency()
         if not self._loading_profile:
             self.set_dirty(
-                not self.profile_mgr.profile_equals(self.current_profile, self.state)
+                not self.profile_mgr.profile_equals(
+                    self.current_profile, self.state, state_hash=self._state_hash.value
+                )
             )
         # Utiliser le debouncing pour éviter les appels excessifs
         self._pending_push = True
@@ -589,7 +618,11 @@ class ControlWindow(QtWidgets.QMainWindow):
             self.tab_camera.set_tilt_to_max()
 
     def _do_push_params(self):
-        """Effectue la mise à jour réelle après le debounce."""
+        """Effectue la mise à jour réelle après le debounce.
+
+        Seules les clés modifiées depuis le dernier envoi partent vers la vue,
+        sauf après un chargement de profil où l'état complet est renvoyé.
+        """
         if not self._pending_push:
             return
         self._pending_push = False
@@ -597,10 +630,18 @@ class ControlWindow(QtWidgets.QMainWindow):
         view = getattr(self.view_win, "view", None)
         if view is None:
             return
+        full = self._push_full_state
+        payload = self.state if full else self._pending_changes
+        if not payload:
+            return
         try:
-            view.set_params(self.state)
+            view.set_params(payload)
         except Exception:
             return
+        self._push_full_state = False
+        self._pending_changes = {}
+        if not full and "donut" not in payload:
+            return
         
         # Plus besoin de mettre à jour DonutHub - le rendu est fait dans ViewWidget
         # DonutHub ne gère maintenant que les clics
@@ -623,6 +664,7 @@ class ControlWindow(QtWidgets.QMainWindow):
     def push_params(self):
         """Appel immédiat sans debouncing (pour le chargement de profil)."""
         self._pending_push = True
+        self._push_full_state = True
         self._push_params_timer.stop()
         self._do_push_params()
 
@@ -70,7 +70,7 @@ def _param_group(name: str) -> str:
         return "Paramètres globaux"
     if name.startswith("sf2_") or name.startswith("sf3_") or name == "sf3_scale":
         return "Superformules"
-    if name in {"density_pdf", "poisson_dmin", "lissajous_a", "lissajous_b", "lissajous_phase", "weight_map"}:
+    if name in {"density_pdf", "poisson_dmin", "poisson_seed", "lissajous_a", "lissajous_b", "lissajous_phase", "weight_map"}:
         return "Répartitions paramétriques"
     if name in {
         "helix_r",
@@ -155,6 +155,7 @@ PARAM_SPECS = {
     "sf2_n3": dict(type="double", label="Superformule n3", tip="geometry.sf2_n3", min=0.01, max=10.0, step=0.01, decimals=3),
     "density_pdf": dict(type="text", label="Densité radiale", tip="geometry.density_pdf"),
     "poisson_dmin": dict(type="double", label="Distance min", tip="geometry.poisson_dmin", min=0.0, max=2.0, step=0.01, decimals=3),
+    "poisson_seed": dict(type="int", label="Graine Poisson", tip="geometry.poisson_seed", min=0, max=999999),
     "lissajous_a": dict(type="int", label="Lissajous a", tip="geometry.lissajous_a", min=1, max=64),
     "lissajous_b": dict(type="int", label="Lissajous b", tip="geometry.lissajous_b", min=1, max=64),
     "lissajous_phase": dict(type="double", label="Phase (rad)", tip="geometry.lissajous_phase", min=-6.283185, max=6.283185, step=0.01, decimals=3),
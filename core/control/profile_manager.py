@@ -11,8 +11,9 @@ from __future__ import annotations
 
 import json
 import copy
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 try:
     from .config import DEFAULTS  # type: ignore
@@ -26,6 +27,88 @@ PROFILES_DIR.mkdir(parents=True, exist_ok=True)
 
 DEFAULT_PROFILE = "Default"
 
+_HASH_MASK = (1 << 64) - 1
+
+
+def structural_hash(value: Any) -> int:
+    """Hash ``value`` so that ``a == b`` implies equal hashes.
+
+    Mappings hash independently of key order (like dict equality), sequences
+    element by element; unhashable leaves fall back to their type, which keeps
+    the implication true at the cost of more collisions.
+    """
+
+    if isinstance(value, Mapping):
+        total = 0
+        for key, item in value.items():
+            total += hash((key, structural_hash(item)))
+        return hash(("map", total & _HASH_MASK))
+    if isinstance(value, (list, tuple)):
+        return hash(("seq", tuple(structural_hash(item) for item in value)))
+    try:
+        return hash(value)
+    except TypeError:
+        return hash(type(value).__qualname__)
+
+
+class StateHash:
+    """Structural hash of a ``{section: {key: value}}`` state, kept up to date.
+
+    The hash is a sum of per-key terms, so :meth:`merge` and :meth:`assign`
+    only rehash the keys a delta touches.  It matches
+    ``structural_hash``-style equality: equal states always hash equal,
+    different ones almost always differ.
+    """
+
+    __slots__ = ("value", "_sections")
+
+    def __init__(self, state: Optional[Mapping] = None) -> None:
+        self.value = 0
+        # section -> (terme global, {clé: terme} pour une section dict, sinon None)
+        self._sections: Dict[Any, Tuple[int, Optional[Dict[Any, int]]]] = {}
+        self.reset(state or {})
+
+    def reset(self, state: Mapping) -> None:
+        self.value = 0
+        self._sections = {}
+        for section, content in state.items():
+            self.assign(section, content)
+
+    def assign(self, section: Any, content: Any) -> None:
+        """Record ``state[section] = content``."""
+
+        self._drop(section)
+        if isinstance(content, Mapping):
+            terms = {key: hash((key, structural_hash(item))) for key, item in content.items()}
+            self._store(section, terms)
+        else:
+            term = hash((section, structural_hash(content)))
+            self._sections[section] = (term, None)
+            self.value = (self.value + term) & _HASH_MASK
+
+    def merge(self, section: Any, delta: Mapping, content: Mapping) -> None:
+        """Record ``state[section].update(delta)``; ``content`` is the updated section."""
+
+        entry = self._sections.get(section)
+        if entry is None or entry[1] is None:
+            self.assign(section, content)
+            return
+        terms = dict(entry[1])
+        for key, item in delta.items():
+            terms[key] = hash((key, structural_hash(item)))
+        self._drop(section)
+        self._store(section, terms)
+
+    def _store(self, section: Any, terms: Dict[Any, int]) -> None:
+        term = hash((section, "map", sum(terms.values()) & _HASH_MASK))
+        self._sections[section] = (term, terms)
+        self.value = (self.value + term) & _HASH_MASK
+
+    def _drop(self, section: Any) -> None:
+        entry = self._sections.pop(section, None)
+        if entry is not None:
+            self.value = (self.value - entry[0]) & _HASH_MASK
+
 
 class ProfileManager:
     """Small file-backed profile manager.
@@ -38,12 +121,39 @@ class ProfileManager:
     DEFAULT_PROFILE = DEFAULT_PROFILE
 
     def __init__(self) -> None:
-        # nothing heavy to initialise
-        pass
+        # Profils déjà lus : nom -> (mtime_ns du fichier, contenu, hash structurel).
+        # Une entrée est périmée dès que le fichier change de mtime.
+        self._cache: Dict[str, Tuple[Optional[int], Dict, int]] = {}
 
     def _path_for(self, name: str) -> Path:
         return PROFILES_DIR / f"{name}.json"
 
+    def _cached(self, name: str) -> Tuple[Dict, int]:
+        """Return the stored profile and its :class:`StateHash` value (shared, do not mutate)."""
+
+        if name == DEFAULT_PROFILE:
+            mtime: Optional[int] = None
+        else:
+            try:
+                mtime = self._path_for(name).stat().st_mtime_ns
+            except OSError:
+                mtime = None
+        entry = self._cache.get(name)
+        if entry is not None and entry[0] == mtime:
+            return entry[1], entry[2]
+        data: Dict
+        if mtime is None:
+            # Fallback to defaults if file missing or invalid
+            data = copy.deepcopy(DEFAULTS)
+        else:
+            try:
+                data = json.loads(self._path_for(name).read_text(encoding="utf-8"))
+            except Exception:
+                data = copy.deepcopy(DEFAULTS)
+        digest = StateHash(data).value if isinstance(data, Mapping) else structural_hash(data)
+        self._cache[name] = (mtime, data, digest)
+        return data, digest
+
     def list_profiles(self) -> Iterable[str]:
         names = [p.stem for p in PROFILES_DIR.glob("*.json") if p.is_file()]
         # ensure the default profile is always available
@@ -52,18 +162,20 @@ class ProfileManager:
         return sorted(names)
 
     def get_profile(self, name: str) -> Dict:
-        if name == DEFAULT_PROFILE:
-            return copy.deepcopy(DEFAULTS)
-        path = self._path_for(name)
-        try:
-            return json.loads(path.read_text(encoding="utf-8"))
-        except Exception:
-            # Fallback to defaults if file missing or invalid
-            return copy.deepcopy(DEFAULTS)
+        return copy.deepcopy(self._cached(name)[0])
 
     def save_profile(self, name: str, state: Dict) -> None:
         path = self._path_for(name)
-        path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+        text = json.dumps(state, ensure_ascii=False, indent=2)
+        path.write_text(text, encoding="utf-8")
+        # Le cache reprend ce qui a été écrit (relu depuis le texte JSON, comme
+        # le ferait un chargement), sans attendre un nouvel accès disque.
+        self._cache.pop(name, None)
+        try:
+            data = json.loads(text)
+            self._cache[name] = (path.stat().st_mtime_ns, data, StateHash(data).value)
+        except Exception:
+            pass
 
     def has_profile(self, name: str) -> bool:
         if name == DEFAULT_PROFILE:
@@ -74,6 +186,7 @@ class ProfileManager:
         path = self._path_for(name)
         if path.is_file():
             path.unlink()
+            self._cache.pop(name, None)
         else:
             raise FileNotFoundError(name)
 
@@ -85,12 +198,22 @@ class ProfileManager:
         if new_path.exists():
             raise FileExistsError(new_path)
         old_path.rename(new_path)
+        self._cache.pop(old, None)
+        self._cache.pop(new, None)
+
+    def profile_equals(self, name: str, state: Dict, state_hash: Optional[int] = None) -> bool:
+        """Compare ``state`` with the stored profile.
+
+        ``state_hash`` is the :class:`StateHash` value of ``state`` when the
+        caller maintains one: a mismatch answers without walking the state.
+        """
 
-    def profile_equals(self, name: str, state: Dict) -> bool:
         try:
-            stored = self.get_profile(name)
+            stored, digest = self._cached(name)
         except Exception:
             return False
+        if state_hash is not None and state_hash != digest:
+            return False
         return stored == state
 
 
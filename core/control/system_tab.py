@@ -37,6 +37,11 @@ class SystemTab(QtWidgets.QWidget):
         self.chk_orbiter_size_match.setToolTip(TOOLTIPS["system.orbiterSizeSameAsModel"])
         self.chk_red_halo = QtWidgets.QCheckBox(); self.chk_red_halo.setChecked(d.get("redCircleHalo", False))
         self.chk_show_imprints = QtWidgets.QCheckBox(); self.chk_show_imprints.setChecked(d.get("showImprints", True))
+        self.chk_frame_profiler = QtWidgets.QCheckBox(); self.chk_frame_profiler.setChecked(d.get("frameProfiler", False))
+        self.chk_simulation_thread = QtWidgets.QCheckBox(); self.chk_simulation_thread.setChecked(d.get("simulationThread", False))
+        self.sp_sim_rate = QtWidgets.QSpinBox(); self.sp_sim_rate.setRange(0,240); self.sp_sim_rate.setSuffix(" Hz"); self.sp_sim_rate.setValue(int(d.get("simRateHz", 60)))
+        self.chk_adaptive_pacing = QtWidgets.QCheckBox(); self.chk_adaptive_pacing.setChecked(d.get("adaptivePacing", False))
+        self.sp_target_frame = QtWidgets.QSpinBox(); self.sp_target_frame.setRange(0,100); self.sp_target_frame.setSuffix(" ms"); self.sp_target_frame.setSpecialValueText("Désactivé"); self.sp_target_frame.setValue(int(d.get("targetFrameMs", 0)))
         
         row(fl, "Particules max", self.sp_Nmax, TOOLTIPS["system.Nmax"], lambda: self.sp_Nmax.setValue(d["Nmax"]))
         row(fl, "Limite haute résolution", self.sp_dpr, TOOLTIPS["system.dprClamp"], lambda: self.sp_dpr.setValue(d["dprClamp"]))
@@ -53,6 +58,11 @@ class SystemTab(QtWidgets.QWidget):
         row(fl, "Taille particules orbit.", orbiter_size_row, TOOLTIPS["system.orbiterSizePx"], lambda: self._reset_orbiter_size_defaults(d))
         row(fl, "Halo cercle rouge", self.chk_red_halo, TOOLTIPS["system.redCircleHalo"], lambda: self.chk_red_halo.setChecked(d.get("redCircleHalo", False)))
         row(fl, "Afficher les empreintes", self.chk_show_imprints, TOOLTIPS["system.showImprints"], lambda: self.chk_show_imprints.setChecked(d.get("showImprints", True)))
+        row(fl, "Profileur de frame", self.chk_frame_profiler, TOOLTIPS["system.frameProfiler"], lambda: self.chk_frame_profiler.setChecked(d.get("frameProfiler", False)))
+        row(fl, "Simulation en thread", self.chk_simulation_thread, TOOLTIPS["system.simulationThread"], lambda: self.chk_simulation_thread.setChecked(d.get("simulationThread", False)))
+        row(fl, "Fréquence de simulation", self.sp_sim_rate, TOOLTIPS["system.simRateHz"], lambda: self.sp_sim_rate.setValue(int(d.get("simRateHz", 60))))
+        row(fl, "Cadence adaptative", self.chk_adaptive_pacing, TOOLTIPS["system.adaptivePacing"], lambda: self.chk_adaptive_pacing.setChecked(d.get("adaptivePacing", False)))
+        row(fl, "Durée de frame visée", self.sp_target_frame, TOOLTIPS["system.targetFrameMs"], lambda: self.sp_target_frame.setValue(int(d.get("targetFrameMs", 0))))
 
         # Encadré pour les contrôles du donut hub
         groupbox = QtWidgets.QGroupBox("Paramètres du donut hub")
@@ -84,6 +94,11 @@ class SystemTab(QtWidgets.QWidget):
             self.chk_orbiter_color,
             self.chk_red_halo,
             self.chk_show_imprints,
+            self.chk_frame_profiler,
+            self.chk_simulation_thread,
+            self.sp_sim_rate,
+            self.chk_adaptive_pacing,
+            self.sp_target_frame,
             self.chk_orbiter_size_match,
         ]:
             if isinstance(w, QtWidgets.QCheckBox): w.stateChanged.connect(self.emit_delta)
@@ -124,6 +139,11 @@ class SystemTab(QtWidgets.QWidget):
             orbiterColorFromButton=self.chk_orbiter_color.isChecked(),
             redCircleHalo=self.chk_red_halo.isChecked(),
             showImprints=self.chk_show_imprints.isChecked(),
+            frameProfiler=self.chk_frame_profiler.isChecked(),
+            simulationThread=self.chk_simulation_thread.isChecked(),
+            simRateHz=self.sp_sim_rate.value(),
+            adaptivePacing=self.chk_adaptive_pacing.isChecked(),
+            targetFrameMs=self.sp_target_frame.value(),
             orbiterOpacity=float(self._orbiter_opacity_spin.value()) / 100.0,
             orbiterSizePx=float(self._orbiter_size_spin.value()),
             orbiterSizeSameAsModel=self.chk_orbiter_size_match.isChecked(),
@@ -173,6 +193,22 @@ class SystemTab(QtWidgets.QWidget):
             self.chk_red_halo.setChecked(bool(cfg.get("redCircleHalo", d.get("redCircleHalo", False))))
         with QtCore.QSignalBlocker(self.chk_show_imprints):
             self.chk_show_imprints.setChecked(bool(cfg.get("showImprints", d.get("showImprints", True))))
+        with QtCore.QSignalBlocker(self.chk_frame_profiler):
+            self.chk_frame_profiler.setChecked(bool(cfg.get("frameProfiler", d.get("frameProfiler", False))))
+        with QtCore.QSignalBlocker(self.chk_simulation_thread):
+            self.chk_simulation_thread.setChecked(bool(cfg.get("simulationThread", d.get("simulationThread", False))))
+        with QtCore.QSignalBlocker(self.sp_sim_rate):
+            try:
+                self.sp_sim_rate.setValue(int(cfg.get("simRateHz", d.get("simRateHz", 60))))
+            except (TypeError, ValueError):
+                self.sp_sim_rate.setValue(int(d.get("simRateHz", 60)))
+        with QtCore.QSignalBlocker(self.chk_adaptive_pacing):
+            self.chk_adaptive_pacing.setChecked(bool(cfg.get("adaptivePacing", d.get("adaptivePacing", False))))
+        with QtCore.QSignalBlocker(self.sp_target_frame):
+            try:
+                self.sp_target_frame.setValue(int(cfg.get("targetFrameMs", d.get("targetFrameMs", 0))))
+            except (TypeError, ValueError):
+                self.sp_target_frame.setValue(int(d.get("targetFrameMs", 0)))
         opacity_value = cfg.get("orbiterOpacity", d.get("orbiterOpacity", 0.9))
         try:
             opacity_float = float(opacity_value)
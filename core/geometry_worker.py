@@ -0,0 +1,89 @@
+"""Génération de géométrie dans un processus séparé.
+
+Ce module est volontairement indépendant de Qt : il est importé par les
+processus du pool que :class:`core.view.view_widget.DyxtenEngine` utilise pour
+construire les topologies JSON coûteuses sans bloquer le thread GUI.  Les
+points, déjà centrés et éclaircis, sont renvoyés sous forme d'``array('d')``
+plat (x, y, z, x, y, z, ...) afin de limiter le coût de sérialisation entre
+processus, accompagnés des statistiques d'échantillonnage implicite relevées
+dans le processus fils.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+try:  # numpy est optionnel : l'éclaircissement a une version liste.
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+try:
+    from .grid_thinning import thin_mask
+    from .topology_registry import get_topology_library
+    from .topology_runtime import ImplicitSamplingStats, implicit_sampling_stats, implicit_sampling_stats_since
+except ImportError:  # pragma: no cover - compat exécution directe
+    from core.grid_thinning import thin_mask  # type: ignore
+    from core.topology_registry import get_topology_library  # type: ignore
+    from core.topology_runtime import (  # type: ignore
+        ImplicitSamplingStats,
+        implicit_sampling_stats,
+        implicit_sampling_stats_since,
+    )
+
+
+_RESERVED_KEYS = frozenset({"code", "topology", "uses"})
+
+
+def center_and_thin(
+    coords: Sequence[Tuple[float, float, float]], min_dist: float
+) -> List[Tuple[float, float, float]]:
+    """Centre ``coords`` on their mean, then drop points closer than ``min_dist``.
+
+    Thinning is greedy in input order (see :func:`core.grid_thinning.thin_mask`).
+    """
+
+    count = len(coords)
+    if count == 0:
+        return []
+    cx = sum(p[0] for p in coords) / count
+    cy = sum(p[1] for p in coords) / count
+    cz = sum(p[2] for p in coords) / count
+    centered = [(x - cx, y - cy, z - cz) for x, y, z in coords]
+    if min_dist > 0:
+        if np is not None:
+            keep = thin_mask(np.array(centered, dtype=np.float64).reshape(-1, 3), min_dist)
+        else:
+            keep = thin_mask(centered, min_dist)
+        centered = [p for p, kept in zip(centered, keep) if kept]
+    return centered
+
+
+def generate_topology(
+    name: str, geo: Mapping[str, object], cap: int, dmin: float = 0.0
+) -> Tuple[array, Dict[str, ImplicitSamplingStats]]:
+    """Run the JSON topology ``name`` with the geometry section ``geo``.
+
+    Parameters are resolved exactly like the in-process adapter of the view
+    (definition defaults overridden by ``geo``, ``N`` clamped to ``cap``).
+    The points are centred and thinned to ``dmin`` (:func:`center_and_thin`)
+    before being flattened.  Returns the coordinates and the implicit-surface
+    sampling statistics recorded by this run, keyed by generator name.
+    """
+
+    generator = get_topology_library().generator(name)
+    if generator is None:
+        raise ValueError(f"Topologie indisponible: {name}")
+    params = {k: v for k, v in geo.items() if isinstance(k, str) and k not in _RESERVED_KEYS}
+    before = implicit_sampling_stats()
+    points = center_and_thin(list(generator(params, cap)), dmin)
+    out = array("d")
+    for x, y, z in points:
+        out.append(x)
+        out.append(y)
+        out.append(z)
+    return out, implicit_sampling_stats_since(before)
+
+
+__all__ = ["center_and_thin", "generate_topology"]
@@ -0,0 +1,222 @@
+"""Greedy minimum-distance thinning of 2D or 3D points on a uniform grid."""
+
+from __future__ import annotations
+
+import math
+from itertools import product
+from typing import Dict, List, Sequence, Tuple
+
+try:  # numpy est optionnel : sans lui on garde la version dictionnaire.
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+__all__ = ["thin_mask"]
+
+# Les index de cellule sont bornés puis empaquetés sur 21 bits par axe (une
+# clé int64 pour trois axes).  Les points au-delà partagent la cellule du
+# bord : le test de distance reste exact, seule la recherche est plus large.
+_AXIS_BITS = 21
+_AXIS_LIMIT = 1 << (_AXIS_BITS - 2)
+
+# Passes vectorisées de résolution avant de finir point par point.
+_MAX_ROUNDS = 32
+
+# Paires candidates tolérées par point : au-delà (amas denses), la version
+# dictionnaire, qui ne compare qu'aux points gardés, est plus rapide.
+_PAIR_BUDGET = 8
+
+_UNKNOWN = 0
+_KEEP = 1
+_DROP = 2
+
+
+def thin_mask(coords, min_dist: float, cell: float | None = None):
+    """Return which points survive a greedy minimum-distance thinning.
+
+    Points are visited in input order; a point is kept when no point kept
+    before it lies strictly closer than ``min_dist``.  ``cell`` is the grid
+    size used to find neighbours and must be at least ``min_dist`` (it
+    defaults to it).  ``coords`` is either a sequence of 2- or 3-tuples, which
+    gives a list of booleans, or an ``(N, D)`` numpy array, which gives a
+    boolean array computed by sorting the points by cell key instead of
+    filling a dict of lists.  Both return the same mask.
+
+    The array version compares every pair of points in neighbouring cells,
+    so its cost grows with the square of the cell occupancy; when the pair
+    count exceeds ``_PAIR_BUDGET`` per point it defers to the dict version,
+    whose cost is bounded by the few kept points a cell can hold.
+    """
+
+    if cell is None:
+        cell = min_dist
+    if np is not None and isinstance(coords, np.ndarray):
+        return _thin_mask_array(coords, float(min_dist), float(cell))
+    return _thin_mask_scalar(coords, float(min_dist), float(cell))
+
+
+def _thin_mask_scalar(coords: Sequence[Sequence[float]], min_dist: float, cell: float) -> List[bool]:
+    count = len(coords)
+    if min_dist <= 0 or count == 0:
+        return [True] * count
+    if len(coords[0]) == 2:
+        return _thin_mask_scalar_2d(coords, min_dist, cell)
+    return _thin_mask_scalar_3d(coords, min_dist, cell)
+
+
+def _thin_mask_scalar_2d(coords: Sequence[Sequence[float]], min_dist: float, cell: float) -> List[bool]:
+    min_sq = min_dist * min_dist
+    offsets = list(product((-1, 0, 1), repeat=2))
+    grid: Dict[Tuple[int, int], List[Tuple[float, float]]] = {}
+    mask = [False] * len(coords)
+    for i, (x, y) in enumerate(coords):
+        ix = int(math.floor(x / cell))
+        iy = int(math.floor(y / cell))
+        keep = True
+        for dx, dy in offsets:
+            bucket = grid.get((ix + dx, iy + dy))
+            if not bucket:
+                continue
+            for px, py in bucket:
+                ex = x - px
+                ey = y - py
+                if ex * ex + ey * ey < min_sq:
+                    keep = False
+                    break
+            if not keep:
+                break
+        if keep:
+            mask[i] = True
+            grid.setdefault((ix, iy), []).append((x, y))
+    return mask
+
+
+def _thin_mask_scalar_3d(coords: Sequence[Sequence[float]], min_dist: float, cell: float) -> List[bool]:
+    min_sq = min_dist * min_dist
+    offsets = list(product((-1, 0, 1), repeat=3))
+    grid: Dict[Tuple[int, int, int], List[Tuple[float, float, float]]] = {}
+    mask = [False] * len(coords)
+    for i, (x, y, z) in enumerate(coords):
+        ix = int(math.floor(x / cell))
+        iy = int(math.floor(y / cell))
+        iz = int(math.floor(z / cell))
+        keep = True
+        for dx, dy, dz in offsets:
+            bucket = grid.get((ix + dx, iy + dy, iz + dz))
+            if not bucket:
+                continue
+            for px, py, pz in bucket:
+                ex = x - px
+                ey = y - py
+                ez = z - pz
+                if ex * ex + ey * ey + ez * ez < min_sq:
+                    keep = False
+                    break
+            if not keep:
+                break
+        if keep:
+            mask[i] = True
+            grid.setdefault((ix, iy, iz), []).append((x, y, z))
+    return mask
+
+
+def _pack_cells(cells):
+    key = cells[:, 0].copy()
+    for axis in range(1, cells.shape[1]):
+        key <<= _AXIS_BITS
+        key |= cells[:, axis]
+    return key
+
+
+def _thin_mask_array(coords, min_dist: float, cell: float):
+    coords = np.asarray(coords, dtype=np.float64)
+    count, dims = coords.shape
+    if min_dist <= 0 or count < 2:
+        return np.ones(count, dtype=bool)
+    cells = np.clip(np.floor(coords / cell), -_AXIS_LIMIT, _AXIS_LIMIT).astype(np.int64)
+    cells += _AXIS_LIMIT + 1
+    keys = _pack_cells(cells)
+    # Points regroupés par cellule, dans l'ordre d'entrée au sein de chacune.
+    order = np.argsort(keys, kind="stable")
+    uniq, start, sizes = np.unique(keys[order], return_index=True, return_counts=True)
+    cell_of = np.empty(count, dtype=np.intp)
+    cell_of[order] = np.repeat(np.arange(len(uniq)), sizes)
+    min_sq = min_dist * min_dist
+
+    # Cellules voisines de chaque cellule, et nombre de paires à examiner.
+    neighbours = []
+    pair_count = 0
+    for offset in product((-1, 0, 1), repeat=dims):
+        # La clé empaquetée est linéaire : les voisins d'une cellule sont
+        # ``uniq + delta``, déjà triés, cherchés une fois par cellule.
+        delta = 0
+        for o in offset:
+            delta = (delta << _AXIS_BITS) + o
+        near_keys = uniq + delta
+        pos = np.searchsorted(uniq, near_keys)
+        np.minimum(pos, len(uniq) - 1, out=pos)
+        found = uniq[pos] == near_keys
+        pair_count += int(np.dot(sizes[found], sizes[pos[found]]))
+        neighbours.append((pos, found))
+    if pair_count > 2 * _PAIR_BUDGET * count:
+        # Amas dense : chaque paire compte deux fois dans ``pair_count``.
+        return np.asarray(_thin_mask_scalar(coords.tolist(), min_dist, cell), dtype=bool)
+
+    # Paires (plus récent, plus ancien) à moins de min_dist dans les cellules voisines.
+    later_parts = []
+    earlier_parts = []
+    for pos, found in neighbours:
+        points = order[found[cell_of[order]]]
+        if not len(points):
+            continue
+        groups = pos[cell_of[points]]
+        n = sizes[groups]
+        later = np.repeat(points, n)
+        first = np.repeat(start[groups] - (np.cumsum(n) - n), n)
+        earlier = order[first + np.arange(len(later))]
+        sel = earlier < later
+        later = later[sel]
+        earlier = earlier[sel]
+        diff = coords[later] - coords[earlier]
+        d2 = diff[:, 0] * diff[:, 0]
+        for axis in range(1, dims):
+            d2 += diff[:, axis] * diff[:, axis]
+        close = d2 < min_sq
+        later_parts.append(later[close])
+        earlier_parts.append(earlier[close])
+    if not later_parts:
+        return np.ones(count, dtype=bool)
+    later = np.concatenate(later_parts)
+    earlier = np.concatenate(earlier_parts)
+
+    # Sans voisin plus ancien, un point est gardé ; sinon il est écarté dès
+    # qu'un voisin plus ancien est gardé, gardé dès qu'ils sont tous écartés.
+    state = np.full(count, _KEEP, dtype=np.int8)
+    state[later] = _UNKNOWN
+    for _ in range(_MAX_ROUNDS):
+        pending = state[later] == _UNKNOWN
+        if not pending.any():
+            break
+        pending_later = later[pending]
+        partner = state[earlier[pending]]
+        drop = np.zeros(count, dtype=bool)
+        drop[pending_later[partner == _KEEP]] = True
+        blocked = np.zeros(count, dtype=bool)
+        blocked[pending_later[partner != _DROP]] = True
+        unknown = state == _UNKNOWN
+        state[unknown & drop] = _DROP
+        state[unknown & ~blocked] = _KEEP
+
+    rest = np.flatnonzero(state == _UNKNOWN)
+    if len(rest):
+        # Longues chaînes de dépendances : fin séquentielle dans l'ordre d'entrée.
+        by_later = np.argsort(later, kind="stable")
+        later_sorted = later[by_later]
+        partners = earlier[by_later].tolist()
+        lo = np.searchsorted(later_sorted, rest, side="left").tolist()
+        hi = np.searchsorted(later_sorted, rest, side="right").tolist()
+        flags = state.tolist()
+        for i, a, b in zip(rest.tolist(), lo, hi):
+            flags[i] = _DROP if any(flags[j] == _KEEP for j in partners[a:b]) else _KEEP
+        state = np.asarray(flags, dtype=np.int8)
+    return state == _KEEP
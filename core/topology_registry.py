@@ -11,18 +11,56 @@ Python modules.
 The goal is to make it straightforward to add new topologies simply by dropping
 JSON files in the directory (or importing them at runtime) while keeping the
 rest of the application agnostic of the storage format.
+
+Generators are built lazily: the ``code`` of a topology is only compiled and
+executed the first time it is requested through :meth:`TopologyLibrary.generator`.
+Compiled code objects are cached on disk (``__pycache__`` next to the JSON
+files, keyed by the SHA-256 of the code and the interpreter cache tag) so that
+subsequent runs skip the compilation step entirely.
+
+Instead of ``code``, a definition may declare ``"uses": "builtin:<generator>"``
+to reuse one of the generators of :mod:`core.topology_runtime`.  Custom code
+can import the same helpers with ``from dyxten_topo_runtime import ...``.
+Legacy files embedding a verbatim copy of the runtime are converted to the
+compact form when loaded, so imports and exports only ever write the latter.
 """
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
 import json
+import marshal
+import os
+import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+from types import CodeType, ModuleType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_TOPOLOGY_DIR = ROOT / "topologie"
+CODE_CACHE_DIRNAME = "__pycache__"
+RUNTIME_MODULE_NAME = "dyxten_topo_runtime"
+BUILTIN_PREFIX = "builtin:"
+
+# Clés de ``geometry`` qui ne sont pas des paramètres de la topologie
+_RESERVED_KEYS = frozenset({"code", "topology", "uses"})
+
+# SHA-256 de la copie du runtime autrefois incluse dans chaque JSON, suivie de
+# l'adaptateur ``generate_<name>_geometry`` standard.
+_LEGACY_RUNTIME_SHA256 = "143fa345261aea987578647850113d6d07673a4ece9837f19080833d43793d82"
+_LEGACY_WRAPPER_RE = re.compile(
+    r"def generate_(?P<name>\w+)_geometry\(params, N\):\n"
+    r"    cap = int\(N or 0\)\n"
+    r"    points = BUILTIN_GENERATORS\['(?P<builtin>\w+)'\]\(params, cap\)\n"
+    r"    wrapped = _wrap_points\(points\)\n"
+    r"    return wrapped\[:cap\] if cap else wrapped\s*\Z"
+)
+
+TopologyGenerator = Callable[[Mapping[str, Any], int], List[Tuple[float, float, float]]]
 
 
 def _ensure_directory(path: Path) -> Path:
@@ -30,6 +68,116 @@ def _ensure_directory(path: Path) -> Path:
     return path
 
 
+def runtime_module() -> ModuleType:
+    """Return :mod:`core.topology_runtime`, registered as ``dyxten_topo_runtime``."""
+
+    module = sys.modules.get(RUNTIME_MODULE_NAME)
+    if module is None:
+        try:
+            from . import topology_runtime as module
+        except ImportError:  # pragma: no cover - exécution hors package
+            from core import topology_runtime as module  # type: ignore
+        sys.modules[RUNTIME_MODULE_NAME] = module
+    return module
+
+
+def _builtin_name(uses: Any) -> str:
+    if isinstance(uses, str) and uses.startswith(BUILTIN_PREFIX):
+        return uses[len(BUILTIN_PREFIX):].strip()
+    return ""
+
+
+def _compact_legacy_code(code: str) -> str:
+    """Return ``builtin:<generator>`` if ``code`` is a verbatim runtime copy, else ``""``."""
+
+    match = _LEGACY_WRAPPER_RE.search(code)
+    if match is None or match.group("name") != match.group("builtin"):
+        return ""
+    prefix = code[: match.start()]
+    if hashlib.sha256(prefix.encode("utf-8")).hexdigest() != _LEGACY_RUNTIME_SHA256:
+        return ""
+    return BUILTIN_PREFIX + match.group("builtin")
+
+
+def _code_cache_enabled() -> bool:
+    flag = os.environ.get("DYXTEN_TOPOLOGY_CACHE", "").strip().lower()
+    return flag not in {"0", "false", "no", "off"}
+
+
+def _cache_key(code: str) -> str:
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()[:32]
+
+
+def prune_code_cache(cache_dir: Path, codes: Iterable[str]) -> None:
+    """Delete the cached code objects of ``cache_dir`` that no source in ``codes`` maps to.
+
+    Entries of every interpreter tag are kept as long as their source is
+    still in use; leftover temporary files are removed as well.
+    """
+
+    if not _code_cache_enabled() or not cache_dir.is_dir():
+        return
+    keep = {_cache_key(code) for code in codes}
+    try:
+        entries = list(cache_dir.iterdir())
+    except OSError:
+        return
+    for entry in entries:
+        name = entry.name
+        if name.endswith(".tmp"):
+            stale = ".topo." in name
+        elif name.endswith(".topo"):
+            stale = name.split(".", 1)[0] not in keep
+        else:
+            continue
+        if stale:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
+
+
+def compile_topology_code(code: str, filename: str, cache_dir: Optional[Path] = None) -> CodeType:
+    """Compile ``code`` and memoise the resulting code object on disk.
+
+    The cache entry is named after the SHA-256 of the source and the
+    interpreter cache tag; its header repeats the bytecode magic number and
+    the digest so that stale or truncated files are simply ignored.  Any I/O
+    error falls back to a plain ``compile``.
+    """
+
+    digest = hashlib.sha256(code.encode("utf-8")).digest()
+    header = importlib.util.MAGIC_NUMBER + digest
+    cache_path: Optional[Path] = None
+    if cache_dir is not None and _code_cache_enabled() and sys.implementation.cache_tag:
+        cache_path = cache_dir / f"{_cache_key(code)}.{sys.implementation.cache_tag}.topo"
+        try:
+            blob = cache_path.read_bytes()
+        except OSError:
+            blob = b""
+        if blob.startswith(header):
+            try:
+                cached = marshal.loads(blob[len(header):])
+            except (EOFError, ValueError, TypeError):
+                cached = None
+            if isinstance(cached, CodeType):
+                return cached
+
+    compiled = compile(code, filename, "exec")
+    if cache_path is not None:
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            _ensure_directory(cache_path.parent)
+            tmp_path.write_bytes(header + marshal.dumps(compiled))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    return compiled
+
+
 def _category_from_path(root: Path, path: Path) -> str:
     try:
         relative = path.relative_to(root)
@@ -49,6 +197,7 @@ class TopologyDefinition:
     path: Path
     geometry: Dict[str, Any]
     code: str
+    uses: str
     category: str
     description: str
     label: str
@@ -61,7 +210,7 @@ class TopologyDefinition:
         return {
             key: value
             for key, value in self.geometry.items()
-            if key not in {"code", "topology"}
+            if key not in _RESERVED_KEYS
         }
 
     @property
@@ -72,7 +221,7 @@ class TopologyDefinition:
             return self.parameter_names
         names: List[str] = []
         for key in self.geometry.keys():
-            if key in {"code", "topology"}:
+            if key in _RESERVED_KEYS:
                 continue
             if isinstance(key, str):
                 names.append(key)
@@ -95,21 +244,34 @@ class TopologyDefinition:
             payload["meta"] = meta
         return payload
 
-    def build_generator(self) -> Callable[[Mapping[str, Any], int], List[Tuple[float, float, float]]]:
-        """Compile the user provided code and expose it as a callable."""
-
-        namespace: Dict[str, Any] = {"__builtins__": __builtins__}
-        exec(self.code, namespace)
-        func_name = f"generate_{self.name}_geometry"
-        candidate = namespace.get(func_name)
-        if not callable(candidate):
-            # Fall back to the first callable defined in the namespace.
-            for value in namespace.values():
-                if callable(value):
-                    candidate = value
-                    break
-        if not callable(candidate):
-            raise ValueError(f"Impossible de construire la topologie {self.name}: fonction introuvable")
+    def build_generator(self, cache_dir: Optional[Path] = None) -> TopologyGenerator:
+        """Compile the user provided code and expose it as a callable.
+
+        ``cache_dir`` enables the on-disk code object cache (see
+        :func:`compile_topology_code`).  Definitions declaring
+        ``"uses": "builtin:<generator>"`` are bound directly to the shared
+        runtime and never compiled.
+        """
+
+        runtime = runtime_module()
+        builtin = _builtin_name(self.uses)
+        if builtin:
+            candidate = runtime.BUILTIN_GENERATORS.get(builtin)
+            if not callable(candidate):
+                raise ValueError(f"Impossible de construire la topologie {self.name}: générateur inconnu {builtin}")
+        else:
+            namespace: Dict[str, Any] = {"__builtins__": __builtins__}
+            exec(compile_topology_code(self.code, f"<topologie:{self.name}>", cache_dir), namespace)
+            func_name = f"generate_{self.name}_geometry"
+            candidate = namespace.get(func_name)
+            if not callable(candidate):
+                # Fall back to the first callable defined in the namespace.
+                for value in namespace.values():
+                    if callable(value):
+                        candidate = value
+                        break
+            if not callable(candidate):
+                raise ValueError(f"Impossible de construire la topologie {self.name}: fonction introuvable")
 
         def _generator(params: Mapping[str, Any], cap: int) -> List[Tuple[float, float, float]]:
             combined: Dict[str, Any] = dict(self.defaults)
@@ -163,8 +325,14 @@ class TopologyLibrary:
         self._definitions: Dict[str, TopologyDefinition] = {}
         self._categories: Dict[str, List[TopologyDefinition]] = {}
         self._category_order: List[str] = []
+        # Générateurs construits à la demande (None = échec de construction)
+        self._generators: Dict[str, Optional[TopologyGenerator]] = {}
         self.reload()
 
+    @property
+    def cache_dir(self) -> Path:
+        return self.directory / CODE_CACHE_DIRNAME
+
     # ------------------------------------------------------------------ loading
     def reload(self) -> None:
         """Reload every topology available in the directory."""
@@ -172,6 +340,7 @@ class TopologyLibrary:
         self._definitions.clear()
         self._categories.clear()
         self._category_order = []
+        self._generators.clear()
         for path in sorted(self.directory.glob('**/*.json')):
             if not path.is_file():
                 continue
@@ -185,6 +354,8 @@ class TopologyLibrary:
             self._categories[definition.category].append(definition)
         for definitions in self._categories.values():
             definitions.sort(key=lambda item: item.label.lower())
+        # Les entrées du cache dont plus aucune définition n'utilise le code sont supprimées
+        prune_code_cache(self.cache_dir, (item.code for item in self._definitions.values() if item.code))
 
     def _load_file(self, path: Path) -> Optional[TopologyDefinition]:
         try:
@@ -195,8 +366,19 @@ class TopologyLibrary:
         if not isinstance(geometry, dict):
             return None
         name = str(geometry.get("topology") or path.stem)
+        geometry_copy = dict(geometry)
         code = geometry.get("code")
-        if not isinstance(code, str) or not code.strip():
+        uses = geometry.get("uses")
+        if _builtin_name(uses):
+            code = ""
+            geometry_copy.pop("code", None)
+        elif isinstance(code, str) and code.strip():
+            uses = _compact_legacy_code(code)
+            if uses:
+                code = ""
+                geometry_copy.pop("code", None)
+                geometry_copy["uses"] = uses
+        else:
             return None
         meta = raw.get("meta") if isinstance(raw.get("meta"), dict) else {}
         raw_category = meta.get("category")
@@ -214,12 +396,12 @@ class TopologyLibrary:
             )
         description = str(meta.get("description") or raw.get("description") or "")
         label = str(meta.get("label") or name)
-        geometry_copy = dict(geometry)
         return TopologyDefinition(
             name=name,
             path=path,
             geometry=geometry_copy,
             code=code,
+            uses=uses if isinstance(uses, str) else "",
             category=category,
             description=description,
             label=label,
@@ -277,13 +459,33 @@ class TopologyLibrary:
         return dest_path
 
     # -------------------------------------------------------------- generators
-    def generators(self) -> Dict[str, Callable[[Mapping[str, Any], int], List[Tuple[float, float, float]]]]:
-        out: Dict[str, Callable[[Mapping[str, Any], int], List[Tuple[float, float, float]]]] = {}
-        for definition in self._definitions.values():
-            try:
-                out[definition.name] = definition.build_generator()
-            except Exception:
-                continue
+    def generator(self, name: str) -> Optional[TopologyGenerator]:
+        """Return the generator for ``name``, building it on first use.
+
+        ``None`` is returned (and remembered until the next :meth:`reload`)
+        when the topology is unknown or its code fails to build.
+        """
+
+        if name in self._generators:
+            return self._generators[name]
+        definition = self._definitions.get(name)
+        if definition is None:
+            return None
+        try:
+            built: Optional[TopologyGenerator] = definition.build_generator(self.cache_dir)
+        except Exception:
+            built = None
+        self._generators[name] = built
+        return built
+
+    def generators(self) -> Dict[str, TopologyGenerator]:
+        """Build every generator eagerly (prefer :meth:`generator`)."""
+
+        out: Dict[str, TopologyGenerator] = {}
+        for name in self._definitions:
+            built = self.generator(name)
+            if built is not None:
+                out[name] = built
         return out
 
 
@@ -297,4 +499,14 @@ def get_topology_library() -> TopologyLibrary:
     return _LIBRARY
 
 
-__all__ = ["TopologyDefinition", "TopologyLibrary", "get_topology_library"]
+__all__ = [
+    "BUILTIN_PREFIX",
+    "RUNTIME_MODULE_NAME",
+    "TopologyDefinition",
+    "TopologyGenerator",
+    "TopologyLibrary",
+    "compile_topology_code",
+    "prune_code_cache",
+    "get_topology_library",
+    "runtime_module",
+]
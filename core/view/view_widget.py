@@ -25,20 +25,41 @@ feature completeness and ease of maintenance.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import math
+import multiprocessing
 import os
 import random
 import sys
+import threading
 import time
-from collections import deque
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, deque
 from collections.abc import Sequence
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Callable, Deque, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 from ..donut_hub import DEFAULT_DONUT_BUTTON_COUNT, default_donut_config, sanitize_donut_state
+from ..geometry_worker import center_and_thin, generate_topology
+from ..grid_thinning import thin_mask
 from ..orbital_utils import solve_tangent_radii
+from ..topology_runtime import (
+    ImplicitSamplingStats,
+    implicit_sampling_stats,
+    implicit_sampling_stats_since,
+    record_implicit_sampling_stats,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    np = None  # type: ignore[assignment]
 
 try:
     from ..topology_registry import get_topology_library
@@ -67,19 +88,766 @@ class Point3D:
         return Point3D(self.x, self.y, self.z, self.seed)
 
 
-@dataclass
-class RenderItem:
-    """Structure describing a point projected on screen."""
+class GeometryCache:
+    """LRU of centred base point sets keyed by a digest of the geometry parameters.
+
+    Each entry holds the ``Point3D`` list and its optional numpy copy.  Once
+    the estimated footprint exceeds ``budget_bytes`` the least recently used
+    entries are dropped; the most recent one is always kept.  A budget of
+    ``0`` disables the cache.
+    """
+
+    __slots__ = ("budget_bytes", "_entries", "_bytes")
+
+    # Point3D (~200 octets) + une ligne du tableau numpy
+    POINT_BYTES = 224
+
+    def __init__(self, budget_bytes: int = 64 << 20) -> None:
+        self.budget_bytes = int(budget_bytes)
+        self._entries: "OrderedDict[str, Tuple[List[Point3D], object, int]]" = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[Tuple[List[Point3D], object]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0], entry[1]
+
+    def put(self, key: str, points: List[Point3D], base_array: object) -> None:
+        if self.budget_bytes <= 0:
+            self.clear()
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[2]
+        nbytes = len(points) * self.POINT_BYTES
+        self._entries[key] = (points, base_array, nbytes)
+        self._bytes += nbytes
+        self._evict()
+
+    def set_budget(self, budget_bytes: int) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        if self.budget_bytes <= 0:
+            self.clear()
+        else:
+            self._evict()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _evict(self) -> None:
+        while self._bytes > self.budget_bytes and len(self._entries) > 1:
+            _, (_, _, nbytes) = self._entries.popitem(last=False)
+            self._bytes -= nbytes
+
+
+@dataclass(frozen=True)
+class _PendingGeometry:
+    """Geometry job running on the worker pool.
+
+    ``key`` is the geometry cache key the job was submitted for; it doubles
+    as the generation token: a result whose key no longer matches the
+    engine's current key is discarded.
+    """
+
+    key: str
+    topology: str
+    geo: Dict[str, object]
+    cap: int
+    dmin: float
+    future: Future
+    retried: bool = False
+
 
-    sx: float
-    sy: float
-    r: float
-    color: QtGui.QColor
-    alpha: float
-    depth: float
-    world: Point3D
-    gravity_weight: float = 0.0
-    role: str = "cloud"
+def _cache_value(value: object) -> object:
+    """Normalise a parameter value for hashing (``500`` and ``500.0`` are equal)."""
+
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, Mapping):
+        return {str(k): _cache_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_cache_value(v) for v in value]
+    return repr(value)
+
+
+# Modes de fusion commutatifs : l'ordre de dessin y importe peu, un tri de
+# profondeur approximatif par tranches suffit (system.depthSortBins, 0 = exact).
+_ORDER_INDEPENDENT_BLEND_MODES = ("screen", "lighten", "lighter", "multiply", "add", "additive", "plus")
+
+# Modes de densité qui filtrent les points (distribution.densityMode).
+_DENSITY_MODES = ("centered", "edges", "noise_field")
+
+ROLE_CLOUD = 0
+ROLE_ORBIT = 1
+
+
+class FrameBuffer:
+    """Struct-of-arrays storage for the points projected by :meth:`DyxtenEngine.step`.
+
+    The engine owns a single instance which is refilled every frame; the
+    columns only grow (never shrink) so a steady point count allocates
+    nothing.  Only the first ``count`` entries are meaningful and ``order``
+    holds the drawing order (back to front when depth sorting is enabled).
+    Colours are packed ``QRgb`` values (``#AARRGGBB``) with an opaque alpha;
+    the per-point opacity lives in ``alpha``.
+    """
+
+    __slots__ = (
+        "count",
+        "capacity",
+        "sx",
+        "sy",
+        "r",
+        "depth",
+        "alpha",
+        "rgba",
+        "role",
+        "seed",
+        "wx",
+        "wy",
+        "wz",
+        "gravity",
+        "order",
+        "_order_keys",
+    )
+
+    _FLOAT_COLUMNS = ("sx", "sy", "r", "depth", "alpha", "wx", "wy", "wz", "gravity")
+
+    def __init__(self, capacity: int = 0) -> None:
+        self.count = 0
+        self.capacity = 0
+        for name in self._FLOAT_COLUMNS:
+            setattr(self, name, array("d"))
+        self.rgba = array("I")
+        self.role = array("b")
+        self.seed = array("i")
+        self.order = array("i")
+        # Clés (seed * 2 + role) dans l'ordre de tri de la frame précédente.
+        self._order_keys = None
+        self.reserve(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def reserve(self, capacity: int) -> None:
+        """Ensure room for ``capacity`` points, growing geometrically."""
+
+        if capacity <= self.capacity:
+            return
+        new_capacity = max(int(capacity), self.capacity + self.capacity // 2, 64)
+        extra = new_capacity - self.capacity
+        for name in self._FLOAT_COLUMNS + ("rgba", "role", "seed", "order"):
+            column = getattr(self, name)
+            column.frombytes(bytes(extra * column.itemsize))
+        self.capacity = new_capacity
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def set_identity_order(self) -> None:
+        order = self.order
+        for i in range(self.count):
+            order[i] = i
+
+    def sort_by_depth(self, bins: int = 0) -> None:
+        """Order points back to front (stable, like ``list.sort(reverse=True)``).
+
+        With numpy the previous frame's order, matched by ``(seed, role)``,
+        seeds the sort: under a smooth camera it is nearly sorted already and
+        the adaptive stable sort repairs it in close to linear time.  When
+        ``bins`` is positive the order is only approximate: points are
+        bucketed into ``bins`` depth slices with a linear counting sort, for
+        blend modes where drawing order does not matter.
+        """
+
+        count = self.count
+        if count == 0:
+            self._order_keys = None
+            return
+        if bins > 0:
+            self._sort_by_depth_bins(count, bins)
+            return
+        if np is None:
+            self.order[:count] = array("i", sorted(range(count), key=self.depth.__getitem__, reverse=True))
+            return
+        depth = np.frombuffer(self.depth, dtype=np.float64)[:count]
+        keys = np.frombuffer(self.seed, dtype=np.int32)[:count].astype(np.int64) * 2
+        keys += np.frombuffer(self.role, dtype=np.int8)[:count]
+        seq = np.arange(count, dtype=np.intp)
+        prev = self._order_keys
+        if prev is not None and len(prev):
+            lookup = np.full(int(max(keys.max(), prev.max())) + 1, -1, dtype=np.intp)
+            lookup[keys] = seq
+            mapped = lookup[prev]
+            mapped = mapped[mapped >= 0]
+            fresh = np.ones(count, dtype=bool)
+            fresh[mapped] = False
+            seq = np.concatenate((mapped, np.flatnonzero(fresh)))
+        order = seq[np.argsort(-depth[seq], kind="stable")]
+        if prev is not None:
+            # Les égalités de profondeur doivent rester dans l'ordre des index,
+            # comme le tri de référence ; sinon on retrie depuis zéro (rare).
+            ranked = depth[order]
+            if np.any((ranked[1:] == ranked[:-1]) & (order[1:] < order[:-1])):
+                order = np.argsort(-depth, kind="stable")
+        self._order_keys = keys[order]
+        np.frombuffer(self.order, dtype=np.int32)[:count] = order
+
+    def _sort_by_depth_bins(self, count: int, bins: int) -> None:
+        depth = self.depth
+        near = min(depth[:count])
+        far = max(depth[:count])
+        scale = (bins - 1) / (far - near) if far > near else 0.0
+        if np is not None:
+            values = np.frombuffer(depth, dtype=np.float64)[:count]
+            slices = ((far - values) * scale).astype(np.int16 if bins <= 32767 else np.int32)
+            np.frombuffer(self.order, dtype=np.int32)[:count] = np.argsort(slices, kind="stable")
+        else:
+            buckets: List[List[int]] = [[] for _ in range(bins)]
+            for i in range(count):
+                buckets[int((far - depth[i]) * scale)].append(i)
+            pos = 0
+            order = self.order
+            for bucket in buckets:
+                for i in bucket:
+                    order[pos] = i
+                    pos += 1
+        self._order_keys = None
+
+
+STAGE_MODIFIERS = 0
+STAGE_PROJECTION = 1
+STAGE_GRAVITY = 2
+STAGE_COLOUR = 3
+STAGE_IMPRINTS = 4
+STAGE_ORBITERS = 5
+STAGE_SORT = 6
+STAGE_PAINT = 7
+STAGE_OVERLAY = 8
+PROFILE_STAGES = (
+    "modifiers",
+    "projection",
+    "gravity",
+    "colour",
+    "imprints",
+    "orbiters",
+    "sort",
+    "paint",
+    "overlay",
+)
+
+
+class FrameProfiler:
+    """Per-stage wall times of the last ``capacity`` frames.
+
+    A frame opens with :meth:`begin_frame`; each :meth:`mark` charges the time
+    elapsed since the previous mark to one ``STAGE_*`` and :meth:`end_frame`
+    commits the row to a ring buffer.  Outside an open frame :meth:`mark`
+    returns at once, so a disabled profiler costs one test per call site.
+    Times are stored in milliseconds, each row stamped with the frame end
+    (milliseconds since the profiler was created).
+    """
+
+    __slots__ = ("capacity", "frames", "_times", "_stamps", "_head", "_row", "_last", "_open", "_origin")
+
+    def __init__(self, capacity: int = 600) -> None:
+        self.capacity = max(1, int(capacity))
+        self.frames = 0
+        self._times = array("d", bytes(8 * self.capacity * len(PROFILE_STAGES)))
+        self._stamps = array("d", bytes(8 * self.capacity))
+        self._head = 0
+        self._row = [0.0] * len(PROFILE_STAGES)
+        self._last = 0.0
+        self._open = False
+        self._origin = time.perf_counter()
+
+    def __len__(self) -> int:
+        return min(self.frames, self.capacity)
+
+    def begin_frame(self) -> None:
+        row = self._row
+        for stage in range(len(row)):
+            row[stage] = 0.0
+        self._open = True
+        self._last = time.perf_counter()
+
+    def mark(self, stage: int) -> None:
+        if not self._open:
+            return
+        now = time.perf_counter()
+        self._row[stage] += now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        if not self._open:
+            return
+        self._open = False
+        stages = len(PROFILE_STAGES)
+        base = self._head * stages
+        self._times[base : base + stages] = array("d", (value * 1000.0 for value in self._row))
+        self._stamps[self._head] = (self._last - self._origin) * 1000.0
+        self._head = (self._head + 1) % self.capacity
+        self.frames += 1
+
+    def clear(self) -> None:
+        self.frames = 0
+        self._head = 0
+        self._open = False
+
+    def rows(self, last: Optional[int] = None) -> List[Tuple[float, Tuple[float, ...]]]:
+        """``(stamp_ms, stage_ms)`` rows, oldest first."""
+
+        count = len(self)
+        if last is not None:
+            count = min(count, max(0, int(last)))
+        stages = len(PROFILE_STAGES)
+        out: List[Tuple[float, Tuple[float, ...]]] = []
+        for k in range(count):
+            slot = (self._head - count + k) % self.capacity
+            base = slot * stages
+            out.append((self._stamps[slot], tuple(self._times[base : base + stages])))
+        return out
+
+    def averages(self, last: int = 60) -> Dict[str, float]:
+        """Mean milliseconds per stage (and ``total``) over the last frames."""
+
+        rows = self.rows(last)
+        result = {name: 0.0 for name in PROFILE_STAGES}
+        result["total"] = 0.0
+        if not rows:
+            return result
+        for _stamp, times in rows:
+            for name, value in zip(PROFILE_STAGES, times):
+                result[name] += value
+            result["total"] += sum(times)
+        return {name: value / len(rows) for name, value in result.items()}
+
+    def dump(self, path: str) -> None:
+        """Write the recorded frames as JSON (``.json``) or CSV (otherwise)."""
+
+        rows = self.rows()
+        with open(path, "w", encoding="utf-8", newline="") as handle:
+            if path.lower().endswith(".json"):
+                json.dump(
+                    {
+                        "stages": list(PROFILE_STAGES),
+                        "frames": [
+                            {"t_ms": stamp, **dict(zip(PROFILE_STAGES, times))} for stamp, times in rows
+                        ],
+                    },
+                    handle,
+                    indent=1,
+                )
+                return
+            handle.write(",".join(("t_ms",) + PROFILE_STAGES + ("total",)) + "\n")
+            for stamp, times in rows:
+                handle.write(",".join(f"{value:.4f}" for value in (stamp,) + times + (sum(times),)) + "\n")
+
+
+class QualityGovernor:
+    """Frame-time driven level of detail (``system.targetFrameMs``).
+
+    The view reports the duration of every frame; while the running average
+    exceeds the target by 10 % the detail ``level`` (out of ``LEVELS``)
+    drops by 15 %, and it climbs back by steps of about 6 % once the average
+    is under 75 % of the target.  After a change the governor waits
+    ``COOLDOWN`` frames so the average reflects the new level.  ``fraction``
+    is the share of base points projected; below ``ANTIALIAS_LEVEL`` the
+    view stops antialiasing and below ``SQUARE_LEVEL`` it draws squares.  A
+    target of 0 keeps full detail.
+    """
+
+    __slots__ = ("level", "average_ms", "_cooldown")
+
+    LEVELS = 64
+    MIN_LEVEL = 6
+    ANTIALIAS_LEVEL = 48
+    SQUARE_LEVEL = 24
+    COOLDOWN = 10
+
+    def __init__(self) -> None:
+        self.level = self.LEVELS
+        self.average_ms = 0.0
+        self._cooldown = 0
+
+    @property
+    def fraction(self) -> float:
+        return self.level / self.LEVELS
+
+    @property
+    def antialias(self) -> bool:
+        return self.level >= self.ANTIALIAS_LEVEL
+
+    @property
+    def square_shapes(self) -> bool:
+        return self.level < self.SQUARE_LEVEL
+
+    def budget(self, count: int) -> int:
+        """Number of the ``count`` base points to project at the current level."""
+
+        if self.level >= self.LEVELS:
+            return count
+        return min(count, max(1, (count * self.level) // self.LEVELS))
+
+    def update(self, frame_ms: float, target_ms: float) -> None:
+        if target_ms <= 0.0:
+            self.level = self.LEVELS
+            self.average_ms = frame_ms
+            self._cooldown = 0
+            return
+        self.average_ms += (frame_ms - self.average_ms) * 0.2
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return
+        level = self.level
+        if self.average_ms > target_ms * 1.1:
+            level = max(self.MIN_LEVEL, (level * 85) // 100)
+        elif self.average_ms < target_ms * 0.75:
+            level = min(self.LEVELS, level + max(1, level // 16))
+        if level != self.level:
+            self.level = level
+            self._cooldown = self.COOLDOWN
+
+
+PHASE_OUT = 0
+PHASE_ORBIT = 1
+PHASE_BACK = 2
+PHASE_DONE = 3
+
+
+class OrbiterPool:
+    """Fixed-capacity slot storage for the orbiters spawned by imprints.
+
+    Every orbiter lives in a slot of parallel columns; released slots go back
+    to a free list and are reused by the next :meth:`spawn`, so a steady
+    orbiter population allocates nothing.  ``active`` lists the live slots in
+    spawn order (which is also the drawing order).  Configuration shared by
+    all orbiters (durations, trajectory modes, …) is not stored here: the
+    engine resolves it once per frame.  ``sx``/``sy`` hold the screen position
+    computed at the last simulation step (NaN until the first one),
+    ``prev_sx``/``prev_sy`` the one before it for interpolated rendering, and
+    ``path`` the ``initial_path`` polyline of the current transition, keyed
+    by ``(phase, smoothing)``.
+    """
+
+    __slots__ = (
+        "capacity",
+        "active",
+        "_free",
+        "phase",
+        "t",
+        "imprint_x",
+        "imprint_y",
+        "imprint_time",
+        "imprint_radius",
+        "imprint_id",
+        "imprint_cleared",
+        "center_x",
+        "center_y",
+        "orbit_radius",
+        "angle",
+        "base_speed",
+        "angle_accum",
+        "orbit_elapsed_ms",
+        "pos_x",
+        "pos_y",
+        "source_r",
+        "button_index",
+        "sx",
+        "sy",
+        "prev_sx",
+        "prev_sy",
+        "color",
+        "button_color",
+        "trail",
+        "path",
+    )
+
+    _FLOAT_COLUMNS = (
+        "t",
+        "imprint_x",
+        "imprint_y",
+        "imprint_time",
+        "imprint_radius",
+        "center_x",
+        "center_y",
+        "orbit_radius",
+        "angle",
+        "base_speed",
+        "angle_accum",
+        "orbit_elapsed_ms",
+        "pos_x",
+        "pos_y",
+        "source_r",
+        "sx",
+        "sy",
+        "prev_sx",
+        "prev_sy",
+    )
+    _OBJECT_COLUMNS = ("color", "button_color", "trail", "path")
+
+    def __init__(self, capacity: int = 0) -> None:
+        self.capacity = 0
+        self.active: List[int] = []
+        self._free: List[int] = []
+        for name in self._FLOAT_COLUMNS:
+            setattr(self, name, array("d"))
+        self.phase = array("b")
+        self.imprint_id = array("q")
+        self.imprint_cleared = array("b")
+        self.button_index = array("i")
+        for name in self._OBJECT_COLUMNS:
+            setattr(self, name, [])
+        self.reserve(capacity)
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def reserve(self, capacity: int) -> None:
+        """Grow the pool to ``capacity`` slots (the pool never shrinks)."""
+
+        capacity = int(capacity)
+        if capacity <= self.capacity:
+            return
+        extra = capacity - self.capacity
+        for name in self._FLOAT_COLUMNS + ("phase", "imprint_id", "imprint_cleared", "button_index"):
+            column = getattr(self, name)
+            column.frombytes(bytes(extra * column.itemsize))
+        for name in self._OBJECT_COLUMNS:
+            getattr(self, name).extend([None] * extra)
+        # Les nouveaux slots sont pris du plus petit au plus grand.
+        self._free[:0] = range(capacity - 1, self.capacity - 1, -1)
+        self.capacity = capacity
+
+    def clear(self) -> None:
+        self.active.clear()
+        self._free = list(range(self.capacity - 1, -1, -1))
+        for name in self._OBJECT_COLUMNS:
+            column = getattr(self, name)
+            for i in range(self.capacity):
+                column[i] = None
+
+    def spawn(
+        self,
+        *,
+        imprint: Tuple[float, float],
+        imprint_time: float,
+        imprint_radius: float,
+        imprint_id: int,
+        center: Tuple[float, float],
+        orbit_radius: float,
+        angle: float,
+        base_speed: float,
+        source_r: float,
+        button_index: int,
+        color: QtGui.QColor,
+        button_color: Optional[QtGui.QColor],
+        trail: List[Tuple[float, float]],
+    ) -> Optional[int]:
+        """Fill a free slot and return it, or ``None`` when the pool is full."""
+
+        if not self._free:
+            return None
+        slot = self._free.pop()
+        self.phase[slot] = PHASE_OUT
+        self.t[slot] = 0.0
+        self.imprint_x[slot], self.imprint_y[slot] = imprint
+        self.imprint_time[slot] = imprint_time
+        self.imprint_radius[slot] = imprint_radius
+        self.imprint_id[slot] = imprint_id
+        self.imprint_cleared[slot] = 0
+        self.center_x[slot], self.center_y[slot] = center
+        self.orbit_radius[slot] = orbit_radius
+        self.angle[slot] = angle
+        self.base_speed[slot] = base_speed if math.isfinite(base_speed) else 0.0
+        self.angle_accum[slot] = 0.0
+        self.orbit_elapsed_ms[slot] = 0.0
+        self.pos_x[slot] = center[0] + math.cos(angle) * orbit_radius
+        self.pos_y[slot] = center[1] + math.sin(angle) * orbit_radius
+        self.source_r[slot] = source_r
+        nan = float("nan")
+        self.sx[slot] = self.sy[slot] = nan
+        self.prev_sx[slot] = self.prev_sy[slot] = nan
+        self.button_index[slot] = button_index
+        self.color[slot] = color
+        self.button_color[slot] = button_color
+        self.trail[slot] = _dedupe_trail(trail)
+        self.path[slot] = None
+        self.active.append(slot)
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Mark ``slot`` as done; it is recycled by the next :meth:`sweep`."""
+
+        self.phase[slot] = PHASE_DONE
+
+    def sweep(self) -> None:
+        """Drop released slots from ``active`` and return them to the free list."""
+
+        phase = self.phase
+        survivors: List[int] = []
+        for slot in self.active:
+            if phase[slot] == PHASE_DONE:
+                self.color[slot] = None
+                self.button_color[slot] = None
+                self.trail[slot] = None
+                self.path[slot] = None
+                self._free.append(slot)
+            else:
+                survivors.append(slot)
+        self.active = survivors
+
+
+class ImprintStore:
+    """Ring buffer of the imprints left on the red circle, indexed by id.
+
+    Imprints are written to consecutive slots of parallel columns; once the
+    ring wraps, the slot written ``capacity`` insertions ago is recycled
+    whether or not it was removed meanwhile.  ``_index`` maps an imprint id
+    to its slot so :meth:`remove` is O(1).  Ids grow monotonically, which
+    lets renderers draw only the imprints added since their last pass;
+    ``revision`` changes whenever an imprint disappears (removal, eviction,
+    clear) and means the whole layer must be redrawn.
+    """
+
+    __slots__ = ("capacity", "revision", "next_id", "_head", "_index", "x", "y", "radius", "time", "rgba", "ids")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(1, int(capacity))
+        self.revision = 0
+        self.next_id = 0
+        self._head = 0
+        self._index: Dict[int, int] = {}
+        size = self.capacity
+        self.x = array("d", bytes(size * 8))
+        self.y = array("d", bytes(size * 8))
+        self.radius = array("d", bytes(size * 8))
+        self.time = array("d", bytes(size * 8))
+        self.rgba = array("I", bytes(size * 4))
+        self.ids = array("q", [-1]) * size
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __bool__(self) -> bool:
+        return bool(self._index)
+
+    def __iter__(self):
+        """Yield ``(x, y, rgba, radius, timestamp_ms, id)`` from oldest to newest."""
+
+        for slot in self._index.values():
+            yield self.x[slot], self.y[slot], self.rgba[slot], self.radius[slot], self.time[slot], self.ids[slot]
+
+    def __contains__(self, imprint_id: object) -> bool:
+        return imprint_id in self._index
+
+    def add(self, x: float, y: float, rgba: int, radius: float, timestamp_ms: float) -> int:
+        """Store an imprint and return its id, evicting the oldest slot if needed."""
+
+        slot = self._head
+        self._head = (slot + 1) % self.capacity
+        evicted = self.ids[slot]
+        if evicted >= 0 and self._index.get(evicted) == slot:
+            del self._index[evicted]
+            self.revision += 1
+        imprint_id = self.next_id
+        self.next_id += 1
+        self.x[slot] = x
+        self.y[slot] = y
+        self.rgba[slot] = rgba
+        self.radius[slot] = radius
+        self.time[slot] = timestamp_ms
+        self.ids[slot] = imprint_id
+        self._index[imprint_id] = slot
+        return imprint_id
+
+    def remove(self, imprint_id: int) -> None:
+        slot = self._index.pop(imprint_id, None)
+        if slot is None:
+            return
+        self.ids[slot] = -1
+        self.revision += 1
+
+    def clear(self) -> None:
+        self.revision += 1
+        self._index.clear()
+        self._head = 0
+        self.next_id = 0
+        for slot in range(self.capacity):
+            self.ids[slot] = -1
+
+    def copy(self) -> "ImprintStore":
+        """Independent copy (columns, index, ids and revision)."""
+
+        other = ImprintStore.__new__(ImprintStore)
+        other.capacity = self.capacity
+        other.revision = self.revision
+        other.next_id = self.next_id
+        other._head = self._head
+        other._index = dict(self._index)
+        other.x = array("d", self.x)
+        other.y = array("d", self.y)
+        other.radius = array("d", self.radius)
+        other.time = array("d", self.time)
+        other.rgba = array("I", self.rgba)
+        other.ids = array("q", self.ids)
+        return other
+
+    def since(self, first_id: int):
+        """Yield the live imprints whose id is ``>= first_id`` (oldest first)."""
+
+        index = self._index
+        for imprint_id in range(max(0, first_id), self.next_id):
+            slot = index.get(imprint_id)
+            if slot is not None:
+                yield self.x[slot], self.y[slot], self.rgba[slot], self.radius[slot]
+
+
+@dataclass(frozen=True)
+class _ProjectionFrame:
+    """Per-frame constants shared by the scalar and array projection passes."""
+
+    now: float
+    cos_theta: float
+    sin_theta: float
+    cos_height: float
+    sin_height: float
+    cos_tilt: float
+    sin_tilt: float
+    cam_radius: float
+    focal: float
+    cx: float
+    cy: float
+    pulse_amp: float
+    pulse_w: float
+    pulse_phi: float
+    rot_phase_amp: float
+    rot_x: float
+    rot_y: float
+    rot_z: float
+
+
+ProjectedPoints = Tuple[
+    Sequence[int],
+    Sequence[float],
+    Sequence[float],
+    Sequence[float],
+    Sequence[float],
+    Sequence[float],
+    Sequence[float],
+]
 
 
 def clamp01(value: float) -> float:
@@ -128,21 +896,29 @@ def _map_blend_mode(name: str | None) -> QtGui.QPainter.CompositionMode:
 # OpenGL helpers
 
 
-def _create_opengl_functions() -> Tuple[Optional[object], Optional[BaseException]]:
+def _create_opengl_functions(
+    context: Optional[QtGui.QOpenGLContext] = None,
+) -> Tuple[Optional[object], Optional[BaseException]]:
     """Safely instantiate ``QOpenGLFunctions`` when available.
 
     Returns a tuple ``(functions, error)`` where ``functions`` is the
     initialised OpenGL function table or ``None`` when the binding is not
     present.  ``error`` contains the exception encountered while creating or
     initialising the functions so that callers can surface a meaningful
-    diagnostic message.
+    diagnostic message.  PyQt5 does not always expose ``QOpenGLFunctions``;
+    ``context.versionFunctions()`` is used instead when a context is given.
     """
 
     factory = getattr(QtGui, "QOpenGLFunctions", None)
-    if factory is None:
-        return None, AttributeError("PyQt5.QtGui has no attribute 'QOpenGLFunctions'")
     try:
-        functions = factory()
+        if factory is not None:
+            functions = factory()
+        elif context is not None:
+            functions = context.versionFunctions()
+            if functions is None:
+                return None, RuntimeError("QOpenGLContext.versionFunctions() returned None")
+        else:
+            return None, AttributeError("PyQt5.QtGui has no attribute 'QOpenGLFunctions'")
     except Exception as exc:  # pragma: no cover - depends on bindings
         return None, exc
     try:
@@ -152,6 +928,281 @@ def _create_opengl_functions() -> Tuple[Optional[object], Optional[BaseException
     return functions, None
 
 
+_GL_POINTS = 0x0000
+_GL_FLOAT = 0x1406
+_GL_BLEND = 0x0BE2
+_GL_DEPTH_TEST = 0x0B71
+_GL_PROGRAM_POINT_SIZE = 0x8642
+_GL_POINT_SPRITE = 0x8861
+_GL_POINT_SIZE_RANGE = 0x0B12
+_GL_ALIASED_POINT_SIZE_RANGE = 0x846E
+_GL_FUNC_ADD = 0x8006
+_GL_MAX = 0x8008
+_GL_ZERO = 0
+_GL_ONE = 1
+_GL_ONE_MINUS_SRC_COLOR = 0x0301
+_GL_ONE_MINUS_SRC_ALPHA = 0x0303
+_GL_DST_COLOR = 0x0306
+
+# (equation, source factor, destination factor) on premultiplied colours,
+# mirroring the QPainter composition modes returned by ``_map_blend_mode``.
+_GL_BLEND_SOURCE_OVER = (_GL_FUNC_ADD, _GL_ONE, _GL_ONE_MINUS_SRC_ALPHA)
+_GL_BLEND_MODES = {
+    "source": (_GL_FUNC_ADD, _GL_ONE, _GL_ZERO),
+    "screen": (_GL_FUNC_ADD, _GL_ONE, _GL_ONE_MINUS_SRC_COLOR),
+    "lighten": (_GL_MAX, _GL_ONE, _GL_ONE),
+    "lighter": (_GL_FUNC_ADD, _GL_ONE, _GL_ONE),
+    "multiply": (_GL_FUNC_ADD, _GL_DST_COLOR, _GL_ONE_MINUS_SRC_ALPHA),
+    "add": (_GL_FUNC_ADD, _GL_ONE, _GL_ONE),
+    "additive": (_GL_FUNC_ADD, _GL_ONE, _GL_ONE),
+    "plus": (_GL_FUNC_ADD, _GL_ONE, _GL_ONE),
+}
+
+# Interleaved vertex layout: x, y, radius (logical px) then r, g, b, a in [0, 1].
+_GL_POINT_FLOATS = 7
+
+_POINT_VERTEX_SHADER = """
+attribute vec2 a_pos;
+attribute float a_radius;
+attribute vec4 a_color;
+uniform vec2 u_viewport;
+uniform float u_dpr;
+varying vec4 v_color;
+varying vec2 v_center;
+varying float v_radius;
+varying float v_size;
+
+void main() {
+    gl_Position = vec4(a_pos.x / u_viewport.x * 2.0 - 1.0, 1.0 - a_pos.y / u_viewport.y * 2.0, 0.0, 1.0);
+    // one extra pixel on each side for the antialiased edge
+    v_size = (2.0 * a_radius + 2.0) * u_dpr;
+    gl_PointSize = v_size;
+    v_color = a_color;
+    v_center = a_pos;
+    v_radius = a_radius;
+}
+"""
+
+_POINT_FRAGMENT_SHADER = """
+uniform float u_dpr;
+uniform float u_square;
+uniform vec3 u_clip;
+varying vec4 v_color;
+varying vec2 v_center;
+varying float v_radius;
+varying float v_size;
+
+void main() {
+    vec2 local = (gl_PointCoord - vec2(0.5)) * (v_size / u_dpr);
+    float coverage;
+    if (u_square > 0.5) {
+        vec2 d = abs(local) - vec2(v_radius);
+        coverage = clamp(0.5 - max(d.x, d.y), 0.0, 1.0);
+    } else {
+        coverage = clamp(v_radius + 0.5 - length(local), 0.0, 1.0);
+    }
+    if (u_clip.z > 0.0) {
+        coverage *= clamp(u_clip.z + 0.5 - length(v_center + local - u_clip.xy), 0.0, 1.0);
+    }
+    float alpha = v_color.a * coverage;
+    if (alpha <= 0.0) {
+        discard;
+    }
+    gl_FragColor = vec4(v_color.rgb * alpha, alpha);
+}
+"""
+
+
+def _pack_frame_gl(buf: "FrameBuffer") -> Tuple[object, float]:
+    """Interleave ``buf`` in drawing order for :class:`_GLPointRenderer`.
+
+    Returns the float32 vertex data and the largest radius of the batch.
+    """
+
+    count = buf.count
+    if np is not None:
+        order = np.frombuffer(buf.order, dtype=np.int32, count=count)
+        data = np.empty((count, _GL_POINT_FLOATS), dtype=np.float32)
+        data[:, 0] = np.frombuffer(buf.sx, dtype=np.float64, count=count)[order]
+        data[:, 1] = np.frombuffer(buf.sy, dtype=np.float64, count=count)[order]
+        data[:, 2] = np.frombuffer(buf.r, dtype=np.float64, count=count)[order]
+        rgba = np.frombuffer(buf.rgba, dtype=np.uint32, count=count)[order]
+        data[:, 3] = (rgba >> 16) & 0xFF
+        data[:, 4] = (rgba >> 8) & 0xFF
+        data[:, 5] = rgba & 0xFF
+        data[:, 3:6] *= 1.0 / 255.0
+        data[:, 6] = np.clip(np.frombuffer(buf.alpha, dtype=np.float64, count=count)[order], 0.0, 1.0)
+        max_radius = float(data[:, 2].max()) if count else 0.0
+        return data, max_radius
+
+    data = array("f", bytes(count * _GL_POINT_FLOATS * 4))
+    max_radius = 0.0
+    xs, ys, rs, rgba, alphas = buf.sx, buf.sy, buf.r, buf.rgba, buf.alpha
+    offset = 0
+    for i in buf.order[:count]:
+        r = rs[i]
+        packed = rgba[i]
+        data[offset] = xs[i]
+        data[offset + 1] = ys[i]
+        data[offset + 2] = r
+        data[offset + 3] = ((packed >> 16) & 0xFF) / 255.0
+        data[offset + 4] = ((packed >> 8) & 0xFF) / 255.0
+        data[offset + 5] = (packed & 0xFF) / 255.0
+        data[offset + 6] = clamp01(alphas[i])
+        offset += _GL_POINT_FLOATS
+        if r > max_radius:
+            max_radius = r
+    return data, max_radius
+
+
+def _pack_discs_gl(entries: Sequence[Tuple[float, float, float, int, float]]) -> Tuple[object, float]:
+    """Pack ``(x, y, radius, QRgb, alpha)`` tuples for :class:`_GLPointRenderer`."""
+
+    data = array("f", bytes(len(entries) * _GL_POINT_FLOATS * 4))
+    max_radius = 0.0
+    offset = 0
+    for x, y, r, packed, alpha in entries:
+        data[offset] = x
+        data[offset + 1] = y
+        data[offset + 2] = r
+        data[offset + 3] = ((packed >> 16) & 0xFF) / 255.0
+        data[offset + 4] = ((packed >> 8) & 0xFF) / 255.0
+        data[offset + 5] = (packed & 0xFF) / 255.0
+        data[offset + 6] = clamp01(alpha)
+        offset += _GL_POINT_FLOATS
+        if r > max_radius:
+            max_radius = r
+    return data, max_radius
+
+
+class _GLPointRenderer:
+    """Draw batches of antialiased discs or squares as GL point sprites.
+
+    The renderer owns a shader program and a streaming vertex buffer; each call
+    to :meth:`draw` uploads one interleaved batch and issues a single
+    ``glDrawArrays(GL_POINTS)``.  It must be used between
+    ``QPainter.beginNativePainting`` / ``endNativePainting`` with the widget
+    context current.
+    """
+
+    def __init__(self) -> None:
+        self._program: Optional[QtGui.QOpenGLShaderProgram] = None
+        self._vbo: Optional[QtGui.QOpenGLBuffer] = None
+        self._vao: Optional[QtGui.QOpenGLVertexArrayObject] = None
+        self._is_gles = False
+        self._max_point_size = 64.0
+
+    def initialize(self, context: QtGui.QOpenGLContext, functions: object) -> Optional[str]:
+        """Compile the shaders; return an error message when unsupported."""
+
+        self._is_gles = bool(context.isOpenGLES())
+        header = "#version 100\nprecision mediump float;\n" if self._is_gles else "#version 120\n"
+        program = QtGui.QOpenGLShaderProgram()
+        if not program.addShaderFromSourceCode(QtGui.QOpenGLShader.Vertex, header + _POINT_VERTEX_SHADER):
+            return program.log() or "vertex shader compilation failed"
+        if not program.addShaderFromSourceCode(QtGui.QOpenGLShader.Fragment, header + _POINT_FRAGMENT_SHADER):
+            return program.log() or "fragment shader compilation failed"
+        if not program.link():
+            return program.log() or "shader link failed"
+        vbo = QtGui.QOpenGLBuffer(QtGui.QOpenGLBuffer.VertexBuffer)
+        if not vbo.create():
+            return "unable to create vertex buffer"
+        vbo.setUsagePattern(QtGui.QOpenGLBuffer.StreamDraw)
+        vao = QtGui.QOpenGLVertexArrayObject()
+        self._vao = vao if vao.create() else None
+        self._program = program
+        self._vbo = vbo
+        for pname in (_GL_ALIASED_POINT_SIZE_RANGE, _GL_POINT_SIZE_RANGE):
+            try:
+                size_range = functions.glGetFloatv(pname)
+            except Exception:
+                continue
+            if isinstance(size_range, (tuple, list)):
+                size_range = size_range[-1]
+            try:
+                value = float(size_range)
+            except (TypeError, ValueError):
+                continue
+            if value > 1.0:
+                self._max_point_size = value
+                break
+        return None
+
+    def release(self) -> None:
+        if self._vbo is not None:
+            self._vbo.destroy()
+        if self._vao is not None:
+            self._vao.destroy()
+        self._program = None
+        self._vbo = None
+        self._vao = None
+
+    def draw(
+        self,
+        functions: object,
+        data: object,
+        count: int,
+        max_radius: float,
+        *,
+        viewport: Tuple[float, float],
+        dpr: float,
+        square: bool,
+        clip: Optional[Tuple[float, float, float]],
+        blend_mode: str,
+    ) -> bool:
+        """Draw ``count`` packed points; ``False`` means the caller must fall back."""
+
+        program = self._program
+        vbo = self._vbo
+        if program is None or vbo is None:
+            return False
+        if count <= 0:
+            return True
+        if (2.0 * max_radius + 2.0) * dpr > self._max_point_size:
+            return False
+        equation, src, dst = _GL_BLEND_MODES.get((blend_mode or "").lower(), _GL_BLEND_SOURCE_OVER)
+        stride = _GL_POINT_FLOATS * 4
+        gl = functions
+        if self._vao is not None:
+            self._vao.bind()
+        vbo.bind()
+        vbo.allocate(data, count * stride)
+        program.bind()
+        program.setUniformValue("u_viewport", QtGui.QVector2D(float(viewport[0]), float(viewport[1])))
+        program.setUniformValue("u_dpr", float(dpr))
+        program.setUniformValue("u_square", 1.0 if square else 0.0)
+        clip_x, clip_y, clip_r = clip if clip is not None else (0.0, 0.0, 0.0)
+        program.setUniformValue("u_clip", QtGui.QVector3D(float(clip_x), float(clip_y), float(clip_r)))
+        program.enableAttributeArray("a_pos")
+        program.enableAttributeArray("a_radius")
+        program.enableAttributeArray("a_color")
+        program.setAttributeBuffer("a_pos", _GL_FLOAT, 0, 2, stride)
+        program.setAttributeBuffer("a_radius", _GL_FLOAT, 8, 1, stride)
+        program.setAttributeBuffer("a_color", _GL_FLOAT, 12, 4, stride)
+        gl.glDisable(_GL_DEPTH_TEST)
+        gl.glEnable(_GL_BLEND)
+        gl.glBlendEquation(equation)
+        gl.glBlendFunc(src, dst)
+        if not self._is_gles:
+            gl.glEnable(_GL_PROGRAM_POINT_SIZE)
+            # Required for gl_PointCoord on compatibility profiles, rejected
+            # (GL_INVALID_ENUM) by core ones: clear the error flag afterwards.
+            gl.glEnable(_GL_POINT_SPRITE)
+            gl.glGetError()
+        try:
+            gl.glDrawArrays(_GL_POINTS, 0, count)
+        finally:
+            program.disableAttributeArray("a_pos")
+            program.disableAttributeArray("a_radius")
+            program.disableAttributeArray("a_color")
+            program.release()
+            vbo.release()
+            if self._vao is not None:
+                self._vao.release()
+            gl.glBlendEquation(_GL_FUNC_ADD)
+        return True
+
+
 # ---------------------------------------------------------------------------
 # Utility helpers translated from the JavaScript implementation
 
@@ -162,6 +1213,58 @@ def _rand_for_index(index: int, salt: int = 0) -> float:
     return x - math.floor(x)
 
 
+def _rand_for_indices(indices, salt: int = 0):
+    """Vectorised counterpart of :func:`_rand_for_index` for numpy arrays."""
+
+    s = indices * 12.9898 + salt * 78.233
+    x = np.sin(s) * 43758.5453
+    return x - np.floor(x)
+
+
+class _SeedAttributes:
+    """Per-point random constants, rebuilt with the base points.
+
+    Every column is indexed by the point's position in ``base_points`` and
+    holds ``_rand_for_index`` values that :meth:`DyxtenEngine.step` used to
+    recompute each frame: the donut-orbit phase, speed and radius jitter,
+    the density-mode keep threshold and the ``random`` rotation phase.
+    ``lod_rand`` ranks the points for the level-of-detail subsets.
+    """
+
+    __slots__ = ("count", "orbit_phase", "orbit_speed", "orbit_jitter", "keep_rand", "phase_rand", "lod_rand")
+
+    # (colonne, décalage d'index, sel)
+    _COLUMNS = (
+        ("orbit_phase", 0, 311),
+        ("orbit_speed", 0, 733),
+        ("orbit_jitter", 0, 911),
+        ("keep_rand", 1, 0),
+        ("phase_rand", 0, 77),
+        ("lod_rand", 0, 1237),
+    )
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        for name, shift, salt in self._COLUMNS:
+            if np is not None:
+                values = _rand_for_indices(np.arange(shift, count + shift, dtype=np.float64), salt)
+                column = array("d", values.tobytes())
+            else:
+                column = array("d", (_rand_for_index(i + shift, salt) for i in range(count)))
+            setattr(self, name, column)
+
+    def view(self, name: str):
+        """Zero-copy numpy view of a column."""
+
+        return np.frombuffer(getattr(self, name), dtype=np.float64)
+
+
+def _noise_hash(ix: int, iy: int, iz: int) -> float:
+    n = ix * 15731 + iy * 789221 + iz * 1376312589
+    n = (n << 13) ^ n
+    return (1.0 - ((n * (n * n * 15731 + 789221) + 1376312589) & 0x7FFFFFFF) / 1073741824.0) * 0.5 + 0.5
+
+
 def _value_noise3(x: float, y: float, z: float) -> float:
     xi = math.floor(x)
     yi = math.floor(y)
@@ -170,37 +1273,81 @@ def _value_noise3(x: float, y: float, z: float) -> float:
     yf = y - yi
     zf = z - zi
 
-    def _hash(ix: int, iy: int, iz: int) -> float:
-        n = ix * 15731 + iy * 789221 + iz * 1376312589
-        n = (n << 13) ^ n
-        return (1.0 - ((n * (n * n * 15731 + 789221) + 1376312589) & 0x7FFFFFFF) / 1073741824.0) * 0.5 + 0.5
-
-    def _lerp(a: float, b: float, t: float) -> float:
-        return a + (b - a) * t
-
-    def _smooth(t: float) -> float:
-        return t * t * (3.0 - 2.0 * t)
-
-    c000 = _hash(xi, yi, zi)
-    c100 = _hash(xi + 1, yi, zi)
-    c010 = _hash(xi, yi + 1, zi)
-    c110 = _hash(xi + 1, yi + 1, zi)
-    c001 = _hash(xi, yi, zi + 1)
-    c101 = _hash(xi + 1, yi, zi + 1)
-    c011 = _hash(xi, yi + 1, zi + 1)
-    c111 = _hash(xi + 1, yi + 1, zi + 1)
-
-    u = _smooth(xf)
-    v = _smooth(yf)
-    w = _smooth(zf)
+    c000 = _noise_hash(xi, yi, zi)
+    c100 = _noise_hash(xi + 1, yi, zi)
+    c010 = _noise_hash(xi, yi + 1, zi)
+    c110 = _noise_hash(xi + 1, yi + 1, zi)
+    c001 = _noise_hash(xi, yi, zi + 1)
+    c101 = _noise_hash(xi + 1, yi, zi + 1)
+    c011 = _noise_hash(xi, yi + 1, zi + 1)
+    c111 = _noise_hash(xi + 1, yi + 1, zi + 1)
+
+    u = xf * xf * (3.0 - 2.0 * xf)
+    v = yf * yf * (3.0 - 2.0 * yf)
+    w = zf * zf * (3.0 - 2.0 * zf)
+
+    x00 = c000 + (c100 - c000) * u
+    x10 = c010 + (c110 - c010) * u
+    x01 = c001 + (c101 - c001) * u
+    x11 = c011 + (c111 - c011) * u
+    y0 = x00 + (x10 - x00) * v
+    y1 = x01 + (x11 - x01) * v
+    return y0 + (y1 - y0) * w
+
+
+def _noise_hash_array(ix, iy, iz):
+    """Vectorised :func:`_noise_hash` on ``int64`` lattice coordinates.
+
+    Python integers never overflow, but the result only keeps the low 31
+    bits and ``+``, ``*``, ``<<`` and ``^`` are exact modulo 2**64, so the
+    wrapping ``int64`` arithmetic gives the same value.
+    """
 
-    x00 = _lerp(c000, c100, u)
-    x10 = _lerp(c010, c110, u)
-    x01 = _lerp(c001, c101, u)
-    x11 = _lerp(c011, c111, u)
-    y0 = _lerp(x00, x10, v)
-    y1 = _lerp(x01, x11, v)
-    return _lerp(y0, y1, w)
+    n = ix * 15731 + iy * 789221 + iz * 1376312589
+    n = (n << 13) ^ n
+    bits = (n * (n * n * 15731 + 789221) + 1376312589) & 0x7FFFFFFF
+    return (1.0 - bits / 1073741824.0) * 0.5 + 0.5
+
+
+def _value_noise3_array(x, y, z):
+    """Batched :func:`_value_noise3`; bit-identical for every sample."""
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    z = np.asarray(z, dtype=np.float64)
+    fx = np.floor(x)
+    fy = np.floor(y)
+    fz = np.floor(z)
+    xf = x - fx
+    yf = y - fy
+    zf = z - fz
+    with np.errstate(over="ignore"):
+        xi = fx.astype(np.int64)
+        yi = fy.astype(np.int64)
+        zi = fz.astype(np.int64)
+        xj = xi + 1
+        yj = yi + 1
+        zj = zi + 1
+        c000 = _noise_hash_array(xi, yi, zi)
+        c100 = _noise_hash_array(xj, yi, zi)
+        c010 = _noise_hash_array(xi, yj, zi)
+        c110 = _noise_hash_array(xj, yj, zi)
+        c001 = _noise_hash_array(xi, yi, zj)
+        c101 = _noise_hash_array(xj, yi, zj)
+        c011 = _noise_hash_array(xi, yj, zj)
+        c111 = _noise_hash_array(xj, yj, zj)
+
+    u = xf * xf * (3.0 - 2.0 * xf)
+    v = yf * yf * (3.0 - 2.0 * yf)
+    w = zf * zf * (3.0 - 2.0 * zf)
+
+    x00 = c000 + (c100 - c000) * u
+    x10 = c010 + (c110 - c010) * u
+    x01 = c001 + (c101 - c001) * u
+    x11 = c011 + (c111 - c011) * u
+    y0 = x00 + (x10 - x00) * v
+    y1 = x01 + (x11 - x01) * v
+    return y0 + (y1 - y0) * w
 
 
 def _gen_uv_sphere(geo: Mapping[str, object], cap: int) -> List[Point3D]:
@@ -230,6 +1377,14 @@ def _gen_uv_sphere(geo: Mapping[str, object], cap: int) -> List[Point3D]:
     return points
 
 
+def _format_sampling_stats(sampling: Mapping[str, ImplicitSamplingStats]) -> str:
+    return ", ".join(
+        "%s %d/%d accepted (%.1f%%, %d in band)"
+        % (name, stats.accepted, stats.candidates, 100.0 * stats.acceptance, stats.in_band)
+        for name, stats in sorted(sampling.items())
+    )
+
+
 _DEFAULT_GENERATORS: Dict[str, GeometryGenerator] = {
     "uv_sphere": _gen_uv_sphere,
 }
@@ -437,6 +1592,16 @@ def _default_state() -> Dict[str, dict]:
             "markerCircles": {"red": 0.16, "yellow": 0.19, "blue": 0.22},
             "donutButtonSize": 100,
             "donutRadiusRatio": 0.35,
+            "engineBackend": "auto",
+            "geometryCacheMB": 64,
+            "geometryWorker": True,
+            "orbiterMax": 4096,
+            "depthSortBins": 256,
+            "frameProfiler": False,
+            "simulationThread": False,
+            "simRateHz": 60,
+            "adaptivePacing": False,
+            "targetFrameMs": 0,
         },
         "indicator": {
             "centerLines": {
@@ -454,6 +1619,62 @@ def _default_state() -> Dict[str, dict]:
     }
 
 
+def _freeze_state_value(value: object) -> object:
+    """Deep read-only copy of a state value (mappings become proxies, lists tuples)."""
+
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze_state_value(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_state_value(item) for item in value)
+    return value
+
+
+def _thaw_state_value(value: object) -> object:
+    """Plain ``dict``/``list`` copy of a frozen value (for JSON and pickling)."""
+
+    if isinstance(value, Mapping):
+        return {key: _thaw_state_value(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw_state_value(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class EngineParams:
+    """Immutable, versioned copy of the engine state read by the simulation.
+
+    ``sections`` maps each top-level state key (``camera``, ``geometry``...)
+    to a deep read-only copy of it.  The engine publishes a new instance
+    after every merge by swapping a single reference, so a reader holding a
+    snapshot never sees it change; sections left untouched by a merge are
+    shared with the previous version.
+    """
+
+    version: int
+    sections: Mapping[str, object]
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, object], version: int = 0) -> "EngineParams":
+        return cls(version, MappingProxyType({key: _freeze_state_value(value) for key, value in state.items()}))
+
+    def replace(self, state: Mapping[str, object], keys: Sequence[str]) -> "EngineParams":
+        """Next version with ``keys`` re-read from ``state``."""
+
+        sections = dict(self.sections)
+        for key in keys:
+            if key in state:
+                sections[key] = _freeze_state_value(state[key])
+            else:
+                sections.pop(key, None)
+        return EngineParams(self.version + 1, MappingProxyType(sections))
+
+    def get(self, key: str, default: object = None) -> object:
+        return self.sections.get(key, default)
+
+    def __getitem__(self, key: str) -> object:
+        return self.sections[key]
+
+
 def _smoothstep(edge0: float, edge1: float, x: float) -> float:
     if edge0 == edge1:
         return 0.0 if x < edge0 else 1.0
@@ -584,50 +1805,743 @@ def _sample_gradient(stops: Sequence[Tuple[str, float]], t: float) -> str:
     return stops[-1][0]
 
 
-def _enforce_min_distance(points: Sequence[Point3D], min_dist: float) -> List[Point3D]:
-    if min_dist <= 0:
-        return [p.copy() for p in points]
-    cell = min_dist
-    offsets = [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)]
-    grid: Dict[Tuple[int, int, int], List[Point3D]] = {}
-    selected: List[Point3D] = []
-    min_sq = min_dist * min_dist
-    for point in points:
-        ix = int(math.floor(point.x / cell))
-        iy = int(math.floor(point.y / cell))
-        iz = int(math.floor(point.z / cell))
-        keep = True
-        for dx, dy, dz in offsets:
-            bucket = grid.get((ix + dx, iy + dy, iz + dz))
-            if not bucket:
-                continue
-            for other in bucket:
-                dxp = point.x - other.x
-                dyp = point.y - other.y
-                dzp = point.z - other.z
-                if dxp * dxp + dyp * dyp + dzp * dzp < min_sq:
-                    keep = False
+_QRGB_CACHE: Dict[str, int] = {}
+_QRGB_FALLBACK = 0xFF00C8FF
+
+
+def _qrgb_from_name(name: str) -> int:
+    """Return the opaque packed ``QRgb`` for a colour name, ``#00C8FF`` if invalid."""
+
+    packed = _QRGB_CACHE.get(name)
+    if packed is None:
+        qcolor = QtGui.QColor(name)
+        packed = qcolor.rgba() | 0xFF000000 if qcolor.isValid() else _QRGB_FALLBACK
+        if len(_QRGB_CACHE) >= 4096:
+            _QRGB_CACHE.clear()
+        _QRGB_CACHE[name] = packed
+    return packed
+
+
+# Nombre d'entrées des tables de couleurs (dégradés et palettes HSL). Les
+# dégradés à transitions rapides utilisent une table plus fine, jusqu'à
+# PALETTE_LUT_MAX_SIZE entrées.
+PALETTE_LUT_SIZE = 1024
+PALETTE_LUT_MAX_SIZE = 16384
+
+
+def _hsl_to_qrgb_array(h, s, l):
+    """Vectorised :func:`_hsl_to_rgb` returning opaque packed ``QRgb`` values."""
+
+    q = np.where(l < 0.5, l * (1 + s), l + s - l * s)
+    p = 2 * l - q
+
+    def _hue(t):
+        t = np.where(t < 0, t + 1, t)
+        t = np.where(t > 1, t - 1, t)
+        return np.select(
+            [t < 1 / 6, t < 1 / 2, t < 2 / 3],
+            [p + (q - p) * 6 * t, q, p + (q - p) * (2 / 3 - t) * 6],
+            p,
+        )
+
+    grey = s == 0
+    r, g, b = (
+        np.round(np.where(grey, l, _hue(h + offset)) * 255).astype(np.uint32)
+        for offset in (1 / 3, 0.0, -1 / 3)
+    )
+    return np.uint32(0xFF000000) | (r << 16) | (g << 8) | b
+
+
+def _bake_gradient_lut(stops: Sequence[Tuple[str, float]]) -> array:
+    """Packed ``QRgb`` table of ``_sample_gradient(stops, i / (len - 1))``.
+
+    With numpy the table starts at :data:`PALETTE_LUT_SIZE` entries and is
+    refined until neighbouring entries differ by at most one step per
+    channel, so a nearest-entry lookup stays within one LSB of
+    :func:`_sample_gradient`.
+    """
+
+    if np is None or len(stops) < 2:
+        last = PALETTE_LUT_SIZE - 1
+        return array("I", (_qrgb_from_name(_sample_gradient(stops, i / last)) for i in range(last + 1)))
+
+    positions = np.array([pos for _, pos in stops])
+    hsl = np.array([_rgb_to_hsl(*_hex_to_rgb(color)) for color, _ in stops])
+    size = PALETTE_LUT_SIZE
+    while True:
+        t = np.linspace(0.0, 1.0, size)
+        # Premier segment [pos_a, pos_b] contenant t, comme _sample_gradient.
+        seg = np.minimum(np.searchsorted(positions[1:], t, side="left"), len(stops) - 2)
+        pos_a = positions[seg]
+        local = ((t - pos_a) / np.maximum(1e-6, positions[seg + 1] - pos_a))[:, None]
+        mixed = hsl[seg] * (1 - local) + hsl[seg + 1] * local
+        packed = _hsl_to_qrgb_array(mixed[:, 0], mixed[:, 1], mixed[:, 2])
+        channels = np.stack([(packed >> shift) & 0xFF for shift in (16, 8, 0)]).astype(np.int32)
+        step = int(np.abs(np.diff(channels, axis=1)).max())
+        if step <= 2 or size >= PALETTE_LUT_MAX_SIZE:
+            return array("I", packed.tobytes())
+        size = min(PALETTE_LUT_MAX_SIZE, size * 2)
+
+
+def _bake_hsl_lut(hue_offset: float, delta: float) -> array:
+    """Packed ``QRgb`` table of the HSL palette for factors spanning ``[-1, 1]``.
+
+    Entry ``i`` holds the ``by_lat``/``by_lon`` colour for
+    ``factor = 2 * i / (PALETTE_LUT_SIZE - 1) - 1``; ``hue_offset`` is ``h0``
+    plus the time-dependent ``wh`` term.
+    """
+
+    last = PALETTE_LUT_SIZE - 1
+    if np is None:
+        table = array("I", bytes((last + 1) * 4))
+        for i in range(last + 1):
+            factor = 2.0 * i / last - 1.0
+            hue = (hue_offset + delta * factor) % 360
+            r, g, b = _hsl_to_rgb(hue / 360.0, clamp01(0.55 + 0.2 * factor), clamp01(0.55 + 0.25 * factor))
+            table[i] = 0xFF000000 | (r << 16) | (g << 8) | b
+        return table
+
+    factor = 2.0 * np.arange(last + 1) / last - 1.0
+    packed = _hsl_to_qrgb_array(
+        np.mod(hue_offset + delta * factor, 360) / 360.0,
+        np.clip(0.55 + 0.2 * factor, 0.0, 1.0),
+        np.clip(0.55 + 0.25 * factor, 0.0, 1.0),
+    )
+    return array("I", packed.tobytes())
+
+
+# ---------------------------------------------------------------------------
+# Orbiter trajectories
+
+
+@dataclass(frozen=True)
+class _TrajectorySettings:
+    """Per-frame trajectory parameters shared by every orbiter of a group."""
+
+    bend: float
+    arc_direction: str
+    spiral_turns: float
+    spiral_tightness: float
+    wave_amplitude: float
+    wave_frequency: float
+    trail_blend: float
+    trail_smoothing: float
+
+
+class _TrailPath:
+    """Polyline followed by the ``initial_path`` trajectory with its arc-length table."""
+
+    __slots__ = ("xs", "ys", "cumulative", "total")
+
+    def __init__(
+        self,
+        start: Tuple[float, float],
+        core: Sequence[Tuple[float, float]],
+        end: Tuple[float, float],
+        smoothing: float,
+    ) -> None:
+        points = [start]
+        points.extend(core)
+        last_x, last_y = points[-1]
+        if len(points) == 1 or abs(last_x - end[0]) > 0.01 or abs(last_y - end[1]) > 0.01:
+            points.append(end)
+        if smoothing > 0.0 and len(points) > 3:
+            radius = max(1, int(round(1 + smoothing * 4)))
+            count = len(points)
+            smoothed: List[Tuple[float, float]] = []
+            for idx in range(count):
+                window = points[max(0, idx - radius) : min(count, idx + radius + 1)]
+                smoothed.append(
+                    (sum(p[0] for p in window) / len(window), sum(p[1] for p in window) / len(window))
+                )
+            points = smoothed
+        self.xs = [p[0] for p in points]
+        self.ys = [p[1] for p in points]
+        cumulative = [0.0]
+        total = 0.0
+        for idx in range(len(points) - 1):
+            total += math.hypot(self.xs[idx + 1] - self.xs[idx], self.ys[idx + 1] - self.ys[idx])
+            cumulative.append(total)
+        self.cumulative = cumulative
+        self.total = total
+
+    def sample(self, t_value: float) -> Tuple[float, float]:
+        total = self.total
+        if total <= 1e-6:
+            return self.xs[-1], self.ys[-1]
+        target = clamp(t_value * total, 0.0, total)
+        cumulative = self.cumulative
+        seg = bisect_left(cumulative, target, 1)
+        if seg >= len(cumulative):
+            return self.xs[-1], self.ys[-1]
+        seg_start = cumulative[seg - 1]
+        local = (target - seg_start) / max(1e-6, cumulative[seg] - seg_start)
+        x0 = self.xs[seg - 1]
+        y0 = self.ys[seg - 1]
+        return x0 + (self.xs[seg] - x0) * local, y0 + (self.ys[seg] - y0) * local
+
+
+def _dedupe_trail(trail: Sequence[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Drop consecutive trail samples closer than 0.01 px."""
+
+    filtered: List[Tuple[float, float]] = []
+    for px, py in trail:
+        if not filtered or abs(filtered[-1][0] - px) > 0.01 or abs(filtered[-1][1] - py) > 0.01:
+            filtered.append((px, py))
+    return filtered
+
+
+def _orbiter_ease(mode: str, value: float, ease_in: float, ease_out: float) -> float:
+    value = clamp01(value)
+    if mode in ("none", "linear"):
+        return value
+    if mode == "ease_in":
+        return pow(value, ease_in)
+    if mode == "ease_in_out":
+        if value < 0.5:
+            return 0.5 * pow(clamp01(value * 2.0), ease_in)
+        return 1.0 - 0.5 * pow(clamp01((1.0 - value) * 2.0), ease_out)
+    return 1.0 - pow(1.0 - value, ease_out)
+
+
+def _orbiter_ease_array(mode: str, values, ease_in: float, ease_out: float):
+    """Vectorised counterpart of :func:`_orbiter_ease`."""
+
+    values = np.clip(values, 0.0, 1.0)
+    if mode in ("none", "linear"):
+        return values
+    if mode == "ease_in":
+        return values ** ease_in
+    if mode == "ease_in_out":
+        low = 0.5 * np.clip(values * 2.0, 0.0, 1.0) ** ease_in
+        high = 1.0 - 0.5 * np.clip((1.0 - values) * 2.0, 0.0, 1.0) ** ease_out
+        return np.where(values < 0.5, low, high)
+    return 1.0 - (1.0 - values) ** ease_out
+
+
+def _orbiter_trajectory_point(
+    mode: str,
+    start_x: float,
+    start_y: float,
+    end_x: float,
+    end_y: float,
+    t_value: float,
+    cx: float,
+    cy: float,
+    orbit_radius: float,
+    settings: _TrajectorySettings,
+    path: Optional[_TrailPath],
+) -> Tuple[float, float]:
+    """Position of one orbiter at eased progress ``t_value`` along its transition."""
+
+    if mode == "arc":
+        start_angle = math.atan2(start_y - cy, start_x - cx)
+        end_angle = math.atan2(end_y - cy, end_x - cx)
+        if settings.arc_direction in ("cw", "ccw"):
+            delta = (end_angle - start_angle) % (2.0 * math.pi)
+            if delta <= 0.0:
+                delta = 2.0 * math.pi
+            if settings.arc_direction == "cw":
+                delta -= 2.0 * math.pi
+        else:
+            delta = (end_angle - start_angle + math.pi) % (2.0 * math.pi) - math.pi
+        angle = start_angle + delta * t_value
+        start_radius = math.hypot(start_x - cx, start_y - cy)
+        end_radius = math.hypot(end_x - cx, end_y - cy)
+        radius = start_radius + (end_radius - start_radius) * t_value
+        return cx + math.cos(angle) * radius, cy + math.sin(angle) * radius
+    if mode == "bezier":
+        ctrl_x = (start_x + end_x) / 2.0
+        ctrl_y = (start_y + end_y) / 2.0
+        dx = end_x - start_x
+        dy = end_y - start_y
+        length = math.hypot(dx, dy)
+        bend = settings.bend
+        if length > 1e-6 and abs(bend) > 1e-5:
+            scale_factor = 1.0
+            if orbit_radius > 0.0:
+                scale_factor = clamp(orbit_radius / max(length, 1.0), 0.3, 2.0)
+            ctrl_x += -dy * bend * scale_factor
+            ctrl_y += dx * bend * scale_factor
+        omt = 1.0 - t_value
+        x = omt * omt * start_x + 2.0 * omt * t_value * ctrl_x + t_value * t_value * end_x
+        y = omt * omt * start_y + 2.0 * omt * t_value * ctrl_y + t_value * t_value * end_y
+        return x, y
+    if mode == "spiral":
+        start_angle = math.atan2(start_y - cy, start_x - cx)
+        start_radius = math.hypot(start_x - cx, start_y - cy)
+        end_radius = math.hypot(end_x - cx, end_y - cy)
+        interp_radius = start_radius + (end_radius - start_radius) * t_value
+        angle = start_angle + settings.spiral_turns * 2.0 * math.pi * t_value
+        radius = max(0.0, interp_radius * (1.0 + settings.spiral_tightness * (t_value - 0.5)))
+        return cx + math.cos(angle) * radius, cy + math.sin(angle) * radius
+    lin_x = start_x + (end_x - start_x) * t_value
+    lin_y = start_y + (end_y - start_y) * t_value
+    if mode == "wave":
+        dx = end_x - start_x
+        dy = end_y - start_y
+        length = math.hypot(dx, dy)
+        if length <= 1e-6:
+            return lin_x, lin_y
+        offset = math.sin(t_value * math.pi * settings.wave_frequency) * settings.wave_amplitude * 0.5
+        return lin_x - dy * offset, lin_y + dx * offset
+    if mode == "initial_path" and path is not None:
+        path_x, path_y = path.sample(t_value)
+        blend = settings.trail_blend
+        return lin_x * (1.0 - blend) + path_x * blend, lin_y * (1.0 - blend) + path_y * blend
+    return lin_x, lin_y
+
+
+def _orbiter_trajectory_points(
+    mode: str,
+    start_x,
+    start_y,
+    end_x,
+    end_y,
+    t_value,
+    cx,
+    cy,
+    orbit_radius,
+    settings: _TrajectorySettings,
+    paths: Sequence[Optional[_TrailPath]],
+):
+    """Batched :func:`_orbiter_trajectory_point` over numpy arrays of orbiters."""
+
+    if mode == "arc":
+        start_angle = np.arctan2(start_y - cy, start_x - cx)
+        end_angle = np.arctan2(end_y - cy, end_x - cx)
+        if settings.arc_direction in ("cw", "ccw"):
+            delta = np.mod(end_angle - start_angle, 2.0 * math.pi)
+            delta = np.where(delta <= 0.0, 2.0 * math.pi, delta)
+            if settings.arc_direction == "cw":
+                delta = delta - 2.0 * math.pi
+        else:
+            delta = np.mod(end_angle - start_angle + math.pi, 2.0 * math.pi) - math.pi
+        angle = start_angle + delta * t_value
+        start_radius = np.hypot(start_x - cx, start_y - cy)
+        end_radius = np.hypot(end_x - cx, end_y - cy)
+        radius = start_radius + (end_radius - start_radius) * t_value
+        return cx + np.cos(angle) * radius, cy + np.sin(angle) * radius
+    if mode == "bezier":
+        ctrl_x = (start_x + end_x) / 2.0
+        ctrl_y = (start_y + end_y) / 2.0
+        dx = end_x - start_x
+        dy = end_y - start_y
+        bend = settings.bend
+        if abs(bend) > 1e-5:
+            length = np.hypot(dx, dy)
+            scale_factor = np.where(
+                orbit_radius > 0.0, np.clip(orbit_radius / np.maximum(length, 1.0), 0.3, 2.0), 1.0
+            )
+            bent = length > 1e-6
+            ctrl_x = np.where(bent, ctrl_x - dy * bend * scale_factor, ctrl_x)
+            ctrl_y = np.where(bent, ctrl_y + dx * bend * scale_factor, ctrl_y)
+        omt = 1.0 - t_value
+        x = omt * omt * start_x + 2.0 * omt * t_value * ctrl_x + t_value * t_value * end_x
+        y = omt * omt * start_y + 2.0 * omt * t_value * ctrl_y + t_value * t_value * end_y
+        return x, y
+    if mode == "spiral":
+        start_angle = np.arctan2(start_y - cy, start_x - cx)
+        start_radius = np.hypot(start_x - cx, start_y - cy)
+        end_radius = np.hypot(end_x - cx, end_y - cy)
+        interp_radius = start_radius + (end_radius - start_radius) * t_value
+        angle = start_angle + settings.spiral_turns * 2.0 * math.pi * t_value
+        radius = np.maximum(0.0, interp_radius * (1.0 + settings.spiral_tightness * (t_value - 0.5)))
+        return cx + np.cos(angle) * radius, cy + np.sin(angle) * radius
+    lin_x = start_x + (end_x - start_x) * t_value
+    lin_y = start_y + (end_y - start_y) * t_value
+    if mode == "wave":
+        dx = end_x - start_x
+        dy = end_y - start_y
+        offset = np.sin(t_value * math.pi * settings.wave_frequency) * settings.wave_amplitude * 0.5
+        # Une longueur nulle donne dx = dy = 0 : pas de décalage.
+        return lin_x - dy * offset, lin_y + dx * offset
+    if mode == "initial_path":
+        path_x = lin_x.copy()
+        path_y = lin_y.copy()
+        for i, path in enumerate(paths):
+            if path is not None:
+                path_x[i], path_y[i] = path.sample(float(t_value[i]))
+        blend = settings.trail_blend
+        return lin_x * (1.0 - blend) + path_x * blend, lin_y * (1.0 - blend) + path_y * blend
+    return lin_x, lin_y
+
+
+class _DonutOrbits:
+    """Donut buttons resolved for one viewport, with a nearest-button index.
+
+    The buttons sit on a ring around their mean (the hub), so each angular
+    sector seen from the hub, beyond ``inner_radius``, only needs the buttons
+    that are not dominated there: a button is dropped from a sector when
+    another one is strictly closer to every point of it.  :meth:`nearest` then
+    only scans the few remaining candidates, in index order, and returns the
+    same button as a full scan (first index wins on ties).  Points closer to
+    the hub than ``inner_radius`` are scanned against every button.
+    """
+
+    __slots__ = (
+        "centers",
+        "radii",
+        "fallback_radius",
+        "orbit_radii",
+        "hub_x",
+        "hub_y",
+        "inner_radius",
+        "sectors",
+        "candidates",
+        "_cand_idx",
+        "_cand_x",
+        "_cand_y",
+        "_orbit_r",
+    )
+
+    # Marge angulaire des secteurs contre les arrondis de atan2.
+    _SECTOR_MARGIN = 1e-9
+    # Marge relative de domination (arrondis des distances au carré).
+    _TIE_MARGIN = 1e-6
+
+    def __init__(
+        self,
+        centers: List[Tuple[float, float]],
+        radii: List[float],
+        fallback_radius: float,
+        sectors: int = 64,
+    ) -> None:
+        self.centers = centers
+        self.radii = radii
+        self.fallback_radius = fallback_radius
+        orbit_radii: List[float] = []
+        for idx in range(len(centers)):
+            value = float(radii[idx]) if idx < len(radii) else 0.0
+            if not math.isfinite(value) or value <= 0.0:
+                value = fallback_radius
+            orbit_radii.append(value)
+        self.orbit_radii = orbit_radii
+        count = len(centers)
+        self.hub_x = sum(x for x, _ in centers) / count if count else 0.0
+        self.hub_y = sum(y for _, y in centers) / count if count else 0.0
+        ring = min((math.hypot(x - self.hub_x, y - self.hub_y) for x, y in centers), default=0.0)
+        self.inner_radius = 0.5 * ring
+        self.sectors = max(1, int(sectors))
+        self.candidates = [self._sector_candidates(k) for k in range(self.sectors)]
+        self._cand_idx = self._cand_x = self._cand_y = self._orbit_r = None
+        if np is not None and count:
+            width = max(len(c) for c in self.candidates)
+            cand_idx = np.zeros((self.sectors, width), dtype=np.intp)
+            cand_x = np.full((self.sectors, width), np.inf)
+            cand_y = np.full((self.sectors, width), np.inf)
+            for k, cands in enumerate(self.candidates):
+                for j, btn in enumerate(cands):
+                    cand_idx[k, j] = btn
+                    cand_x[k, j], cand_y[k, j] = centers[btn]
+            self._cand_idx = cand_idx
+            self._cand_x = cand_x
+            self._cand_y = cand_y
+            self._orbit_r = np.asarray(orbit_radii, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.centers)
+
+    def _sector_candidates(self, sector: int) -> Tuple[int, ...]:
+        hx = self.hub_x
+        hy = self.hub_y
+        span = 2.0 * math.pi / self.sectors
+        a0 = -math.pi + sector * span - self._SECTOR_MARGIN
+        a1 = a0 + span + 2.0 * self._SECTOR_MARGIN
+        rays = ((math.cos(a0), math.sin(a0)), (math.cos(a1), math.sin(a1)))
+        # Le secteur annulaire est contenu dans l'enveloppe de ses deux coins
+        # intérieurs prolongés par ses rayons.
+        r0 = self.inner_radius
+        corners = tuple((hx + r0 * ux, hy + r0 * uy) for ux, uy in rays)
+        centers = self.centers
+        kept: List[int] = []
+        for j, (jx, jy) in enumerate(centers):
+            dominated = False
+            for k, (kx, ky) in enumerate(centers):
+                if k == j:
+                    continue
+                # Demi-plan des points strictement plus proches de k que de j :
+                # il contient tout le secteur s'il contient ses coins et ses rayons.
+                # Les marges laissent candidats les quasi-ex aequo, départagés
+                # ensuite par le même calcul de distance que le parcours complet.
+                nx = kx - jx
+                ny = ky - jy
+                norm = math.hypot(nx, ny)
+                mx = (kx + jx) * 0.5
+                my = (ky + jy) * 0.5
+                if not all(
+                    (px - mx) * nx + (py - my) * ny > self._TIE_MARGIN * norm * (norm + math.hypot(px - mx, py - my))
+                    for px, py in corners
+                ):
+                    continue
+                if all(ux * nx + uy * ny > self._TIE_MARGIN * norm for ux, uy in rays):
+                    dominated = True
                     break
-            if not keep:
-                break
-        if not keep:
-            continue
-        selected.append(point.copy())
-        grid.setdefault((ix, iy, iz), []).append(point)
-    return selected if selected else [p.copy() for p in points]
+            if not dominated:
+                kept.append(j)
+        return tuple(kept)
+
+    def nearest(self, x: float, y: float) -> int:
+        """Index of the button closest to ``(x, y)``."""
+
+        best = 0
+        best_d2 = float("inf")
+        centers = self.centers
+        dx = x - self.hub_x
+        dy = y - self.hub_y
+        if dx * dx + dy * dy < self.inner_radius * self.inner_radius:
+            candidates: Sequence[int] = range(len(centers))
+        else:
+            sector = int((math.atan2(dy, dx) + math.pi) / (2.0 * math.pi) * self.sectors)
+            candidates = self.candidates[min(self.sectors - 1, max(0, sector))]
+        for idx in candidates:
+            bx, by = centers[idx]
+            d2 = (x - bx) ** 2 + (y - by) ** 2
+            if d2 < best_d2:
+                best_d2 = d2
+                best = idx
+        return best
+
+    def nearest_array(self, x, y):
+        """Array version of :meth:`nearest` (numpy required)."""
+
+        dx = x - self.hub_x
+        dy = y - self.hub_y
+        sector = ((np.arctan2(dy, dx) + math.pi) / (2.0 * math.pi) * self.sectors).astype(np.intp)
+        np.clip(sector, 0, self.sectors - 1, out=sector)
+        d2 = (x[:, None] - self._cand_x[sector]) ** 2 + (y[:, None] - self._cand_y[sector]) ** 2
+        result = self._cand_idx[sector, np.argmin(d2, axis=1)]
+        inner = np.flatnonzero(dx * dx + dy * dy < self.inner_radius * self.inner_radius)
+        if len(inner):
+            centers = np.asarray(self.centers, dtype=np.float64)
+            d2 = (x[inner, None] - centers[:, 0]) ** 2 + (y[inner, None] - centers[:, 1]) ** 2
+            result[inner] = np.argmin(d2, axis=1)
+        return result
+
+
+class SimulationClock:
+    """Fixed-timestep scheduler for the stateful part of :meth:`DyxtenEngine.step`.
+
+    Elapsed wall time accumulates and is consumed in steps of ``step_ms``
+    (``system.simRateHz``), so the camera angle and the orbiters advance by
+    the same increments whatever the render rate.  At most
+    ``max_substeps`` run per frame (100 ms of simulation, like the variable
+    step clamp) and the excess is dropped (``dropped_ms``): under load the
+    simulation slows down instead of each frame taking longer than the
+    previous one.  ``alpha`` is the fraction of
+    a step left in the accumulator; the frame is rendered that far between
+    the previous simulation state and the current one, at ``render_ms``.
+
+    A ``step_ms`` of 0 keeps the variable step: one step per frame of the
+    elapsed time clamped to 100 ms, rendered at the current time.
+    """
+
+    __slots__ = ("step_ms", "max_substeps", "sim_ms", "dt", "alpha", "dropped_ms", "_last_wall_ms", "_accumulator")
+
+    # Simulation consommée au plus par frame, en millisecondes.
+    MAX_FRAME_MS = 100.0
+
+    def __init__(self, rate_hz: float = 0.0) -> None:
+        self.step_ms = 0.0
+        self.max_substeps = 1
+        self.reset()
+        self.set_rate(rate_hz)
+
+    def reset(self) -> None:
+        self.sim_ms = 0.0
+        self.dt = 0.0
+        self.alpha = 1.0
+        self.dropped_ms = 0.0
+        self._last_wall_ms = 0.0
+        self._accumulator = 0.0
+
+    @property
+    def fixed(self) -> bool:
+        return self.step_ms > 0.0
+
+    @property
+    def render_ms(self) -> float:
+        return self.sim_ms - (1.0 - self.alpha) * self.dt * 1000.0
+
+    def set_rate(self, rate_hz: float) -> None:
+        """Switch to ``rate_hz`` steps per second (0 = variable step)."""
+
+        step_ms = 1000.0 / rate_hz if rate_hz > 0.0 else 0.0
+        if step_ms != self.step_ms:
+            self.step_ms = step_ms
+            self.max_substeps = max(1, int(math.ceil(self.MAX_FRAME_MS / step_ms))) if step_ms > 0.0 else 1
+            self._accumulator = 0.0
+
+    def advance(self, wall_ms: float) -> int:
+        """Consume the time elapsed since the last call; return the step count."""
+
+        elapsed = wall_ms - self._last_wall_ms
+        self._last_wall_ms = wall_ms
+        if self.step_ms <= 0.0:
+            self.dt = min(0.1, max(0.0, elapsed / 1000.0))
+            self.sim_ms = wall_ms
+            self.alpha = 1.0
+            return 1
+        step_ms = self.step_ms
+        self.dt = step_ms / 1000.0
+        self._accumulator += max(0.0, elapsed)
+        steps = int(self._accumulator // step_ms)
+        if steps > self.max_substeps:
+            dropped = (steps - self.max_substeps) * step_ms
+            self.dropped_ms += dropped
+            self._accumulator -= dropped
+            steps = self.max_substeps
+        self._accumulator -= steps * step_ms
+        self.sim_ms += steps * step_ms
+        self.alpha = clamp01(self._accumulator / step_ms)
+        return steps
+
+
+class SimulationFrame:
+    """Everything the painter reads from one finished simulation step.
+
+    Apart from ``buffer``, which is refilled in place, fields are replaced
+    rather than mutated: ``orbiters`` is the list built by the step and
+    ``imprints`` a copy of the store taken when it last changed.
+    """
+
+    __slots__ = ("params", "buffer", "orbiters", "imprints", "donut", "marker_radii")
+
+    def __init__(self, params: EngineParams) -> None:
+        self.params = params
+        self.buffer = FrameBuffer()
+        self.orbiters: List[Tuple[float, float, QtGui.QColor, float, float]] = []
+        self.imprints = ImprintStore(1)
+        self.donut: Optional[_DonutOrbits] = None
+        self.marker_radii: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+
+
+class SimulationThread(threading.Thread):
+    """Steps a :class:`DyxtenEngine` off the GUI thread (``system.simulationThread``).
+
+    Frames rotate through three :class:`SimulationFrame` slots without a
+    lock: the thread fills a slot that is neither ``_latest`` (the last one
+    published) nor ``_reading`` (the one claimed by the painter), then
+    publishes it by rewriting ``_latest``.  :meth:`acquire` claims the latest
+    slot and checks it is still the latest afterwards, so a slot is never
+    refilled while it is painted.  The thread is paced on
+    ``system.frameIntervalMs`` and steps at ``viewport``, which the widget
+    updates on every paint.
+    """
+
+    def __init__(self, engine: "DyxtenEngine", viewport: Tuple[int, int]) -> None:
+        super().__init__(name="DyxtenSimulation", daemon=True)
+        self.engine = engine
+        self.viewport = viewport
+        self._stop_event = threading.Event()
+        self._frames = [SimulationFrame(engine.params) for _ in range(3)]
+        # Une frame vide est publiée d'emblée : acquire() ne renvoie jamais None.
+        self._latest = 0
+        self._reading = -1
+        self._imprints_key: Optional[Tuple[int, int]] = None
+        self._imprints_copy = self._frames[0].imprints
+        # Durée du dernier pas, lue par la vue pour le niveau de détail.
+        self.step_ms = 0.0
+
+    def acquire(self) -> SimulationFrame:
+        """Claim the most recent finished frame for painting."""
+
+        while True:
+            index = self._latest
+            self._reading = index
+            if self._latest == index:
+                return self._frames[index]
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
+
+    def _imprints_snapshot(self) -> ImprintStore:
+        store = self.engine._imprints
+        key = (store.revision, store.next_id)
+        if key != self._imprints_key:
+            self._imprints_key = key
+            self._imprints_copy = store.copy()
+        return self._imprints_copy
+
+    def run(self) -> None:
+        engine = self.engine
+        while not self._stop_event.is_set():
+            started = time.perf_counter()
+            latest = self._latest
+            reading = self._reading
+            index = next(i for i in range(3) if i != latest and i != reading)
+            frame = self._frames[index]
+            width, height = self.viewport
+            system = engine.params.get("system", {})
+            if not isinstance(system, Mapping):
+                system = {}
+            profiling = bool(system.get("frameProfiler", False))
+            engine._frame = frame.buffer
+            try:
+                if profiling:
+                    engine.profiler.begin_frame()
+                try:
+                    engine.step(width, height)
+                finally:
+                    engine.profiler.end_frame()
+                frame.params = engine._frame_params
+                frame.orbiters = engine._orbiters_draw
+                frame.imprints = self._imprints_snapshot()
+                frame.donut = engine._donut_orbits(max(1, width), max(1, height))
+                frame.marker_radii = engine._marker_radii
+                self._latest = index
+                self.step_ms = (time.perf_counter() - started) * 1000.0
+            except Exception as exc:  # pragma: no cover - garder le thread en vie
+                print(f"[Dyxten][WARN] simulation step failed: {exc!r}", file=sys.stderr)
+            try:
+                interval_ms = float(system.get("frameIntervalMs", 16) or 0.0)
+            except (TypeError, ValueError):
+                interval_ms = 16.0
+            if interval_ms <= 0.0:
+                interval_ms = 16.0
+            self._stop_event.wait(max(0.0, interval_ms / 1000.0 - (time.perf_counter() - started)))
 
 
 class DyxtenEngine:
     """Small helper responsible for generating and animating the particle cloud."""
 
     _GEOMETRY_GENERATORS: Dict[str, GeometryGenerator] = {}
+    # Paramètres (nom, valeur par défaut) lus par chaque topologie JSON ; sert
+    # à construire la clé du cache de géométrie.
+    _GEOMETRY_PARAMETERS: Dict[str, Tuple[Tuple[str, object], ...]] = {}
 
     def __init__(self) -> None:
+        # ``state`` n'est modifié que par merge_state (thread GUI) ; la simulation
+        # lit l'instantané ``_frame_params`` figé au début de chaque frame.
         self.state: Dict[str, dict] = _default_state()
+        self._params = EngineParams.from_state(self.state)
+        self._frame_params = self._params
+        # Commandes touchant l'état de simulation, exécutées par le thread qui
+        # appelle step() quand system.simulationThread est actif.
+        self._inbox: Deque[Tuple[Callable[..., None], Tuple[object, ...]]] = deque()
+        self.simulation: Optional[SimulationThread] = None
         self.gradient = _parse_gradient_stops(self.state["appearance"].get("colors"))
+        # Tables de couleurs précalculées ; la table HSL dépend de h0/dh et du
+        # terme animé wh, elle est recalculée quand sa clé change.
+        self._gradient_lut = _bake_gradient_lut(self.gradient)
+        self._hsl_lut: Optional[array] = None
+        self._hsl_lut_key: Optional[Tuple[float, float]] = None
+        self._palette_mode = "uniform"
+        self._palette_rgba = _QRGB_FALLBACK
+        self._palette_noise = (1.0, 0.0)
         self.base_points: List[Point3D] = []
+        # Copie contiguë (N×3, float64) des points de base utilisée par le
+        # moteur vectorisé lorsque numpy est disponible.
+        self._base_array = None
+        # Constantes aléatoires par point et masque de densité statique
+        # (clé, masque) recalculés avec la géométrie.
+        self._seed_attrs = _SeedAttributes(0)
+        self._keep_cache: Optional[Tuple[Tuple[str, float], array]] = None
         self._start_time = time.perf_counter()
-        self._last_ms = 0.0
+        # Pas de simulation fixe (system.simRateHz) et interpolation du rendu.
+        self._clock = SimulationClock()
         self._cam_theta_deg = 0.0
         self._width = 1
         self._height = 1
@@ -640,24 +2554,38 @@ class DyxtenEngine:
         self._marker_radii: Tuple[float, float, float] = (0.0, 0.0, 0.0)
         self._donut_layout: List[Tuple[float, float, float]] = []
         self._donut_button_colors: List[QtGui.QColor] = []
+        # Temps par étape des dernières frames (system.frameProfiler) ; avec
+        # le thread de simulation, « paint » et « overlay » sont mesurés par
+        # le thread GUI dans paint_profiler.
+        self.profiler = FrameProfiler()
+        self.paint_profiler = FrameProfiler()
+        # Niveau de détail piloté par la durée des frames (system.targetFrameMs)
+        # et sous-ensemble de points correspondant, (nombre, budget) -> seeds.
+        self.quality = QualityGovernor()
+        self._lod_budget = -1
+        self._lod_cache: Optional[Tuple[Tuple[int, int], List[int], object]] = None
+        # Disposition des boutons résolue pour la taille courante ; reconstruite
+        # quand la taille ou la révision de la disposition change.
+        self._donut_revision = 0
+        self._donut_orbits_cache: Optional[Tuple[Tuple[int, int, int], _DonutOrbits]] = None
+        # Limite de sécurité pour éviter une croissance mémoire illimitée.
+        self._max_imprints = 5000
         # Empreintes persistantes déposées par les particules lorsqu'elles
-        # franchissent le bord du cercle rouge. Chaque entrée :
-        # (x, y, QColor, rayon, timestamp_ms, identifiant)
-        self._imprints: List[Tuple[float, float, QtGui.QColor, float, float, int]] = []
-        self._imprint_counter = 0
-        # Positions précédentes des particules pour détecter un passage du bord
-        # clé = seed (index de particule), valeur = (sx, sy, dist_center)
-        self._last_particle_positions: Dict[int, Tuple[float, float, float]] = {}
+        # franchissent le bord du cercle rouge.
+        self._imprints = ImprintStore(self._max_imprints)
+        # Distance au centre de chaque particule à la frame précédente (indexée
+        # par seed, NaN = inconnue) pour détecter un passage du bord.
+        self._prev_center_dist = array("d")
+        # Tampon réutilisé d'une frame à l'autre pour les points projetés.
+        self._frame = FrameBuffer()
         # Historique des trajectoires des particules (pour trajectoire initiale)
         self._particle_traces: Dict[int, Deque[Tuple[float, float]]] = {}
         self._trail_max_points = 90
-        # Limite de sécurité pour éviter une croissance mémoire illimitée.
-        self._max_imprints = 5000
         # Particules orbitales déclenchées par chaque empreinte
-        self._orbiters: List[Dict[str, object]] = []
+        self._max_orbiters = 4096
+        self._orbiters = OrbiterPool(self._max_orbiters)
         # Positions calculées pour affichage à la dernière frame: (sx, sy, QColor, r, alpha)
         self._orbiters_draw: List[Tuple[float, float, QtGui.QColor, float, float]] = []
-        self._max_orbiters = 512
         self._mod_noise_warp = 0.0
         self._mod_field_flow = 0.0
         self._mod_repel_force = 0.0
@@ -667,7 +2595,11 @@ class DyxtenEngine:
         self._mod_orient_z = 0.0
         self._modifiers_active = False
         # Cache pour éviter les recalculs inutiles de géométrie
-        self._last_geometry_params: Optional[Tuple[str, ...]] = None
+        self._last_geometry_params: Optional[str] = None
+        self._geometry_cache = GeometryCache()
+        # Génération asynchrone : pool créé à la demande, job en cours
+        self._geometry_executor: Optional[ProcessPoolExecutor] = None
+        self._pending_geometry: Optional[_PendingGeometry] = None
         self._update_modifier_flags()
         self.rebuild_geometry()
 
@@ -679,28 +2611,147 @@ class DyxtenEngine:
     def _debug(self, message: str) -> None:
         print(f"[Dyxten][DEBUG] {message}", flush=True)
 
-    def merge_state(self, payload: Mapping[str, object]) -> None:
+    @property
+    def params(self) -> EngineParams:
+        """Latest published parameter snapshot."""
+
+        return self._params
+
+    def _post(self, command: Callable[..., None], *args: object) -> None:
+        """Run ``command`` now, or on the simulation thread before its next step."""
+
+        if self.simulation is None:
+            self._frame_params = self._params
+            command(*args)
+        else:
+            self._inbox.append((command, args))
+
+    def _run_pending(self) -> None:
+        inbox = self._inbox
+        while inbox:
+            command, args = inbox.popleft()
+            command(*args)
+
+    def set_simulation_thread(self, enabled: bool, viewport: Tuple[int, int] = (0, 0)) -> None:
+        """Start or stop stepping on a :class:`SimulationThread`."""
+
+        if enabled and self.simulation is None:
+            self.simulation = SimulationThread(self, viewport)
+            self.simulation.start()
+        elif not enabled and self.simulation is not None:
+            self.simulation.stop()
+            self.simulation = None
+            self._frame_params = self._params
+            self._run_pending()
+
+    def profile_averages(self, last: int = 60) -> Dict[str, float]:
+        """Mean stage times of the last frames, paint included when threaded.
+
+        With a :class:`SimulationThread` the simulation stages come from
+        :attr:`profiler` and ``paint``/``overlay`` from :attr:`paint_profiler`;
+        ``total`` is their sum.
+        """
+
+        averages = self.profiler.averages(last)
+        if self.simulation is not None:
+            drawn = self.paint_profiler.averages(last)
+            averages["paint"] = drawn["paint"]
+            averages["overlay"] = drawn["overlay"]
+            averages["total"] = sum(averages[name] for name in PROFILE_STAGES)
+        return averages
+
+    def dump_profile(self, path: str) -> None:
+        """Write :attr:`profiler` to ``path`` and, if the GUI thread recorded
+        frames of its own, :attr:`paint_profiler` next to it (``.paint``
+        inserted before the extension)."""
+
+        self.profiler.dump(path)
+        if len(self.paint_profiler):
+            stem, ext = os.path.splitext(path)
+            self.paint_profiler.dump(f"{stem}.paint{ext}")
+
+    def _array_backend_enabled(self) -> bool:
+        """Return ``True`` when the numpy projection pass should be used.
+
+        ``system.engineBackend`` accepts ``"auto"`` (default), ``"numpy"`` or
+        ``"python"``; the ``DYXTEN_ENGINE_BACKEND`` environment variable takes
+        precedence so the scalar reference path can be forced for debugging.
+        """
+
+        if np is None or self._base_array is None:
+            return False
+        backend = os.environ.get("DYXTEN_ENGINE_BACKEND", "").strip().lower()
+        if not backend:
+            system = self._frame_params.get("system", {})
+            if isinstance(system, Mapping):
+                backend = str(system.get("engineBackend", "auto") or "auto").lower()
+        return backend != "python"
+
+    def merge_state(self, payload: Mapping[str, object]) -> Dict[str, Set[str]]:
+        """Merge ``payload`` into the state and return the keys that changed per section.
+
+        Values equal to the current ones are skipped, and the derived caches
+        (gradient table, modifier flags) are only refreshed when one of their
+        inputs is among the changed keys.  A section replaced wholesale
+        reports the key ``"*"``.  The sections named in ``payload`` are then
+        published as a new :class:`EngineParams` version.
+        """
+
+        changed: Dict[str, Set[str]] = {}
         for key, value in payload.items():
             if key == "donut":
                 self.state["donut"] = sanitize_donut_state(value if isinstance(value, dict) else None)
                 self._donut_layout = []
+                self._donut_revision += 1
+                changed["donut"] = {"*"}
                 continue
-            if key not in self.state or not isinstance(self.state[key], dict) or not isinstance(value, Mapping):
-                self.state[key] = value  # type: ignore[assignment]
+            section = self.state.get(key)
+            if not isinstance(section, dict) or not isinstance(value, Mapping):
+                if section != value:
+                    # Copie : une section partagée avec l'appelant changerait sans delta.
+                    self.state[key] = dict(value) if isinstance(value, Mapping) else value  # type: ignore[assignment]
+                    changed[key] = {"*"}
                 continue
+            keys: Set[str] = set()
             for sub_key, sub_value in value.items():
-                if isinstance(self.state[key].get(sub_key), dict) and isinstance(sub_value, Mapping):
-                    self.state[key][sub_key].update(sub_value)  # type: ignore[index]
-                else:
-                    self.state[key][sub_key] = sub_value  # type: ignore[index]
-        self.gradient = _parse_gradient_stops(self.state.get("appearance", {}).get("colors"))
-        self._update_modifier_flags()
+                current = section.get(sub_key)
+                if isinstance(current, dict) and isinstance(sub_value, Mapping):
+                    if any(current.get(k) != v or k not in current for k, v in sub_value.items()):
+                        current.update(sub_value)
+                        keys.add(sub_key)
+                elif sub_key not in section or current != sub_value:
+                    section[sub_key] = sub_value
+                    keys.add(sub_key)
+            if keys:
+                changed[key] = keys
+        if payload:
+            self._params = self._params.replace(self.state, list(payload.keys()))
+        self._post(self._refresh_derived_state, changed)
+        return changed
+
+    # Entrées de _update_modifier_flags (distribution ou dynamics).
+    _MODIFIER_KEYS = frozenset(
+        ("noiseWarp", "fieldFlow", "repelForce", "densityPulse", "orientXDeg", "orientYDeg", "orientZDeg")
+    )
+
+    def _refresh_derived_state(self, changed: Mapping[str, Set[str]]) -> None:
+        appearance = changed.get("appearance", ())
+        if "colors" in appearance or "*" in appearance:
+            gradient = _parse_gradient_stops(self._frame_params.get("appearance", {}).get("colors"))
+            if gradient != self.gradient:
+                self.gradient = gradient
+                self._gradient_lut = _bake_gradient_lut(gradient)
+        for section in ("distribution", "dynamics"):
+            keys = changed.get(section, ())
+            if "*" in keys or not self._MODIFIER_KEYS.isdisjoint(keys):
+                self._update_modifier_flags()
+                break
 
     def _update_modifier_flags(self) -> None:
-        dist = self.state.get("distribution", {})
+        dist = self._frame_params.get("distribution", {})
         if not isinstance(dist, Mapping):
             dist = {}
-        dyn = self.state.get("dynamics", {})
+        dyn = self._frame_params.get("dynamics", {})
         if not isinstance(dyn, Mapping):
             dyn = {}
 
@@ -734,67 +2785,92 @@ class DyxtenEngine:
     def _remove_imprint_by_id(self, imprint_id: Optional[int]) -> None:
         if imprint_id is None:
             return
-        self._imprints = [entry for entry in self._imprints if entry[5] != imprint_id]
+        self._imprints.remove(imprint_id)
+
+    def _reset_prev_center_dist(self) -> None:
+        count = len(self.base_points)
+        prev = self._prev_center_dist
+        if len(prev) != count:
+            self._prev_center_dist = prev = array("d", bytes(count * prev.itemsize))
+        nan = float("nan")
+        for i in range(count):
+            prev[i] = nan
 
     def reset_visual_state(self) -> None:
         """Clear transient visual elements while preserving configuration."""
 
+        self._post(self._reset_visual_state)
+
+    def _reset_visual_state(self) -> None:
         self._imprints.clear()
-        self._imprint_counter = 0
         self._orbiters.clear()
-        self._orbiters_draw.clear()
-        self._last_particle_positions.clear()
+        # Nouvelle liste : l'ancienne peut encore être dessinée.
+        self._orbiters_draw = []
+        self._reset_prev_center_dist()
         self._particle_traces.clear()
         self._start_time = time.perf_counter()
-        self._last_ms = 0.0
+        self._clock.reset()
         self.rebuild_geometry()
 
     def set_params(self, payload: Mapping[str, object]) -> None:
+        """Merge a full state or a partial change set (``{section: {key: value}}``)."""
+
         if not isinstance(payload, Mapping):
             return
-        
-        # Vérifier si on doit recalculer la géométrie
-        needs_rebuild = False
-        if any(key in payload for key in ("geometry", "distribution", "system")):
-            # Construire une clé de cache pour les paramètres de géométrie
-            geo = payload.get("geometry", self.state.get("geometry", {}))
-            dist = payload.get("distribution", self.state.get("distribution", {}))
-            system = payload.get("system", self.state.get("system", {}))
-            
-            if not isinstance(geo, Mapping):
-                geo = {}
-            if not isinstance(dist, Mapping):
-                dist = {}
-            if not isinstance(system, Mapping):
-                system = {}
-            
-            # Clés qui affectent la géométrie
-            geo_key = (
-                str(geo.get("topology", "")),
-                str(geo.get("N", "")),
-                str(geo.get("R", "")),
-                str(geo.get("lat", "")),
-                str(geo.get("lon", "")),
-                str(dist.get("dmin", "")),
-                str(system.get("Nmax", "")),
-            )
-            
-            if geo_key != self._last_geometry_params:
-                needs_rebuild = True
-                self._last_geometry_params = geo_key
-        
-        self.merge_state(payload)
-        
-        if needs_rebuild:
+
+        changed = self.merge_state(payload)
+
+        # Ne recalculer la géométrie que si un paramètre lu par la topologie a changé
+        if (
+            changed.get("geometry")
+            or "dmin" in changed.get("distribution", ())
+            or "Nmax" in changed.get("system", ())
+        ):
+            self._post(self._rebuild_geometry_if_stale)
+
+    def _rebuild_geometry_if_stale(self) -> None:
+        if self._geometry_cache_key() != self._last_geometry_params:
             self.rebuild_geometry()
 
     # ---------------------------------------------------------------- geometry
+    def _geometry_cache_key(self) -> str:
+        """Digest of the topology and every resolved parameter affecting the base points.
+
+        JSON topologies contribute the parameters declared in their
+        definition (``meta.parameters`` and the default geometry keys), other
+        generators the whole ``geometry`` section.  ``distribution.dmin`` and
+        ``system.Nmax`` are always included.
+        """
+
+        geo = self._frame_params.get("geometry", {})
+        if not isinstance(geo, Mapping):
+            geo = {}
+        dist = self._frame_params.get("distribution", {})
+        if not isinstance(dist, Mapping):
+            dist = {}
+        system = self._frame_params.get("system", {})
+        if not isinstance(system, Mapping):
+            system = {}
+        topology = str(geo.get("topology", "uv_sphere"))
+        declared = self._GEOMETRY_PARAMETERS.get(topology)
+        if declared is not None:
+            params = {name: _cache_value(geo.get(name, default)) for name, default in declared}
+        else:
+            params = {
+                str(k): _cache_value(v)
+                for k, v in geo.items()
+                if k not in {"code", "topology", "uses"}
+            }
+        payload = [topology, params, _cache_value(dist.get("dmin", 0.0)), _cache_value(system.get("Nmax", 0))]
+        blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=repr)
+        return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
     def rebuild_geometry(self) -> None:
-        geo = self.state.get("geometry", {})
-        system = self.state.get("system", {})
+        geo = _thaw_state_value(self._frame_params.get("geometry", {}))
+        system = self._frame_params.get("system", {})
         if not isinstance(system, Mapping):
             system = {}
-        orbit_cfg = self.state.get("orbit", {})
+        orbit_cfg = self._frame_params.get("orbit", {})
         if not isinstance(orbit_cfg, Mapping):
             orbit_cfg = {}
 
@@ -803,45 +2879,217 @@ class DyxtenEngine:
                 return orbit_cfg.get(key, fallback)
             return system.get(key, fallback)
         topology = geo.get("topology", "uv_sphere")
-        generator = self._GEOMETRY_GENERATORS.get(topology, _gen_uv_sphere)
         cap = int(system.get("Nmax", 0) or 0)
+        dist = self._frame_params.get("distribution", {})
+        dmin = float(dist.get("dmin", 0.0) or 0.0)
+        try:
+            cache_mb = float(system.get("geometryCacheMB", 64) or 0.0)
+        except (TypeError, ValueError):
+            cache_mb = 64.0
+        self._geometry_cache.set_budget(int(cache_mb * (1 << 20)))
+        key = self._geometry_cache_key()
+        self._last_geometry_params = key
+        cached = self._geometry_cache.get(key)
+        if cached is not None:
+            self._cancel_pending_geometry()
+            self._swap_geometry(cached[0], cached[1], topology, cap, dmin)
+            return
+        # Les topologies JSON sont calculées hors du thread GUI ; les points
+        # actuels restent animés jusqu'à l'arrivée du résultat.
+        if (
+            self.base_points
+            and topology in self._GEOMETRY_PARAMETERS
+            and self._geometry_worker_enabled()
+            and _JSON_TOPOLOGY_LIBRARY.generator(topology) is not None
+        ):
+            if self._submit_geometry(key, topology, geo, cap, dmin):
+                return
+        self._cancel_pending_geometry()
+        generator = self._GEOMETRY_GENERATORS.get(topology, _gen_uv_sphere)
+        before = implicit_sampling_stats()
         try:
             points = generator(geo, cap)
         except Exception:
             points = _gen_uv_sphere(geo, cap)
+        self._install_geometry(key, topology, geo, cap, dmin, points, implicit_sampling_stats_since(before))
+
+    def _install_geometry(
+        self,
+        key: str,
+        topology: str,
+        geo: Mapping[str, object],
+        cap: int,
+        dmin: float,
+        points: Sequence[Point3D],
+        sampling: Optional[Mapping[str, ImplicitSamplingStats]] = None,
+        *,
+        prepared: bool = False,
+    ) -> None:
+        """Centre freshly generated points, cache them and make them current.
+
+        ``sampling`` holds the implicit-surface statistics of the run that
+        produced ``points``; they are appended to the debug line.
+        ``prepared`` marks points already centred and thinned by the worker.
+        """
+
+        if not points and topology != "uv_sphere":
+            # Générateur sans résultat : sphère UV plutôt qu'une vue vide
+            self._debug("rebuild_geometry: topology=%s produced 0 points, using uv_sphere" % topology)
+            try:
+                points = _gen_uv_sphere(geo, cap)
+            except Exception:
+                points = []
+            prepared = False
         if not points:
             self.base_points = []
+            self._base_array = None
+            self._seed_attrs = _SeedAttributes(0)
+            self._keep_cache = None
             if self._last_base_count != 0:
                 self._debug(
                     "rebuild_geometry produced 0 points (topology=%s, cap=%s, geo=%s)" % (topology, cap or "none", dict(geo))
                 )
                 self._last_base_count = 0
             return
-        cx = sum(p.x for p in points) / len(points)
-        cy = sum(p.y for p in points) / len(points)
-        cz = sum(p.z for p in points) / len(points)
-        centered = [Point3D(p.x - cx, p.y - cy, p.z - cz, idx) for idx, p in enumerate(points)]
-        dist = self.state.get("distribution", {})
-        dmin = float(dist.get("dmin", 0.0) or 0.0)
-        if dmin > 0:
-            centered = _enforce_min_distance(centered, dmin)
+        if prepared:
+            centered = list(points)
+        else:
+            coords = center_and_thin([(p.x, p.y, p.z) for p in points], dmin)
+            centered = [Point3D(x, y, z, idx) for idx, (x, y, z) in enumerate(coords)]
+        if np is not None:
+            base_array = np.array([(p.x, p.y, p.z) for p in centered], dtype=np.float64).reshape(-1, 3)
+        else:
+            base_array = None
+        # Les points mis en cache sont partagés : ils ne doivent jamais être modifiés
+        self._geometry_cache.put(key, centered, base_array)
+        self._swap_geometry(centered, base_array, topology, cap, dmin, sampling)
+
+    def _swap_geometry(
+        self,
+        centered: List[Point3D],
+        base_array: object,
+        topology: str,
+        cap: int,
+        dmin: float,
+        sampling: Optional[Mapping[str, ImplicitSamplingStats]] = None,
+    ) -> None:
         self.base_points = centered
+        self._base_array = base_array
+        if self._seed_attrs.count != len(centered):
+            self._seed_attrs = _SeedAttributes(len(centered))
+        self._keep_cache = None
         self._particle_traces.clear()
-        self._last_particle_positions.clear()
+        self._reset_prev_center_dist()
         count = len(centered)
-        if count != self._last_base_count:
-            self._debug(
-                "rebuild_geometry generated %d points (topology=%s, cap=%s, dmin=%s)"
-                % (count, topology, cap or "none", dmin)
+        if count != self._last_base_count or sampling:
+            message = "rebuild_geometry generated %d points (topology=%s, cap=%s, dmin=%s)" % (
+                count,
+                topology,
+                cap or "none",
+                dmin,
             )
+            if sampling:
+                message += " sampling=" + _format_sampling_stats(sampling)
+            self._debug(message)
             self._last_base_count = count
 
+    # ------------------------------------------------------------ geometry worker
+    def _geometry_worker_enabled(self) -> bool:
+        """``system.geometryWorker`` (default on); ``DYXTEN_GEOMETRY_WORKER=0`` forces it off."""
+
+        flag = os.environ.get("DYXTEN_GEOMETRY_WORKER", "").strip().lower()
+        if flag in {"0", "false", "no", "off"}:
+            return False
+        system = self._frame_params.get("system", {})
+        if not isinstance(system, Mapping):
+            return True
+        return bool(system.get("geometryWorker", True))
+
+    def _submit_geometry(
+        self,
+        key: str,
+        topology: str,
+        geo: Mapping[str, object],
+        cap: int,
+        dmin: float,
+        *,
+        retried: bool = False,
+    ) -> bool:
+        pending = self._pending_geometry
+        if pending is not None and pending.key == key and not pending.future.cancelled():
+            return True
+        self._cancel_pending_geometry()
+        snapshot = {k: v for k, v in geo.items() if isinstance(k, str) and k not in {"code", "uses"}}
+        try:
+            if self._geometry_executor is None:
+                # "spawn" : ne pas dupliquer l'état Qt du processus parent
+                workers = max(1, min(2, (os.cpu_count() or 1) - 1))
+                self._geometry_executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            future = self._geometry_executor.submit(generate_topology, topology, snapshot, cap, dmin)
+        except Exception:
+            # Pool indisponible (ou cassé) : repli sur la génération synchrone
+            self.shutdown_workers()
+            return False
+        self._pending_geometry = _PendingGeometry(key, topology, snapshot, cap, dmin, future, retried)
+        return True
+
+    def _cancel_pending_geometry(self) -> None:
+        pending = self._pending_geometry
+        self._pending_geometry = None
+        if pending is not None:
+            # Sans effet si le job a déjà démarré : son résultat sera ignoré
+            pending.future.cancel()
+
+    def _poll_geometry(self) -> None:
+        """Swap in the worker result once it is available (called from :meth:`step`)."""
+
+        pending = self._pending_geometry
+        if pending is None or not pending.future.done():
+            return
+        self._pending_geometry = None
+        if pending.key != self._last_geometry_params or pending.future.cancelled():
+            return
+        try:
+            flat, sampling = pending.future.result()
+        except Exception as exc:
+            # Jamais de génération dans le thread GUI : un pool perdu est
+            # relancé une fois, sinon les points actuels restent affichés.
+            if isinstance(exc, BrokenExecutor):
+                self.shutdown_workers()
+                if not pending.retried and self._submit_geometry(
+                    pending.key, pending.topology, pending.geo, pending.cap, pending.dmin, retried=True
+                ):
+                    return
+            self._debug(
+                "rebuild_geometry worker failed (topology=%s): %r; keeping %d current points"
+                % (pending.topology, exc, len(self.base_points))
+            )
+            return
+        # Statistiques relevées dans le processus fils
+        record_implicit_sampling_stats(sampling)
+        points = [Point3D(flat[i], flat[i + 1], flat[i + 2], i // 3) for i in range(0, len(flat) - 2, 3)]
+        self._install_geometry(
+            pending.key, pending.topology, pending.geo, pending.cap, pending.dmin, points, sampling, prepared=True
+        )
+
+    def shutdown_workers(self) -> None:
+        """Stop the geometry worker pool; queued jobs are cancelled."""
+
+        self._cancel_pending_geometry()
+        executor = self._geometry_executor
+        self._geometry_executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     # ---------------------------------------------------------------- animation helpers
     def _apply_point_modifiers(self, base: Point3D, seed: int, now_ms: float) -> Point3D:
         if not self._modifiers_active:
             return base
 
-        g = self.state.get("geometry", {})
+        g = self._frame_params.get("geometry", {})
         R = float(g.get("R", 1.0) or 1.0)
         x, y, z = base.x, base.y, base.z
 
@@ -898,9 +3146,8 @@ class DyxtenEngine:
 
     def _keep_point(self, point: Point3D, seed: int, now_ms: float) -> bool:
         del now_ms
-        dist = self.state.get("distribution", {})
-        mode = dist.get("densityMode") or dist.get("pr") or "uniform"
-        g = self.state.get("geometry", {})
+        mode = self._density_mode()
+        g = self._frame_params.get("geometry", {})
         R = float(g.get("R", 1.0) or 1.0)
         weight = 1.0
         if mode == "centered":
@@ -918,7 +3165,62 @@ class DyxtenEngine:
             return False
         if weight >= 1:
             return True
-        return _rand_for_index(seed + 1) <= weight
+        return self._seed_attrs.keep_rand[seed] <= weight
+
+    def _density_mode(self) -> str:
+        dist = self._frame_params.get("distribution", {})
+        return dist.get("densityMode") or dist.get("pr") or "uniform"
+
+    def _lod_subset(self) -> Optional[Tuple[List[int], object]]:
+        """Seeds projected at the governor's level, as a list and an array.
+
+        Points are taken by increasing ``lod_rand``, so each subset contains
+        the smaller ones and a level change only adds or removes points.
+        Returns ``None`` at full detail.
+        """
+
+        count = len(self.base_points)
+        budget = self.quality.budget(count)
+        if budget != self._lod_budget:
+            # Les points réapparus n'ont plus de distance précédente valable.
+            self._lod_budget = budget
+            self._reset_prev_center_dist()
+        if budget >= count:
+            return None
+        key = (count, budget)
+        cached = self._lod_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        if np is not None:
+            ranks = self._seed_attrs.view("lod_rand")
+            seeds_array = np.sort(np.argsort(ranks, kind="stable")[:budget])
+            seeds = seeds_array.tolist()
+        else:
+            ranks = self._seed_attrs.lod_rand
+            seeds = sorted(sorted(range(count), key=ranks.__getitem__)[:budget])
+            seeds_array = None
+        self._lod_cache = (key, seeds, seeds_array)
+        return seeds, seeds_array
+
+    def _static_keep_mask(self, mode: str) -> array:
+        """Keep mask of the unmodified base points for density ``mode``.
+
+        Without point modifiers the density weights only depend on the base
+        positions and ``R``, so the mask is computed once per geometry.
+        """
+
+        R = float(self._frame_params.get("geometry", {}).get("R", 1.0) or 1.0)
+        key = (mode, R)
+        cached = self._keep_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if self._base_array is not None:
+            seeds = np.arange(len(self._base_array), dtype=np.int64)
+            mask = array("b", self._keep_mask_array(self._base_array, seeds).astype(np.int8).tobytes())
+        else:
+            mask = array("b", (self._keep_point(base, idx, 0.0) for idx, base in enumerate(self.base_points)))
+        self._keep_cache = (key, mask)
+        return mask
 
     def update_donut_layout(
         self,
@@ -931,15 +3233,19 @@ class DyxtenEngine:
     ) -> None:
         """Store the button centres provided by the overlay layer."""
 
+        # La révision change après la nouvelle disposition : le thread de
+        # simulation ne peut pas mettre en cache l'ancienne sous la nouvelle clé.
         if width <= 0 or height <= 0:
             self._donut_layout = []
             self._donut_button_colors = []
+            self._donut_revision += 1
             return
 
         center_list = list(centers)
         if not center_list:
             self._donut_layout = []
             self._donut_button_colors = []
+            self._donut_revision += 1
             return
 
         radius_list: List[Optional[float]] = []
@@ -964,6 +3270,7 @@ class DyxtenEngine:
             normalized.append((clamped_x / w, clamped_y / h, radius_px))
 
         self._donut_layout = normalized
+        self._donut_revision += 1
 
         color_entries = list(colors) if colors is not None else []
 
@@ -1002,6 +3309,17 @@ class DyxtenEngine:
                 return QtGui.QColor(color)
         return None
 
+    def _donut_orbits(self, width: int, height: int) -> _DonutOrbits:
+        """Cached :meth:`_compute_donut_orbits` result with its lookup table."""
+
+        key = (int(width), int(height), self._donut_revision)
+        cached = self._donut_orbits_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        orbits = _DonutOrbits(*self._compute_donut_orbits(width, height))
+        self._donut_orbits_cache = (key, orbits)
+        return orbits
+
     def _compute_donut_orbits(
         self, width: int, height: int
     ) -> Tuple[List[Tuple[float, float]], List[float], float]:
@@ -1034,7 +3352,7 @@ class DyxtenEngine:
 
             return centers, radii, fallback_radius
 
-        donut = self.state.get("donut", {})
+        donut = self._frame_params.get("donut", {})
         if not isinstance(donut, Mapping):
             donut = default_donut_config()
         buttons = donut.get("buttons")
@@ -1057,25 +3375,342 @@ class DyxtenEngine:
         if radius <= 0 or count <= 0:
             fallback_radius = max(12.0, min(width, height) * 0.05)
         else:
-            spacing = (2.0 * math.pi * radius) / count
-            fallback_radius = clamp(spacing * 0.25, 10.0, max(18.0, spacing * 0.65))
-        radii = [fallback_radius for _ in range(len(centers))]
-        return centers, radii, fallback_radius
+            spacing = (2.0 * math.pi * radius) / count
+            fallback_radius = clamp(spacing * 0.25, 10.0, max(18.0, spacing * 0.65))
+        radii = [fallback_radius for _ in range(len(centers))]
+        return centers, radii, fallback_radius
+
+    def _compute_phase_factor(self, point: Point3D, idx: int) -> float:
+        dyn = self._frame_params.get("dynamics", {})
+        mode = dyn.get("rotPhaseMode", "none")
+        if mode == "by_index":
+            if len(self.base_points) <= 1:
+                return 0.0
+            return idx / (len(self.base_points) - 1)
+        if mode == "by_radius":
+            g = self._frame_params.get("geometry", {})
+            R = float(g.get("R", 1.0) or 1.0)
+            return clamp01(math.sqrt(point.x * point.x + point.z * point.z) / max(1e-6, R))
+        if mode == "random":
+            return self._seed_attrs.phase_rand[idx]
+        return 0.0
+
+    # ---------------------------------------------------------------- array helpers
+    def _donut_gravity_array(
+        self,
+        projection: "ProjectedPoints",
+        donut: _DonutOrbits,
+        now: float,
+        cx: float,
+        cy: float,
+        radius_red: float,
+        outer_span: float,
+        falloff: float,
+        strength: float,
+        ring_offset: float,
+        speed_multiplier: float,
+    ):
+        """Button attraction of every projected point in one numpy pass.
+
+        Returns ``(sx, sy, orbit_x, orbit_y, pull)`` lists; points with a zero
+        pull keep their projected position.
+        """
+
+        seeds = np.asarray(projection[0], dtype=np.intp)
+        sx = np.asarray(projection[1], dtype=np.float64)
+        sy = np.asarray(projection[2], dtype=np.float64)
+        outside = np.hypot(sx - cx, sy - cy) - radius_red
+        progress = np.clip(np.clip(outside / outer_span, 0.0, 1.0) ** falloff, 0.0, 1.0)
+        pull = np.clip(progress * strength, 0.0, 1.0)
+        pull[outside <= 0.0] = 0.0
+        nearest = donut.nearest_array(sx, sy)
+        centers = np.asarray(donut.centers, dtype=np.float64)
+        speed = speed_multiplier * (0.6 + 1.2 * self._seed_attrs.view("orbit_speed")[seeds])
+        angle = self._seed_attrs.view("orbit_phase")[seeds] * 2 * math.pi + now * 0.001 * speed * 2 * math.pi
+        jitter = 1.0 + 0.2 * (self._seed_attrs.view("orbit_jitter")[seeds] - 0.5)
+        target = np.maximum(1.0, donut._orbit_r[nearest] + ring_offset)
+        orbit_r = np.maximum(1.0, target * jitter)
+        orbit_x = centers[nearest, 0] + np.cos(angle) * orbit_r
+        orbit_y = centers[nearest, 1] + np.sin(angle) * orbit_r
+        return (
+            (sx + (orbit_x - sx) * pull).tolist(),
+            (sy + (orbit_y - sy) * pull).tolist(),
+            orbit_x.tolist(),
+            orbit_y.tolist(),
+            pull.tolist(),
+        )
+
+    def _apply_point_modifiers_array(self, base, now_ms: float):
+        """Array version of :meth:`_apply_point_modifiers` (same operation order)."""
+
+        if not self._modifiers_active:
+            return base
+
+        g = self._frame_params.get("geometry", {})
+        R = float(g.get("R", 1.0) or 1.0)
+        bx = base[:, 0]
+        by = base[:, 1]
+        bz = base[:, 2]
+        x = bx.copy()
+        y = by.copy()
+        z = bz.copy()
+
+        noise_warp = self._mod_noise_warp
+        if noise_warp:
+            amp = noise_warp * R * 0.4
+            freq = 1.3
+            anim = now_ms * 0.0006
+            nx = _value_noise3_array((bx + anim) * freq, (by - anim) * freq, (bz + 2 + anim) * freq)
+            ny = _value_noise3_array((bx - anim) * freq, (by + anim) * freq, (bz - anim) * freq)
+            nz = _value_noise3_array((bx + anim * 0.5) * freq, (by + 2 * anim) * freq, (bz - anim * 0.25) * freq)
+            x += amp * (nx * 2 - 1)
+            y += amp * (ny * 2 - 1)
+            z += amp * (nz * 2 - 1)
+
+        flow = self._mod_field_flow
+        if flow:
+            angle = (flow * 0.4 * now_ms * 0.001) + (flow * 0.3 * (y / max(1e-6, R)))
+            cos_a = np.cos(angle)
+            sin_a = np.sin(angle)
+            x, z = cos_a * x - sin_a * z, sin_a * x + cos_a * z
+
+        repel = self._mod_repel_force
+        if repel:
+            r = np.sqrt(x * x + y * y + z * z)
+            r[r == 0.0] = 1.0
+            diff = R - r
+            k = repel * 0.6
+            x = x + diff * k * (x / r)
+            y = y + diff * k * (y / r)
+            z = z + diff * k * (z / r)
+
+        pulse = self._mod_density_pulse
+        if pulse:
+            scale = 1 + 0.3 * pulse * math.sin(now_ms * 0.001 * 2 * math.pi)
+            x = x * scale
+            y = y * scale
+            z = z * scale
+
+        if self._mod_orient_x:
+            ox = to_rad(self._mod_orient_x)
+            cos_x, sin_x = math.cos(ox), math.sin(ox)
+            y, z = cos_x * y - sin_x * z, sin_x * y + cos_x * z
+        if self._mod_orient_y:
+            oy = to_rad(self._mod_orient_y)
+            cos_y, sin_y = math.cos(oy), math.sin(oy)
+            x, z = cos_y * x + sin_y * z, -sin_y * x + cos_y * z
+        if self._mod_orient_z:
+            oz = to_rad(self._mod_orient_z)
+            cos_z, sin_z = math.cos(oz), math.sin(oz)
+            x, y = cos_z * x - sin_z * y, sin_z * x + cos_z * y
+
+        return np.column_stack((x, y, z))
+
+    def _keep_mask_array(self, points, seeds):
+        """Array version of :meth:`_keep_point`; returns a boolean mask."""
+
+        mode = self._density_mode()
+        if mode not in _DENSITY_MODES:
+            return None
+        g = self._frame_params.get("geometry", {})
+        R = float(g.get("R", 1.0) or 1.0)
+        x = points[:, 0]
+        y = points[:, 1]
+        z = points[:, 2]
+        if mode == "centered":
+            r_norm = np.sqrt(x * x + y * y + z * z) / max(1e-6, R)
+            weight = np.exp(-3 * r_norm * r_norm)
+        elif mode == "edges":
+            r_norm = np.sqrt(x * x + y * y + z * z) / max(1e-6, R)
+            weight = np.clip(r_norm ** 0.75, 0.0, 1.0)
+        else:
+            weight = np.clip(_value_noise3_array(x * 1.6 + 11.1, y * 1.6 + 22.2, z * 1.6 + 33.3), 0.0, 1.0)
+        weight = np.clip(weight, 0.0, 1.0)
+        return (weight >= 1.0) | ((weight > 0.0) & (self._seed_attrs.view("keep_rand")[seeds] <= weight))
 
-    def _compute_phase_factor(self, point: Point3D, idx: int) -> float:
-        dyn = self.state.get("dynamics", {})
+    def _phase_factor_array(self, points, seeds):
+        """Array version of :meth:`_compute_phase_factor`."""
+
+        dyn = self._frame_params.get("dynamics", {})
         mode = dyn.get("rotPhaseMode", "none")
         if mode == "by_index":
             if len(self.base_points) <= 1:
-                return 0.0
-            return idx / (len(self.base_points) - 1)
+                return np.zeros(len(seeds), dtype=np.float64)
+            return seeds / (len(self.base_points) - 1)
         if mode == "by_radius":
-            g = self.state.get("geometry", {})
+            g = self._frame_params.get("geometry", {})
             R = float(g.get("R", 1.0) or 1.0)
-            return clamp01(math.sqrt(point.x * point.x + point.z * point.z) / max(1e-6, R))
+            x = points[:, 0]
+            z = points[:, 2]
+            return np.clip(np.sqrt(x * x + z * z) / max(1e-6, R), 0.0, 1.0)
         if mode == "random":
-            return _rand_for_index(idx, 77)
-        return 0.0
+            return self._seed_attrs.view("phase_rand")[seeds]
+        return np.zeros(len(seeds), dtype=np.float64)
+
+    # ---------------------------------------------------------------- projection
+    def _project_scalar(self, frame: _ProjectionFrame) -> ProjectedPoints:
+        """Reference projection pass, one point at a time."""
+
+        now = frame.now
+        indices: List[int] = []
+        out_sx: List[float] = []
+        out_sy: List[float] = []
+        out_depth: List[float] = []
+        out_x: List[float] = []
+        out_y: List[float] = []
+        out_z: List[float] = []
+        density_mode = self._density_mode()
+        filtered = density_mode in _DENSITY_MODES
+        keep_mask = None
+        if filtered and not self._modifiers_active:
+            keep_mask = self._static_keep_mask(density_mode)
+        subset = self._lod_subset()
+        base_points = self.base_points
+        if subset is None:
+            candidates = enumerate(base_points)
+        else:
+            candidates = ((idx, base_points[idx]) for idx in subset[0])
+        for idx, base in candidates:
+            if keep_mask is not None:
+                if not keep_mask[idx]:
+                    continue
+                mod = base
+            else:
+                mod = self._apply_point_modifiers(base, idx, now)
+                if filtered and not self._keep_point(mod, idx, now):
+                    continue
+            phase = self._compute_phase_factor(mod, idx)
+            pulse = 1 + frame.pulse_amp * math.sin(frame.pulse_w * now * 0.001 + frame.pulse_phi + 2 * math.pi * phase)
+
+            ang_x = frame.rot_x * (now * 0.001) + frame.rot_phase_amp * phase
+            ang_y = frame.rot_y * (now * 0.001) + frame.rot_phase_amp * phase
+            ang_z = frame.rot_z * (now * 0.001) + frame.rot_phase_amp * phase
+
+            cos_x, sin_x = math.cos(ang_x), math.sin(ang_x)
+            cos_y, sin_y = math.cos(ang_y), math.sin(ang_y)
+            cos_z, sin_z = math.cos(ang_z), math.sin(ang_z)
+
+            x = mod.x * pulse
+            y = mod.y * pulse
+            z = mod.z * pulse
+
+            Xz = cos_z * x - sin_z * y
+            Yz = sin_z * x + cos_z * y
+            Zz = z
+
+            Xx = Xz
+            Yx = cos_x * Yz - sin_x * Zz
+            Zx = sin_x * Yz + cos_x * Zz
+
+            X = cos_y * Xx + sin_y * Zx
+            Z = -sin_y * Xx + cos_y * Zx
+            Y = Yx
+
+            # camera transformation
+            Xc = frame.cos_theta * X - frame.sin_theta * Z
+            Zc = frame.sin_theta * X + frame.cos_theta * Z
+            Yc = Y
+
+            Yc2 = frame.cos_height * Yc - frame.sin_height * Zc
+            Zc2 = frame.sin_height * Yc + frame.cos_height * Zc
+
+            Xc3 = frame.cos_tilt * Xc - frame.sin_tilt * Yc2
+            Yc3 = frame.sin_tilt * Xc + frame.cos_tilt * Yc2
+            Zc3 = Zc2
+
+            Zc3 += frame.cam_radius
+            if Zc3 <= 0.01:
+                continue
+            inv = frame.focal / Zc3
+            sx = frame.cx + Xc3 * inv
+            sy = frame.cy + Yc3 * inv
+            if not (math.isfinite(sx) and math.isfinite(sy)):
+                continue
+            indices.append(idx)
+            out_sx.append(sx)
+            out_sy.append(sy)
+            out_depth.append(Zc3)
+            out_x.append(X)
+            out_y.append(Y)
+            out_z.append(Z)
+        return indices, out_sx, out_sy, out_depth, out_x, out_y, out_z
+
+    def _project_array(self, frame: _ProjectionFrame) -> ProjectedPoints:
+        """Batched projection pass producing the same values as :meth:`_project_scalar`."""
+
+        now = frame.now
+        base = self._base_array
+        subset = self._lod_subset()
+        if subset is None:
+            seeds = np.arange(len(base), dtype=np.int64)
+        else:
+            seeds = subset[1]
+            base = base[seeds]
+        mod = self._apply_point_modifiers_array(base, now)
+        density_mode = self._density_mode()
+        if density_mode not in _DENSITY_MODES:
+            keep = None
+        elif self._modifiers_active:
+            keep = self._keep_mask_array(mod, seeds)
+        else:
+            keep = np.frombuffer(self._static_keep_mask(density_mode), dtype=np.int8).astype(bool)
+            if subset is not None:
+                keep = keep[seeds]
+        self.profiler.mark(STAGE_MODIFIERS)
+        if keep is not None:
+            mod = mod[keep]
+            seeds = seeds[keep]
+        phase = self._phase_factor_array(mod, seeds)
+        pulse = 1 + frame.pulse_amp * np.sin(frame.pulse_w * now * 0.001 + frame.pulse_phi + 2 * math.pi * phase)
+
+        ang_x = frame.rot_x * (now * 0.001) + frame.rot_phase_amp * phase
+        ang_y = frame.rot_y * (now * 0.001) + frame.rot_phase_amp * phase
+        ang_z = frame.rot_z * (now * 0.001) + frame.rot_phase_amp * phase
+        cos_x, sin_x = np.cos(ang_x), np.sin(ang_x)
+        cos_y, sin_y = np.cos(ang_y), np.sin(ang_y)
+        cos_z, sin_z = np.cos(ang_z), np.sin(ang_z)
+
+        x = mod[:, 0] * pulse
+        y = mod[:, 1] * pulse
+        z = mod[:, 2] * pulse
+
+        Xz = cos_z * x - sin_z * y
+        Yz = sin_z * x + cos_z * y
+        Zz = z
+
+        Xx = Xz
+        Yx = cos_x * Yz - sin_x * Zz
+        Zx = sin_x * Yz + cos_x * Zz
+
+        X = cos_y * Xx + sin_y * Zx
+        Z = -sin_y * Xx + cos_y * Zx
+        Y = Yx
+
+        Xc = frame.cos_theta * X - frame.sin_theta * Z
+        Zc = frame.sin_theta * X + frame.cos_theta * Z
+        Yc = Y
+
+        Yc2 = frame.cos_height * Yc - frame.sin_height * Zc
+        Zc2 = frame.sin_height * Yc + frame.cos_height * Zc
+
+        Xc3 = frame.cos_tilt * Xc - frame.sin_tilt * Yc2
+        Yc3 = frame.sin_tilt * Xc + frame.cos_tilt * Yc2
+        Zc3 = Zc2 + frame.cam_radius
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            inv = frame.focal / Zc3
+            sx = frame.cx + Xc3 * inv
+            sy = frame.cy + Yc3 * inv
+        visible = (Zc3 > 0.01) & np.isfinite(sx) & np.isfinite(sy)
+        return (
+            seeds[visible].tolist(),
+            sx[visible].tolist(),
+            sy[visible].tolist(),
+            Zc3[visible].tolist(),
+            X[visible].tolist(),
+            Y[visible].tolist(),
+            Z[visible].tolist(),
+        )
 
     def marker_radii(self, width: int, height: int) -> Tuple[float, float, float]:
         del width, height
@@ -1102,8 +3737,8 @@ class DyxtenEngine:
         radius_yellow = min(radius_yellow, max_radius)
         radius_blue = min(radius_blue, max_radius)
 
-        system = self.state.get("system", {})
-        indicator_cfg = self.state.get("indicator")
+        system = self._frame_params.get("system", {})
+        indicator_cfg = self._frame_params.get("indicator")
         yellow_override_ratio: Optional[float] = None
         if isinstance(indicator_cfg, Mapping):
             raw_yellow = indicator_cfg.get("yellowCircleRatio")
@@ -1141,76 +3776,192 @@ class DyxtenEngine:
 
         return radius_red, radius_yellow, radius_blue
 
-    def _pick_color(self, item: RenderItem, now_ms: float) -> QtGui.QColor:
-        appearance = self.state.get("appearance", {})
+    def _prepare_palette(self, now_ms: float) -> None:
+        """Resolve the palette settings once per frame for :meth:`_pick_rgba`."""
+
+        appearance = self._frame_params.get("appearance", {})
         palette = appearance.get("palette", "uniform")
-        if palette == "uniform":
-            color = appearance.get("color", "#00C8FF")
-        elif palette == "gradient_radial":
-            dx = item.sx - self._width / 2
-            dy = item.sy - self._height / 2
-            radius = math.hypot(dx, dy)
+        self._palette_mode = palette
+        if palette in ("by_lat", "by_lon"):
+            base = float(appearance.get("h0", 0.0) or 0.0)
+            delta = float(appearance.get("dh", 0.0) or 0.0)
+            wave = float(appearance.get("wh", 0.0) or 0.0)
+            key = (base + wave * math.sin(now_ms * 0.001), delta)
+            if key != self._hsl_lut_key or self._hsl_lut is None:
+                self._hsl_lut = _bake_hsl_lut(key[0], delta)
+                self._hsl_lut_key = key
+        elif palette == "by_noise":
+            scale = max(0.05, float(appearance.get("noiseScale", 1.0) or 1.0))
+            speed = float(appearance.get("noiseSpeed", 0.0) or 0.0)
+            self._palette_noise = (scale, speed)
+        elif palette not in ("gradient_radial", "gradient_linear"):
+            self._palette_rgba = _qrgb_from_name(str(appearance.get("color", "#00C8FF")))
+
+    def _fill_noise_rgba(self, buf: FrameBuffer, now_ms: float) -> None:
+        """Array version of the ``by_noise`` branch of :meth:`_pick_rgba` for the whole buffer."""
+
+        count = buf.count
+        scale, speed = self._palette_noise
+        wx = np.frombuffer(buf.wx, dtype=np.float64)[:count]
+        wy = np.frombuffer(buf.wy, dtype=np.float64)[:count]
+        wz = np.frombuffer(buf.wz, dtype=np.float64)[:count]
+        t = np.clip(_value_noise3_array(wx * scale + speed * now_ms * 0.001, wy * scale, wz * scale), 0.0, 1.0)
+        lut = np.frombuffer(self._gradient_lut, dtype=np.uint32)
+        index = (t * (len(lut) - 1) + 0.5).astype(np.intp)
+        np.frombuffer(buf.rgba, dtype=np.uint32)[:count] = lut[index]
+
+    def _pick_rgba(self, sx: float, sy: float, wx: float, wy: float, wz: float, now_ms: float) -> int:
+        """Packed colour of one point; requires :meth:`_prepare_palette` for this frame."""
+
+        palette = self._palette_mode
+        last = PALETTE_LUT_SIZE - 1
+        if palette == "gradient_radial":
+            radius = math.hypot(sx - self._width / 2, sy - self._height / 2)
             max_radius = 0.5 * min(self._width, self._height)
-            color = _sample_gradient(self.gradient, clamp01(radius / max_radius))
+            t = clamp01(radius / max_radius)
         elif palette == "gradient_linear":
-            t = clamp01((item.sx - self._width * 0.25) / max(1.0, self._width * 0.5))
-            color = _sample_gradient(self.gradient, t)
-        elif palette == "by_lat":
-            theta, _ = _spherical_from_cartesian(item.world.x, item.world.y, item.world.z)
-            factor = (1 - theta / math.pi) * 2 - 1
-            color = self._hsl_from_params(factor, now_ms)
-        elif palette == "by_lon":
-            _, phi = _spherical_from_cartesian(item.world.x, item.world.y, item.world.z)
-            factor = (phi / (2 * math.pi)) * 2 - 1
-            color = self._hsl_from_params(factor, now_ms)
+            t = clamp01((sx - self._width * 0.25) / max(1.0, self._width * 0.5))
+        elif palette == "by_lat" or palette == "by_lon":
+            theta, phi = _spherical_from_cartesian(wx, wy, wz)
+            if palette == "by_lat":
+                t = 1 - theta / math.pi
+            else:
+                t = phi / (2 * math.pi)
+            return self._hsl_lut[int(clamp01(t) * last + 0.5)]
         elif palette == "by_noise":
-            ap = appearance
-            scale = max(0.05, float(ap.get("noiseScale", 1.0) or 1.0))
-            speed = float(ap.get("noiseSpeed", 0.0) or 0.0)
-            n = _value_noise3(
-                item.world.x * scale + speed * now_ms * 0.001,
-                item.world.y * scale,
-                item.world.z * scale,
-            )
-            color = _sample_gradient(self.gradient, n)
+            scale, speed = self._palette_noise
+            t = clamp01(_value_noise3(wx * scale + speed * now_ms * 0.001, wy * scale, wz * scale))
         else:
-            color = appearance.get("color", "#00C8FF")
-        qcolor = QtGui.QColor(color)
-        if not qcolor.isValid():
-            qcolor = QtGui.QColor("#00C8FF")
-        return qcolor
-
-    def _hsl_from_params(self, factor: float, now_ms: float) -> str:
-        ap = self.state.get("appearance", {})
-        base = float(ap.get("h0", 0.0) or 0.0)
-        delta = float(ap.get("dh", 0.0) or 0.0)
-        wave = float(ap.get("wh", 0.0) or 0.0)
-        hue = (base + delta * factor + wave * math.sin(now_ms * 0.001)) % 360
-        sat = clamp01(0.55 + 0.2 * factor)
-        light = clamp01(0.55 + 0.25 * factor)
-        r, g, b = _hsl_to_rgb(hue / 360.0, sat, light)
-        return _rgb_to_hex(r, g, b)
+            return self._palette_rgba
+        lut = self._gradient_lut
+        return lut[int(t * (len(lut) - 1) + 0.5)]
 
     # ---------------------------------------------------------------- main update
-    def step(self, width: int, height: int) -> List[RenderItem]:
+    def _evaluate_orbiter_trajectories(
+        self,
+        slots: List[int],
+        phase: int,
+        mode: str,
+        ease_mode: str,
+        ease_powers: Tuple[float, float],
+        settings: _TrajectorySettings,
+    ) -> None:
+        """Write into ``pool.sx``/``pool.sy`` the transition positions of ``slots``.
+
+        All slots share ``phase`` (``PHASE_OUT`` goes from the imprint to the
+        orbit, ``PHASE_BACK`` the other way) and therefore one trajectory
+        mode, so the group is evaluated in a single numpy pass when numpy is
+        available.
+        """
+
+        pool = self._orbiters
+        approach = phase == PHASE_OUT
+        paths: List[Optional[_TrailPath]] = [None] * len(slots)
+        if mode == "initial_path":
+            smoothing = settings.trail_smoothing
+            for i, slot in enumerate(slots):
+                cached = pool.path[slot]
+                if cached is None or cached[0] != (phase, smoothing):
+                    imprint = (pool.imprint_x[slot], pool.imprint_y[slot])
+                    orbit = (pool.pos_x[slot], pool.pos_y[slot])
+                    trail = pool.trail[slot] or []
+                    if approach:
+                        path = _TrailPath(imprint, trail[::-1], orbit, smoothing)
+                    else:
+                        path = _TrailPath(orbit, trail, imprint, smoothing)
+                    cached = ((phase, smoothing), path)
+                    pool.path[slot] = cached
+                paths[i] = cached[1]
+
+        ease_in, ease_out = ease_powers
+        if np is None:
+            for i, slot in enumerate(slots):
+                imprint_x = pool.imprint_x[slot]
+                imprint_y = pool.imprint_y[slot]
+                orbit_x = pool.pos_x[slot]
+                orbit_y = pool.pos_y[slot]
+                if approach:
+                    start_x, start_y, end_x, end_y = imprint_x, imprint_y, orbit_x, orbit_y
+                else:
+                    start_x, start_y, end_x, end_y = orbit_x, orbit_y, imprint_x, imprint_y
+                pool.sx[slot], pool.sy[slot] = _orbiter_trajectory_point(
+                    mode,
+                    start_x,
+                    start_y,
+                    end_x,
+                    end_y,
+                    _orbiter_ease(ease_mode, pool.t[slot], ease_in, ease_out),
+                    pool.center_x[slot],
+                    pool.center_y[slot],
+                    pool.orbit_radius[slot],
+                    settings,
+                    paths[i],
+                )
+            return
+
+        index = np.fromiter(slots, dtype=np.intp, count=len(slots))
+
+        def _column(name: str):
+            return np.frombuffer(getattr(pool, name), dtype=np.float64)[index]
+
+        imprint_x = _column("imprint_x")
+        imprint_y = _column("imprint_y")
+        orbit_x = _column("pos_x")
+        orbit_y = _column("pos_y")
+        if approach:
+            start_x, start_y, end_x, end_y = imprint_x, imprint_y, orbit_x, orbit_y
+        else:
+            start_x, start_y, end_x, end_y = orbit_x, orbit_y, imprint_x, imprint_y
+        xs, ys = _orbiter_trajectory_points(
+            mode,
+            start_x,
+            start_y,
+            end_x,
+            end_y,
+            _orbiter_ease_array(ease_mode, _column("t"), ease_in, ease_out),
+            _column("center_x"),
+            _column("center_y"),
+            _column("orbit_radius"),
+            settings,
+            paths,
+        )
+        np.frombuffer(pool.sx, dtype=np.float64)[index] = xs
+        np.frombuffer(pool.sy, dtype=np.float64)[index] = ys
+
+    def step(self, width: int, height: int) -> FrameBuffer:
+        prof = self.profiler
+        # Un seul instantané des paramètres pour toute la frame.
+        self._frame_params = self._params
+        self._run_pending()
+        self._poll_geometry()
+        buf = self._frame
+        buf.clear()
         if width <= 0 or height <= 0:
-            return []
-        now = self.now_ms
-        dt = min(0.1, max(0.0, (now - self._last_ms) / 1000.0))
-        self._last_ms = now
-        cam = self.state.get("camera", {})
+            return buf
+        system = self._frame_params.get("system", {})
+        if not isinstance(system, Mapping):
+            system = {}
+        clock = self._clock
+        clock.set_rate(max(0.0, _coerce_float(system.get("simRateHz"), 60.0)))
+        steps = clock.advance(self.now_ms)
+        dt = clock.dt
+        now = clock.render_ms
+        alpha = clock.alpha
+        cam = self._frame_params.get("camera", {})
         omega = float(cam.get("omegaDegPerSec", 0.0) or 0.0)
-        self._cam_theta_deg = (self._cam_theta_deg + omega * dt) % 360
+        for _ in range(steps):
+            self._cam_theta_deg = (self._cam_theta_deg + omega * dt) % 360
 
-        cam_theta = to_rad(self._cam_theta_deg)
+        # Angle rendu entre les deux derniers états de simulation.
+        if alpha < 1.0:
+            cam_theta = to_rad(self._cam_theta_deg - omega * dt * (1.0 - alpha))
+        else:
+            cam_theta = to_rad(self._cam_theta_deg)
         cam_height = to_rad(float(cam.get("camHeightDeg", 0.0) or 0.0))
         cam_tilt = to_rad(float(cam.get("camTiltDeg", 0.0) or 0.0))
         cam_radius = float(cam.get("camRadius", 3.2) or 3.2)
         fov = float(cam.get("fov", 600) or 600)
         fov = clamp(float(fov), 1.0, 5000.0)
-        system = self.state.get("system", {})
-        if not isinstance(system, Mapping):
-            system = {}
         raw_opacity_cfg = _coerce_float(system.get("orbiterOpacity"), 0.9)
         if raw_opacity_cfg > 1.0:
             orbiter_opacity_cfg = clamp01(raw_opacity_cfg / 100.0)
@@ -1219,6 +3970,11 @@ class DyxtenEngine:
         raw_size_cfg = _coerce_float(system.get("orbiterSizePx"), 2.5)
         orbiter_size_px_cfg = clamp(raw_size_cfg, 0.5, 20.0)
         orbiter_size_same_cfg = bool(system.get("orbiterSizeSameAsModel", True))
+        try:
+            self._max_orbiters = max(0, int(system.get("orbiterMax", self._max_orbiters)))
+        except (TypeError, ValueError):
+            pass
+        self._orbiters.reserve(self._max_orbiters)
 
         cos_theta = math.cos(cam_theta)
         sin_theta = math.sin(cam_theta)
@@ -1235,21 +3991,20 @@ class DyxtenEngine:
         radius_red, radius_yellow, radius_blue = self._compute_marker_radii(width, height)
         self._marker_radii = (radius_red, radius_yellow, radius_blue)
 
-        dyn = self.state.get("dynamics", {})
+        dyn = self._frame_params.get("dynamics", {})
         pulse_amp = float(dyn.get("pulseA", 0.0) or 0.0)
         pulse_w = float(dyn.get("pulseW", 0.0) or 0.0)
         pulse_phi = to_rad(float(dyn.get("pulsePhaseDeg", 0.0) or 0.0))
         rot_phase_amp = to_rad(float(dyn.get("rotPhaseDeg", 0.0) or 0.0))
 
-        projected: List[Dict[str, object]] = []
-        screen_grid: Dict[Tuple[int, int], List[Tuple[float, float]]] = {}
-        dist = self.state.get("distribution", {})
+        dist = self._frame_params.get("distribution", {})
         dmin_px = float(dist.get("dmin_px", 0.0) or 0.0)
         cell = max(1.0, dmin_px) if dmin_px > 0 else 1.0
-        donut_centers, donut_radii, fallback_orbit_radius = self._compute_donut_orbits(width, height)
-        donut_count = len(donut_centers)
+        donut = self._donut_orbits(width, height)
+        donut_centers = donut.centers
+        donut_count = len(donut)
 
-        orbit_cfg = self.state.get("orbit", {})
+        orbit_cfg = self._frame_params.get("orbit", {})
         if not isinstance(orbit_cfg, Mapping):
             orbit_cfg = {}
 
@@ -1310,254 +4065,220 @@ class DyxtenEngine:
             for seed, trace in list(self._particle_traces.items()):
                 self._particle_traces[seed] = deque(trace, maxlen=self._trail_max_points)
         if not self.base_points:
-            return []
-
-        for idx, base in enumerate(self.base_points):
-            mod = self._apply_point_modifiers(base, idx, now)
-            if not self._keep_point(mod, idx, now):
-                continue
-            phase = self._compute_phase_factor(mod, idx)
-            pulse = 1 + pulse_amp * math.sin(pulse_w * now * 0.001 + pulse_phi + 2 * math.pi * phase)
-
-            ang_x = to_rad(float(dyn.get("rotX", 0.0) or 0.0)) * (now * 0.001) + rot_phase_amp * phase
-            ang_y = to_rad(float(dyn.get("rotY", 0.0) or 0.0)) * (now * 0.001) + rot_phase_amp * phase
-            ang_z = to_rad(float(dyn.get("rotZ", 0.0) or 0.0)) * (now * 0.001) + rot_phase_amp * phase
-
-            cos_x, sin_x = math.cos(ang_x), math.sin(ang_x)
-            cos_y, sin_y = math.cos(ang_y), math.sin(ang_y)
-            cos_z, sin_z = math.cos(ang_z), math.sin(ang_z)
-
-            x = mod.x * pulse
-            y = mod.y * pulse
-            z = mod.z * pulse
-
-            Xz = cos_z * x - sin_z * y
-            Yz = sin_z * x + cos_z * y
-            Zz = z
-
-            Xx = Xz
-            Yx = cos_x * Yz - sin_x * Zz
-            Zx = sin_x * Yz + cos_x * Zz
-
-            X = cos_y * Xx + sin_y * Zx
-            Z = -sin_y * Xx + cos_y * Zx
-            Y = Yx
-
-            world_point = Point3D(X, Y, Z, idx)
-
-            # camera transformation
-            Xc = cos_theta * X - sin_theta * Z
-            Zc = sin_theta * X + cos_theta * Z
-            Yc = Y
-
-            Yc2 = cos_height * Yc - sin_height * Zc
-            Zc2 = sin_height * Yc + cos_height * Zc
+            return buf
+
+        frame = _ProjectionFrame(
+            now=now,
+            cos_theta=cos_theta,
+            sin_theta=sin_theta,
+            cos_height=cos_height,
+            sin_height=sin_height,
+            cos_tilt=cos_tilt,
+            sin_tilt=sin_tilt,
+            cam_radius=cam_radius,
+            focal=focal,
+            cx=cx,
+            cy=cy,
+            pulse_amp=pulse_amp,
+            pulse_w=pulse_w,
+            pulse_phi=pulse_phi,
+            rot_phase_amp=rot_phase_amp,
+            rot_x=to_rad(float(dyn.get("rotX", 0.0) or 0.0)),
+            rot_y=to_rad(float(dyn.get("rotY", 0.0) or 0.0)),
+            rot_z=to_rad(float(dyn.get("rotZ", 0.0) or 0.0)),
+        )
+        if self._array_backend_enabled():
+            projection = self._project_array(frame)
+        else:
+            projection = self._project_scalar(frame)
+        prof.mark(STAGE_PROJECTION)
+
+        buf.reserve(2 * len(projection[0]))
+        out_sx = buf.sx
+        out_sy = buf.sy
+        out_r = buf.r
+        out_depth = buf.depth
+        out_role = buf.role
+        out_seed = buf.seed
+        out_wx = buf.wx
+        out_wy = buf.wy
+        out_wz = buf.wz
+        out_gravity = buf.gravity
+        n = 0
+        px_size = float(self._frame_params.get("appearance", {}).get("px", 2.0) or 2.0)
+        radius = max(1.0, px_size)
+        seed_attrs = self._seed_attrs
+        gravity_on = donut_count > 0 and radius_red > 0.0
+        outer_span = max(1.0, radius_blue - radius_red)
+        # Attraction des boutons calculée d'un bloc pour toutes les particules.
+        pulled = None
+        if gravity_on and self._array_backend_enabled() and projection[0]:
+            pulled = self._donut_gravity_array(
+                projection,
+                donut,
+                now,
+                cx,
+                cy,
+                radius_red,
+                outer_span,
+                gravity_falloff,
+                gravity_strength,
+                ring_offset,
+                orbit_speed_multiplier,
+            )
 
-            Xc3 = cos_tilt * Xc - sin_tilt * Yc2
-            Yc3 = sin_tilt * Xc + cos_tilt * Yc2
-            Zc3 = Zc2
+        # Espacement minimal à l'écran : éclaircissement glouton dans l'ordre
+        # de projection, sur les positions avant attraction.
+        thinned = None
+        if dmin_px > 0 and projection[0]:
+            if self._array_backend_enabled():
+                coords = np.column_stack((projection[1], projection[2]))
+                thinned = thin_mask(coords, dmin_px, cell).tolist()
+            else:
+                thinned = thin_mask(list(zip(projection[1], projection[2])), dmin_px, cell)
 
-            Zc3 += cam_radius
-            if Zc3 <= 0.01:
-                continue
-            inv = focal / Zc3
-            sx = cx + Xc3 * inv
-            sy = cy + Yc3 * inv
-            if not (math.isfinite(sx) and math.isfinite(sy)):
+        for k, (idx, sx, sy, Zc3, X, Y, Z) in enumerate(zip(*projection)):
+            if thinned is not None and not thinned[k]:
                 continue
 
-            if dmin_px > 0:
-                ix = int(math.floor(sx / cell))
-                iy = int(math.floor(sy / cell))
-                keep = True
-                for dx in (-1, 0, 1):
-                    for dy in (-1, 0, 1):
-                        bucket = screen_grid.get((ix + dx, iy + dy))
-                        if not bucket:
-                            continue
-                        for px, py in bucket:
-                            if (sx - px) ** 2 + (sy - py) ** 2 < dmin_px ** 2:
-                                keep = False
-                                break
-                        if not keep:
-                            break
-                    if not keep:
-                        break
-                if not keep:
-                    continue
-                screen_grid.setdefault((ix, iy), []).append((sx, sy))
-
-            px_size = float(self.state.get("appearance", {}).get("px", 2.0) or 2.0)
-            radius = max(1.0, px_size)
-            dist_center = math.hypot(sx - cx, sy - cy)
             gravity_weight = 0.0
-            orbit_descriptor: Optional[Dict[str, float]] = None
-            if donut_count > 0 and radius_red > 0.0:
-                outer_span = max(1.0, radius_blue - radius_red)
+            sx_orbit = sy_orbit = 0.0
+            if pulled is not None:
+                gravity_weight = pulled[4][k]
+                if gravity_weight > 0.0:
+                    sx = pulled[0][k]
+                    sy = pulled[1][k]
+                    sx_orbit = pulled[2][k]
+                    sy_orbit = pulled[3][k]
+            elif gravity_on:
+                dist_center = math.hypot(sx - cx, sy - cy)
                 outside = dist_center - radius_red
                 if outside > 0.0:
                     progress = clamp01(outside / outer_span)
                     progress = clamp01(progress ** gravity_falloff)
                     pull = clamp01(progress * gravity_strength)
                     if pull > 0.0:
-                        nearest_idx = 0
-                        nearest_dist = float("inf")
-                        for btn_idx, (center_x, center_y) in enumerate(donut_centers):
-                            d = (sx - center_x) ** 2 + (sy - center_y) ** 2
-                            if d < nearest_dist:
-                                nearest_dist = d
-                                nearest_idx = btn_idx
+                        nearest_idx = donut.nearest(sx, sy)
                         center_x, center_y = donut_centers[nearest_idx]
-                        button_radius = 0.0
-                        if nearest_idx < len(donut_radii):
-                            button_radius = float(donut_radii[nearest_idx])
-                        if not math.isfinite(button_radius) or button_radius <= 0.0:
-                            button_radius = fallback_orbit_radius
-                        phase_seed = _rand_for_index(idx, 311)
-                        speed_seed = _rand_for_index(idx, 733)
+                        button_radius = donut.orbit_radii[nearest_idx]
+                        phase_seed = seed_attrs.orbit_phase[idx]
+                        speed_seed = seed_attrs.orbit_speed[idx]
                         base_speed = 0.6 + 1.2 * speed_seed
                         orbit_speed = orbit_speed_multiplier * base_speed
                         orbit_angle = phase_seed * 2 * math.pi + now * 0.001 * orbit_speed * 2 * math.pi
-                        jitter = 1.0 + 0.2 * (_rand_for_index(idx, 911) - 0.5)
+                        jitter = 1.0 + 0.2 * (seed_attrs.orbit_jitter[idx] - 0.5)
                         target_radius = max(1.0, button_radius + ring_offset)
                         orbit_radius = max(1.0, target_radius * jitter)
                         sx_orbit = center_x + math.cos(orbit_angle) * orbit_radius
                         sy_orbit = center_y + math.sin(orbit_angle) * orbit_radius
                         sx = sx + (sx_orbit - sx) * pull
                         sy = sy + (sy_orbit - sy) * pull
-                        dist_center = math.hypot(sx - cx, sy - cy)
-                        orbit_descriptor = {
-                            "sx": sx_orbit,
-                            "sy": sy_orbit,
-                            "weight": pull,
-                            "radius": radius,
-                            "depth": Zc3,
-                        }
                         gravity_weight = pull
-            projected.append(
-                {
-                    "idx": idx,
-                    "sx": sx,
-                    "sy": sy,
-                    "radius": radius,
-                    "depth": Zc3,
-                    "world": world_point,
-                    "dist_center": dist_center,
-                    "gravity_weight": gravity_weight,
-                    "orbit": orbit_descriptor,
-                }
-            )
 
-        if not projected:
+            out_sx[n] = sx
+            out_sy[n] = sy
+            out_r[n] = radius
+            out_depth[n] = Zc3
+            out_role[n] = ROLE_CLOUD
+            out_seed[n] = idx
+            out_wx[n] = X
+            out_wy[n] = Y
+            out_wz[n] = Z
+            out_gravity[n] = gravity_weight
+            n += 1
+
+            if gravity_weight > 0.0:
+                out_sx[n] = sx_orbit
+                out_sy[n] = sy_orbit
+                out_r[n] = radius
+                out_depth[n] = Zc3
+                out_role[n] = ROLE_ORBIT
+                out_seed[n] = idx
+                out_wx[n] = X
+                out_wy[n] = Y
+                out_wz[n] = Z
+                out_gravity[n] = gravity_weight
+                n += 1
+
+        buf.count = n
+        prof.mark(STAGE_GRAVITY)
+        if n == 0:
             self._marker_radii = (0.0, 0.0, 0.0)
-            return []
-
-        items: List[RenderItem] = []
-
-        for data in projected:
-            gravity_weight = float(data.get("gravity_weight", 0.0))
-
-            item = RenderItem(
-                sx=float(data["sx"]),
-                sy=float(data["sy"]),
-                r=float(data["radius"]),
-                color=QtGui.QColor("#00C8FF"),
-                alpha=1.0,
-                depth=float(data["depth"]),
-                world=data["world"],
-                gravity_weight=gravity_weight,
-                role="cloud",
-            )
-            items.append(item)
-
-            if donut_count > 0 and gravity_weight > 0.0 and data.get("orbit"):
-                orbit_info = data["orbit"]
-                orbit_item = RenderItem(
-                    sx=float(orbit_info["sx"]),
-                    sy=float(orbit_info["sy"]),
-                    r=float(orbit_info.get("radius", data["radius"])),
-                    color=QtGui.QColor("#00C8FF"),
-                    alpha=1.0,
-                    depth=float(orbit_info.get("depth", data["depth"])),
-                    world=data["world"],
-                    gravity_weight=float(orbit_info["weight"]),
-                    role="orbit",
-                )
-                items.append(orbit_item)
+            return buf
 
         self._width = width
         self._height = height
 
-        appearance = self.state.get("appearance", {})
+        appearance = self._frame_params.get("appearance", {})
         opacity = float(appearance.get("opacity", 1.0) or 1.0)
         alpha_depth = float(appearance.get("alphaDepth", 0.0) or 0.0)
 
         # Check for collisions with red circle mask and create imprints
         collision_threshold = radius_red * 0.98  # Slightly inside the red circle
-        imprint_radius = float(self.state.get("appearance", {}).get("px", 2.0) or 2.0) * 1.5
-
-        for item in items:
-            base_color = self._pick_color(item, now)
+        imprint_radius = float(self._frame_params.get("appearance", {}).get("px", 2.0) or 2.0) * 1.5
+
+        out_alpha = buf.alpha
+        out_rgba = buf.rgba
+        self._prepare_palette(now)
+        # La palette by_noise est évaluée en un seul passage vectorisé.
+        prefilled = self._palette_mode == "by_noise" and self._array_backend_enabled()
+        if prefilled:
+            self._fill_noise_rgba(buf, now)
+        prev_center_dist = self._prev_center_dist
+        # Profileur actif : la branche du cercle rouge est comptée à part.
+        timed = prof._open
+        for i in range(n):
+            item_sx = out_sx[i]
+            item_sy = out_sy[i]
+            item_r = out_r[i]
+            if prefilled:
+                base_rgba = out_rgba[i]
+            else:
+                base_rgba = self._pick_rgba(item_sx, item_sy, out_wx[i], out_wy[i], out_wz[i], now)
+                out_rgba[i] = base_rgba
             visibility = 1.0
-            item.color = base_color
             if alpha_depth > 0:
-                t = clamp01(math.atan(max(0.0, item.depth)) / (math.pi / 2))
+                t = clamp01(math.atan(max(0.0, out_depth[i])) / (math.pi / 2))
                 depth_alpha = (1 - alpha_depth) + alpha_depth * (1 - t)
             else:
                 depth_alpha = 1.0
-            item.alpha = clamp01(opacity * depth_alpha * clamp01(visibility))
-            
+            out_alpha[i] = clamp01(opacity * depth_alpha * clamp01(visibility))
+
             # Detect when a particle exits the red circle boundary
-            if radius_red > 0 and item.role == "cloud":
-                dist_from_center = math.hypot(item.sx - cx, item.sy - cy)
+            if radius_red > 0 and out_role[i] == ROLE_CLOUD:
+                if timed:
+                    prof.mark(STAGE_COLOUR)
+                dist_from_center = math.hypot(item_sx - cx, item_sy - cy)
                 # Identify particle by its seed (index)
-                try:
-                    particle_idx = int(item.world.seed)
-                except Exception:
-                    particle_idx = None
+                particle_idx = out_seed[i]
 
                 # Check if particle is near or crossing the red circle boundary
-                if abs(dist_from_center - collision_threshold) < item.r * 2.0:
+                if abs(dist_from_center - collision_threshold) < item_r * 2.0:
                     # Only consider particles leaving the field of view (inside -> outside)
-                    prev_pos = self._last_particle_positions.get(particle_idx)
-                    if prev_pos is not None:
-                        prev_dist = prev_pos[2]
+                    prev_dist = prev_center_dist[particle_idx]
+                    if not math.isnan(prev_dist):
                         # Collision detected: particle crossed the boundary outward
                         if prev_dist < collision_threshold <= dist_from_center:
                             # Create imprint at collision point
-                            angle = math.atan2(item.sy - cy, item.sx - cx)
+                            angle = math.atan2(item_sy - cy, item_sx - cx)
                             collision_x = cx + math.cos(angle) * collision_threshold
                             collision_y = cy + math.sin(angle) * collision_threshold
-                            imprint_id = self._imprint_counter
-                            self._imprint_counter += 1
-                            imprint_color = QtGui.QColor(item.color)
-                            self._imprints.append((collision_x, collision_y, imprint_color, imprint_radius, now, imprint_id))
-                            # Appliquer limite mémoire douce
-                            if len(self._imprints) > self._max_imprints:
-                                # Conserver seulement les empreintes les plus récentes
-                                self._imprints = self._imprints[-self._max_imprints:]
+                            imprint_id = self._imprints.add(
+                                collision_x, collision_y, base_rgba, imprint_radius, now
+                            )
+                            imprint_color = QtGui.QColor.fromRgba(base_rgba)
                             # Créer un orbiteur lié à cette empreinte
                             try:
-                                centers, radii, fallback_orbit_radius = self._compute_donut_orbits(width, height)
-                                if centers:
-                                    bx_idx = 0
-                                    best_d2 = float("inf")
-                                    for i_btn, (bx_c, by_c) in enumerate(centers):
-                                        d2 = (collision_x - bx_c) ** 2 + (collision_y - by_c) ** 2
-                                        if d2 < best_d2:
-                                            best_d2 = d2
-                                            bx_idx = i_btn
-                                    bx, by = centers[bx_idx]
-                                    base_button_r = 0.0
-                                    if bx_idx < len(radii):
-                                        base_button_r = float(radii[bx_idx]) or 0.0
-                                    orbit_r = max(8.0, (base_button_r or fallback_orbit_radius) + ring_offset)
+                                if donut_count:
+                                    bx_idx = donut.nearest(collision_x, collision_y)
+                                    bx, by = donut_centers[bx_idx]
+                                    base_button_r = float(donut.radii[bx_idx]) or 0.0
+                                    orbit_r = max(8.0, (base_button_r or donut.fallback_radius) + ring_offset)
                                 else:
                                     bx, by = cx, cy
                                     orbit_r = max(24.0, min(width, height) * 0.05)
                                 ang0 = math.atan2(collision_y - by, collision_x - bx)
-                                base_speed = 0.6 + 1.2 * _rand_for_index(idx, 733)
-                                angle_speed = max(0.0, base_speed * orbit_speed_multiplier)
+                                base_speed = 0.6 + 1.2 * seed_attrs.orbit_speed[idx]
                                 if snap_mode_cfg != "off" and len(self._orbiters) < self._max_orbiters:
                                     trace_snapshot = list(self._particle_traces.get(particle_idx, []))
                                     if not trace_snapshot or (
@@ -1567,447 +4288,185 @@ class DyxtenEngine:
                                         trace_snapshot.append((collision_x, collision_y))
                                     if len(trace_snapshot) > self._trail_max_points:
                                         trace_snapshot = trace_snapshot[-self._trail_max_points :]
-                                    button_color = self._button_color_for_index(bx_idx)
-                                    source_radius = max(0.5, float(item.r))
-                                    if orbiter_size_same_cfg:
-                                        orbit_particle_radius = source_radius
-                                    else:
-                                        orbit_particle_radius = max(0.5, orbiter_size_px_cfg)
-                                    self._orbiters.append({
-                                        "imprint": (collision_x, collision_y),
-                                        "imprint_time": float(now),
-                                        "color": imprint_color,
-                                        "r": float(orbit_particle_radius),
-                                        "source_r": float(source_radius),
-                                        "phase": "out",
-                                        "t": 0.0,
-                                        "duration_out": float(approach_duration_cfg),
-                                        "duration_back": float(return_duration_cfg),
-                                        "orbit_center": (bx, by),
-                                        "orbit_radius": float(orbit_r),
-                                        "angle": float(ang0),
-                                        "angle_speed": float(angle_speed),
-                                        "base_speed": float(base_speed),
-                                        # Exiger au moins un tour complet (2π rad) avant retour
-                                        "angle_accum": 0.0,
-                                        "required_turns": float(required_turns_cfg),
-                                        # Sécurité si angle_speed trop faible
-                                        "orbit_elapsed_ms": 0.0,
-                                        "max_orbit_ms": float(max_orbit_ms_cfg),
-                                        "pos_orbit": (bx + math.cos(ang0) * orbit_r, by + math.sin(ang0) * orbit_r),
-                                        "approach_mode": str(approach_traj_cfg),
-                                        "return_mode": str(return_traj_cfg),
-                                        "trajectory_bend": float(trajectory_bend_cfg),
-                                        "arc_direction": str(trajectory_arc_direction_cfg),
-                                        "spiral_turns": float(spiral_turns_cfg),
-                                        "spiral_tightness": float(spiral_tightness_cfg),
-                                        "wave_amplitude": float(wave_amplitude_cfg),
-                                        "wave_frequency": float(wave_frequency_cfg),
-                                        "trail_blend": float(trail_blend_cfg),
-                                        "trail_smoothing": float(trail_smoothing_cfg),
-                                        "trail": trace_snapshot,
-                                        "imprint_id": imprint_id,
-                                        "imprint_cleared": False,
-                                        "imprint_radius": float(imprint_radius),
-                                        "button_index": int(bx_idx),
-                                        "button_color": button_color,
-                                    })
+                                    self._orbiters.spawn(
+                                        imprint=(collision_x, collision_y),
+                                        imprint_time=float(now),
+                                        imprint_radius=float(imprint_radius),
+                                        imprint_id=imprint_id,
+                                        center=(bx, by),
+                                        orbit_radius=float(orbit_r),
+                                        angle=float(ang0),
+                                        base_speed=float(base_speed),
+                                        source_r=max(0.5, float(item_r)),
+                                        button_index=int(bx_idx),
+                                        color=imprint_color,
+                                        button_color=self._button_color_for_index(bx_idx),
+                                        trail=trace_snapshot,
+                                    )
                             except Exception:
                                 pass
                 
                 # Update particle position tracking
-                self._last_particle_positions[particle_idx] = (item.sx, item.sy, dist_from_center)
-
-        # Mise à jour des orbiters
+                prev_center_dist[particle_idx] = dist_from_center
+                if timed:
+                    prof.mark(STAGE_IMPRINTS)
+        # Une seule passe pour la couleur et les sorties du cercle rouge ;
+        # « imprints » ne reçoit que le temps de la branche ci-dessus.
+        prof.mark(STAGE_COLOUR)
+
+        # Mise à jour des orbiters : les phases avancent d'abord, puis les
+        # trajectoires d'accrochage et de retour sont évaluées par groupe.
         orbiters_draw: List[Tuple[float, float, QtGui.QColor, float, float]] = []
         if self._orbiters:
-            def _ease_value(mode: str, value: float) -> float:
-                value = clamp01(value)
-                key = (mode or "default").lower()
-                if key in ("none", "linear"):
-                    return value
-                if key == "ease_in":
-                    return pow(value, ease_in_power_cfg)
-                if key == "ease_in_out":
-                    if value < 0.5:
-                        scaled = clamp01(value * 2.0)
-                        return 0.5 * pow(scaled, ease_in_power_cfg)
-                    scaled = clamp01((1.0 - value) * 2.0)
-                    return 1.0 - 0.5 * pow(scaled, ease_out_power_cfg)
-                return 1.0 - pow(1.0 - value, ease_out_power_cfg)
-
-            def _trajectory_point(
-                mode: str,
-                start_x: float,
-                start_y: float,
-                end_x: float,
-                end_y: float,
-                t_value: float,
-                center: Tuple[float, float] | None,
-                orbit_radius: float,
-                *,
-                bezier_bend: float,
-                arc_direction: str,
-                spiral_turns: float,
-                spiral_tightness: float,
-                wave_amplitude: float,
-                wave_frequency: float,
-                trail: Optional[Sequence[Tuple[float, float]]],
-                trail_blend: float,
-                trail_smoothing: float,
-                phase: str,
-            ) -> Tuple[float, float]:
-                key = (mode or "line").lower()
-                if center is not None:
-                    cx, cy = center
-                else:
-                    cx, cy = 0.0, 0.0
-                trail_blend = clamp01(float(trail_blend))
-                phase = (phase or "").lower()
-                if key == "arc" and center is not None:
-                    start_angle = math.atan2(start_y - cy, start_x - cx)
-                    end_angle = math.atan2(end_y - cy, end_x - cx)
-                    base_delta = (end_angle - start_angle + math.pi) % (2.0 * math.pi) - math.pi
-                    direction_key = (arc_direction or "auto").lower()
-                    if direction_key in ("cw", "ccw"):
-                        diff_full = (end_angle - start_angle) % (2.0 * math.pi)
-                        if diff_full <= 0.0:
-                            diff_full = 2.0 * math.pi
-                        if direction_key == "cw":
-                            delta = diff_full - 2.0 * math.pi
-                        else:
-                            delta = diff_full
-                    else:
-                        delta = base_delta
-                    angle = start_angle + delta * t_value
-                    start_radius = math.hypot(start_x - cx, start_y - cy)
-                    end_radius = math.hypot(end_x - cx, end_y - cy)
-                    radius = start_radius + (end_radius - start_radius) * t_value
-                    return cx + math.cos(angle) * radius, cy + math.sin(angle) * radius
-                if key == "bezier":
-                    mx = (start_x + end_x) / 2.0
-                    my = (start_y + end_y) / 2.0
-                    dx = end_x - start_x
-                    dy = end_y - start_y
-                    length = math.hypot(dx, dy)
-                    if length <= 1e-6:
-                        ctrl_x, ctrl_y = mx, my
-                    else:
-                        nx = -dy / length
-                        ny = dx / length
-                        bend = clamp(bezier_bend, -2.0, 2.0)
-                        if abs(bend) <= 1e-5:
-                            ctrl_x, ctrl_y = mx, my
-                        else:
-                            scale_factor = 1.0
-                            if orbit_radius > 0.0 and length > 0.0:
-                                scale_factor = clamp(orbit_radius / max(length, 1.0), 0.3, 2.0)
-                            ctrl_x = mx + nx * length * bend * scale_factor
-                            ctrl_y = my + ny * length * bend * scale_factor
-                    omt = 1.0 - t_value
-                    x = omt * omt * start_x + 2.0 * omt * t_value * ctrl_x + t_value * t_value * end_x
-                    y = omt * omt * start_y + 2.0 * omt * t_value * ctrl_y + t_value * t_value * end_y
-                    return x, y
-                if key == "spiral" and center is not None:
-                    turns = max(0.01, float(spiral_turns))
-                    tight = clamp(float(spiral_tightness), -2.0, 2.0)
-                    start_angle = math.atan2(start_y - cy, start_x - cx)
-                    end_angle = math.atan2(end_y - cy, end_x - cx)
-                    base_radius_start = math.hypot(start_x - cx, start_y - cy)
-                    base_radius_end = math.hypot(end_x - cx, end_y - cy)
-                    interp_radius = base_radius_start + (base_radius_end - base_radius_start) * t_value
-                    angle = start_angle + turns * 2.0 * math.pi * t_value
-                    spiral_scale = 1.0 + tight * (t_value - 0.5)
-                    radius = max(0.0, interp_radius * spiral_scale)
-                    return cx + math.cos(angle) * radius, cy + math.sin(angle) * radius
-                if key == "wave":
-                    base_x = start_x + (end_x - start_x) * t_value
-                    base_y = start_y + (end_y - start_y) * t_value
-                    dx = end_x - start_x
-                    dy = end_y - start_y
-                    length = math.hypot(dx, dy)
-                    if length <= 1e-6:
-                        return base_x, base_y
-                    nx = -dy / length
-                    ny = dx / length
-                    amp = max(0.0, float(wave_amplitude)) * length * 0.5
-                    freq = max(0.0, float(wave_frequency))
-                    offset = math.sin(t_value * math.pi * freq) * amp
-                    return base_x + nx * offset, base_y + ny * offset
-                if key == "initial_path":
-                    path_points: List[Tuple[float, float]] = []
-                    if trail:
-                        if phase == "out":
-                            core_path = list(reversed(trail))
-                        else:
-                            core_path = list(trail)
-                        # Filtrer les doublons consécutifs
-                        filtered: List[Tuple[float, float]] = []
-                        for px, py in core_path:
-                            if not filtered or (abs(filtered[-1][0] - px) > 0.01 or abs(filtered[-1][1] - py) > 0.01):
-                                filtered.append((px, py))
-                        path_points.extend(filtered)
-                    if not path_points or (abs(path_points[-1][0] - end_x) > 0.01 or abs(path_points[-1][1] - end_y) > 0.01):
-                        path_points.append((end_x, end_y))
-                    path_points.insert(0, (start_x, start_y))
-                    if trail_smoothing > 0.0 and len(path_points) > 3:
-                        radius = max(1, int(round(1 + trail_smoothing * 4)))
-                        smoothed: List[Tuple[float, float]] = []
-                        for idx in range(len(path_points)):
-                            start_idx = max(0, idx - radius)
-                            end_idx = min(len(path_points), idx + radius + 1)
-                            window = path_points[start_idx:end_idx]
-                            if not window:
-                                continue
-                            sx = sum(p[0] for p in window) / len(window)
-                            sy = sum(p[1] for p in window) / len(window)
-                            smoothed.append((sx, sy))
-                        if smoothed:
-                            path_points = smoothed
-                    distances = [0.0]
-                    total = 0.0
-                    for idx in range(len(path_points) - 1):
-                        seg = math.hypot(
-                            path_points[idx + 1][0] - path_points[idx][0],
-                            path_points[idx + 1][1] - path_points[idx][1],
-                        )
-                        total += seg
-                        distances.append(total)
-                    if total <= 1e-6:
-                        path_x, path_y = path_points[-1]
-                    else:
-                        target = clamp(t_value * total, 0.0, total)
-                        path_x, path_y = path_points[-1]
-                        for idx in range(len(path_points) - 1):
-                            seg_start = distances[idx]
-                            seg_end = distances[idx + 1]
-                            if seg_end >= target:
-                                seg_len = max(1e-6, seg_end - seg_start)
-                                local = (target - seg_start) / seg_len
-                                sx = path_points[idx][0] + (path_points[idx + 1][0] - path_points[idx][0]) * local
-                                sy = path_points[idx][1] + (path_points[idx + 1][1] - path_points[idx][1]) * local
-                                path_x, path_y = sx, sy
-                                break
-                    lin_x = start_x + (end_x - start_x) * t_value
-                    lin_y = start_y + (end_y - start_y) * t_value
-                    blend = trail_blend
-                    return lin_x * (1.0 - blend) + path_x * blend, lin_y * (1.0 - blend) + path_y * blend
-                return start_x + (end_x - start_x) * t_value, start_y + (end_y - start_y) * t_value
-
-            survivors: List[Dict[str, object]] = []
+            pool = self._orbiters
+            phase_col = pool.phase
+            t_col = pool.t
+            angle_col = pool.angle
+            pos_x_col = pool.pos_x
+            pos_y_col = pool.pos_y
+            sx_col = pool.sx
+            sy_col = pool.sy
+            cleared_col = pool.imprint_cleared
+            prev_sx_col = pool.prev_sx
+            prev_sy_col = pool.prev_sy
             snap_mode_lower = snap_mode_cfg.lower()
             detach_mode_lower = detach_mode_cfg.lower()
-            for ob in self._orbiters:
-                try:
-                    phase = str(ob.get("phase", "out"))
-                    t_phase = float(ob.get("t", 0.0))
-                    ix, iy = ob.get("imprint", (cx, cy))  # type: ignore[assignment]
-                    bx, by = ob.get("orbit_center", (cx, cy))  # type: ignore[assignment]
-                    orbit_r = float(ob.get("orbit_radius", 32.0))
-                    angle = float(ob.get("angle", 0.0))
-                    base_speed = float(ob.get("base_speed", ob.get("angle_speed", 1.0)))
-                    if not math.isfinite(base_speed):
-                        base_speed = 0.0
-                    angle_speed = max(0.0, base_speed * orbit_speed_multiplier)
-                    ob["base_speed"] = base_speed
-                    ob["angle_speed"] = angle_speed
-                    pos_orbit = ob.get("pos_orbit")  # type: ignore[assignment]
-                    if not isinstance(pos_orbit, tuple) or len(pos_orbit) != 2:
-                        pos_orbit = (bx + math.cos(angle) * orbit_r, by + math.sin(angle) * orbit_r)
-                    px, py = float(pos_orbit[0]), float(pos_orbit[1])
-                    stored_r = ob.get("r", 2.0)
-                    try:
-                        r_draw = float(stored_r)
-                    except (TypeError, ValueError):
-                        r_draw = 2.0
-                    source_r = ob.get("source_r", r_draw)
-                    try:
-                        source_r_float = float(source_r)
-                    except (TypeError, ValueError):
-                        source_r_float = r_draw
-                    if orbiter_size_same_cfg:
-                        r_draw = max(0.5, source_r_float)
-                    else:
-                        r_draw = max(0.5, orbiter_size_px_cfg)
-                    ob["r"] = r_draw
-                    base_color = ob.get("color", QtGui.QColor("#FFFFFF"))  # type: ignore[assignment]
-                    if not isinstance(base_color, QtGui.QColor):
-                        base_color = QtGui.QColor(str(base_color))
-                    if not base_color.isValid():
-                        base_color = QtGui.QColor("#FFFFFF")
-
-                    qcolor = base_color
-                    if bool(system.get("orbiterColorFromButton", False)):
-                        button_index_val = ob.get("button_index")
-                        idx_int: Optional[int]
-                        if isinstance(button_index_val, int):
-                            idx_int = button_index_val
-                        else:
-                            try:
-                                idx_int = int(button_index_val)
-                            except Exception:
-                                idx_int = None
-                        override_color: Optional[QtGui.QColor] = None
-                        if idx_int is not None:
-                            override_color = self._button_color_for_index(idx_int)
-                        if override_color is None:
-                            stored_color = ob.get("button_color")
-                            if isinstance(stored_color, QtGui.QColor) and stored_color.isValid():
-                                override_color = QtGui.QColor(stored_color)
-                        if override_color is not None and override_color.isValid():
-                            qcolor = override_color
-
-                    spiral_turns = float(ob.get("spiral_turns", spiral_turns_cfg))
-                    spiral_tightness = float(ob.get("spiral_tightness", spiral_tightness_cfg))
-                    wave_amplitude = float(ob.get("wave_amplitude", wave_amplitude_cfg))
-                    wave_frequency = float(ob.get("wave_frequency", wave_frequency_cfg))
-                    trail_blend = float(ob.get("trail_blend", trail_blend_cfg))
-                    trail_smoothing = float(ob.get("trail_smoothing", trail_smoothing_cfg))
-                    trail_data = ob.get("trail")
-                    imprint_id = ob.get("imprint_id")
-                    imprint_cleared = bool(ob.get("imprint_cleared", False))
-                    ob["spiral_turns"] = spiral_turns
-                    ob["spiral_tightness"] = spiral_tightness
-                    ob["wave_amplitude"] = wave_amplitude
-                    ob["wave_frequency"] = wave_frequency
-                    ob["trail_blend"] = trail_blend
-                    ob["trail_smoothing"] = trail_smoothing
-
-                    ob["duration_out"] = float(approach_duration_cfg)
-                    ob["duration_back"] = float(return_duration_cfg)
-                    ob["required_turns"] = float(required_turns_cfg)
-                    ob["max_orbit_ms"] = float(max_orbit_ms_cfg)
-                    ob["approach_mode"] = str(approach_traj_cfg)
-                    ob["return_mode"] = str(return_traj_cfg)
-                    ob["trajectory_bend"] = float(trajectory_bend_cfg)
-                    ob["arc_direction"] = str(trajectory_arc_direction_cfg)
-
-                    imprint_radius = float(ob.get("imprint_radius", r_draw * 1.5))
-
-                    if phase == "out":
+            step_ms = dt * 1000.0
+            required_angle = required_turns_cfg * (2.0 * math.pi)
+            settings = _TrajectorySettings(
+                bend=trajectory_bend_cfg,
+                arc_direction=trajectory_arc_direction_cfg.lower(),
+                spiral_turns=spiral_turns_cfg,
+                spiral_tightness=spiral_tightness_cfg,
+                wave_amplitude=wave_amplitude_cfg,
+                wave_frequency=wave_frequency_cfg,
+                trail_blend=trail_blend_cfg,
+                trail_smoothing=trail_smoothing_cfg,
+            )
+            ease_powers = (ease_in_power_cfg, ease_out_power_cfg)
+            # Un passage par pas de simulation ; en pas fixe, la position du
+            # pas précédent est gardée pour interpoler le rendu.
+            for _ in range(steps):
+                if clock.fixed:
+                    for slot in pool.active:
+                        prev_sx_col[slot] = sx_col[slot]
+                        prev_sy_col[slot] = sy_col[slot]
+                approach_slots: List[int] = []
+                return_slots: List[int] = []
+                for slot in pool.active:
+                    phase = phase_col[slot]
+                    if phase == PHASE_OUT:
                         if snap_mode_lower == "off":
-                            phase = "orbit"
-                            t_phase = 0.0
-                            sx, sy = px, py
+                            phase_col[slot] = PHASE_ORBIT
+                            t_col[slot] = 0.0
+                            sx_col[slot] = pos_x_col[slot]
+                            sy_col[slot] = pos_y_col[slot]
                         else:
-                            dur = max(1.0, float(ob.get("duration_out", approach_duration_cfg)))
-                            t_phase = min(1.0, t_phase + dt * 1000.0 / dur)
-                            t_eased = _ease_value(snap_mode_lower, t_phase)
-                            traj_mode = str(ob.get("approach_mode", approach_traj_cfg))
-                            sx, sy = _trajectory_point(
-                                traj_mode,
-                                ix,
-                                iy,
-                                px,
-                                py,
-                                t_eased,
-                                (bx, by),
-                                orbit_r,
-                                bezier_bend=float(ob.get("trajectory_bend", trajectory_bend_cfg)),
-                                arc_direction=str(ob.get("arc_direction", trajectory_arc_direction_cfg)),
-                                spiral_turns=spiral_turns,
-                                spiral_tightness=spiral_tightness,
-                                wave_amplitude=wave_amplitude,
-                                wave_frequency=wave_frequency,
-                                trail=trail_data if isinstance(trail_data, Sequence) else None,
-                                trail_blend=trail_blend,
-                                trail_smoothing=trail_smoothing,
-                                phase="out",
-                            )
-                            if t_phase >= 1.0:
-                                phase = "orbit"
-                                t_phase = 0.0
-                    elif phase == "orbit":
-                        dtheta = angle_speed * dt
-                        angle += dtheta
-                        px = bx + math.cos(angle) * orbit_r
-                        py = by + math.sin(angle) * orbit_r
-                        sx, sy = px, py
-                        ob["angle"] = angle
-                        ob["pos_orbit"] = (px, py)
-                        accum = float(ob.get("angle_accum", 0.0)) + abs(dtheta)
-                        ob["angle_accum"] = accum
-                        elapsed = float(ob.get("orbit_elapsed_ms", 0.0)) + dt * 1000.0
-                        ob["orbit_elapsed_ms"] = elapsed
-                        required_turns = max(0.0, float(ob.get("required_turns", required_turns_cfg)))
-                        target = required_turns * (2.0 * math.pi)
-                        max_ms = float(ob.get("max_orbit_ms", max_orbit_ms_cfg))
-                        has_required_turns = target <= 0.0 or accum >= target
-                        timed_out = elapsed >= max_ms
-                        if has_required_turns or (timed_out and target <= 0.0):
-                            phase = "back"
-                            t_phase = 0.0
+                            t_col[slot] = min(1.0, t_col[slot] + step_ms / approach_duration_cfg)
+                            approach_slots.append(slot)
+                    elif phase == PHASE_ORBIT:
+                        dtheta = max(0.0, pool.base_speed[slot] * orbit_speed_multiplier) * dt
+                        angle = angle_col[slot] + dtheta
+                        orbit_r = pool.orbit_radius[slot]
+                        px = pool.center_x[slot] + math.cos(angle) * orbit_r
+                        py = pool.center_y[slot] + math.sin(angle) * orbit_r
+                        angle_col[slot] = angle
+                        pos_x_col[slot] = sx_col[slot] = px
+                        pos_y_col[slot] = sy_col[slot] = py
+                        accum = pool.angle_accum[slot] + abs(dtheta)
+                        pool.angle_accum[slot] = accum
+                        elapsed = pool.orbit_elapsed_ms[slot] + step_ms
+                        pool.orbit_elapsed_ms[slot] = elapsed
+                        has_required_turns = required_angle <= 0.0 or accum >= required_angle
+                        timed_out = elapsed >= max_orbit_ms_cfg
+                        if has_required_turns or (timed_out and required_angle <= 0.0):
+                            phase_col[slot] = PHASE_BACK
+                            t_col[slot] = 0.0
+                    elif detach_mode_lower == "off":
+                        if not cleared_col[slot]:
+                            self._remove_imprint_by_id(pool.imprint_id[slot])
+                        pool.release(slot)
                     else:
-                        if detach_mode_lower == "off":
-                            if not imprint_cleared:
-                                self._remove_imprint_by_id(imprint_id if isinstance(imprint_id, int) else None)
-                                imprint_cleared = True
-                            phase = "done"
-                            sx, sy = ix, iy
-                        else:
-                            dur = max(1.0, float(ob.get("duration_back", return_duration_cfg)))
-                            t_phase = min(1.0, t_phase + dt * 1000.0 / dur)
-                            t_eased = _ease_value(detach_mode_lower, t_phase)
-                            traj_mode = str(ob.get("return_mode", return_traj_cfg))
-                            sx, sy = _trajectory_point(
-                                traj_mode,
-                                px,
-                                py,
-                                ix,
-                                iy,
-                                t_eased,
-                                (bx, by),
-                                orbit_r,
-                                bezier_bend=float(ob.get("trajectory_bend", trajectory_bend_cfg)),
-                                arc_direction=str(ob.get("arc_direction", trajectory_arc_direction_cfg)),
-                                spiral_turns=spiral_turns,
-                                spiral_tightness=spiral_tightness,
-                                wave_amplitude=wave_amplitude,
-                                wave_frequency=wave_frequency,
-                                trail=trail_data if isinstance(trail_data, Sequence) else None,
-                                trail_blend=trail_blend,
-                                trail_smoothing=trail_smoothing,
-                                phase="back",
-                            )
-                            if not imprint_cleared:
-                                if math.hypot(sx - ix, sy - iy) <= max(2.0, imprint_radius * 1.1):
-                                    self._remove_imprint_by_id(
-                                        imprint_id if isinstance(imprint_id, int) else None
-                                    )
-                                    imprint_cleared = True
-                            if t_phase >= 1.0:
-                                if not imprint_cleared:
-                                    self._remove_imprint_by_id(imprint_id if isinstance(imprint_id, int) else None)
-                                    imprint_cleared = True
-                                phase = "done"
-
-                    if phase == "done" and not imprint_cleared:
-                        self._remove_imprint_by_id(imprint_id if isinstance(imprint_id, int) else None)
-                        imprint_cleared = True
-
-                    if phase != "done":
-                        ob["phase"] = phase
-                        ob["t"] = t_phase
-                        ob["imprint_cleared"] = imprint_cleared
-                        if phase == "orbit":
-                            alpha_o = 0.95
-                        elif phase == "out":
-                            alpha_o = 0.5 + 0.45 * t_phase
-                        else:
-                            alpha_o = 0.95 - 0.10 * t_phase
-                        alpha_o = clamp01(alpha_o * orbiter_opacity_cfg)
-                        orbiters_draw.append((sx, sy, qcolor, r_draw, alpha_o))
-                        survivors.append(ob)
-                except Exception:
+                        t_col[slot] = min(1.0, t_col[slot] + step_ms / return_duration_cfg)
+                        return_slots.append(slot)
+
+                if approach_slots:
+                    self._evaluate_orbiter_trajectories(
+                        approach_slots, PHASE_OUT, approach_traj_cfg.lower(), snap_mode_lower, ease_powers, settings
+                    )
+                    for slot in approach_slots:
+                        if t_col[slot] >= 1.0:
+                            phase_col[slot] = PHASE_ORBIT
+                            t_col[slot] = 0.0
+                if return_slots:
+                    self._evaluate_orbiter_trajectories(
+                        return_slots, PHASE_BACK, return_traj_cfg.lower(), detach_mode_lower, ease_powers, settings
+                    )
+                    for slot in return_slots:
+                        if not cleared_col[slot]:
+                            ix = pool.imprint_x[slot]
+                            iy = pool.imprint_y[slot]
+                            reach = max(2.0, pool.imprint_radius[slot] * 1.1)
+                            if t_col[slot] >= 1.0 or math.hypot(sx_col[slot] - ix, sy_col[slot] - iy) <= reach:
+                                self._remove_imprint_by_id(pool.imprint_id[slot])
+                                cleared_col[slot] = 1
+                        if t_col[slot] >= 1.0:
+                            pool.release(slot)
+
+                pool.sweep()
+
+            color_from_button = bool(system.get("orbiterColorFromButton", False))
+            fixed_r_draw = max(0.5, orbiter_size_px_cfg)
+            for slot in pool.active:
+                phase = phase_col[slot]
+                if phase == PHASE_DONE:
                     continue
-            self._orbiters = survivors
+                r_draw = max(0.5, pool.source_r[slot]) if orbiter_size_same_cfg else fixed_r_draw
+                qcolor = pool.color[slot]
+                if color_from_button:
+                    override_color = self._button_color_for_index(pool.button_index[slot])
+                    if override_color is None:
+                        stored_color = pool.button_color[slot]
+                        if isinstance(stored_color, QtGui.QColor) and stored_color.isValid():
+                            override_color = QtGui.QColor(stored_color)
+                    if override_color is not None and override_color.isValid():
+                        qcolor = override_color
+                if phase == PHASE_ORBIT:
+                    alpha_o = 0.95
+                elif phase == PHASE_OUT:
+                    alpha_o = 0.5 + 0.45 * t_col[slot]
+                else:
+                    alpha_o = 0.95 - 0.10 * t_col[slot]
+                alpha_o = clamp01(alpha_o * orbiter_opacity_cfg)
+                draw_x = sx_col[slot]
+                draw_y = sy_col[slot]
+                if alpha < 1.0:
+                    if math.isnan(draw_x):
+                        # Lancé depuis le dernier pas : pas encore de position.
+                        continue
+                    prev_x = prev_sx_col[slot]
+                    if not math.isnan(prev_x):
+                        prev_y = prev_sy_col[slot]
+                        draw_x = prev_x + (draw_x - prev_x) * alpha
+                        draw_y = prev_y + (draw_y - prev_y) * alpha
+                orbiters_draw.append((draw_x, draw_y, qcolor, r_draw, alpha_o))
             self._orbiters_draw = orbiters_draw
         else:
             self._orbiters_draw = []
+        prof.mark(STAGE_ORBITERS)
 
-        if self.state.get("system", {}).get("depthSort", True):
-            items.sort(key=lambda it: it.depth, reverse=True)
-        count = len(items)
+        if system.get("depthSort", True):
+            bins = 0
+            blend_mode = str(self._frame_params.get("appearance", {}).get("blendMode", "") or "").lower()
+            if blend_mode in _ORDER_INDEPENDENT_BLEND_MODES:
+                try:
+                    bins = max(0, int(system.get("depthSortBins", 256)))
+                except (TypeError, ValueError):
+                    bins = 256
+            buf.sort_by_depth(bins)
+        else:
+            buf.set_identity_order()
+        count = buf.count
         if count == 0:
             note = "step produced 0 items"
             visible = 0
@@ -2015,13 +4474,14 @@ class DyxtenEngine:
             avg_alpha = "0.000"
         else:
             note = ""
-            visible = sum(1 for it in items if it.alpha > 0.001)
-            min_x = min(it.sx for it in items)
-            max_x = max(it.sx for it in items)
-            min_y = min(it.sy for it in items)
-            max_y = max(it.sy for it in items)
+            alphas = buf.alpha[:count]
+            visible = sum(1 for a in alphas if a > 0.001)
+            min_x = min(buf.sx[:count])
+            max_x = max(buf.sx[:count])
+            min_y = min(buf.sy[:count])
+            max_y = max(buf.sy[:count])
             bounds = f"x=[{min_x:.1f},{max_x:.1f}] y=[{min_y:.1f},{max_y:.1f}]"
-            avg_alpha = f"{(sum(it.alpha for it in items) / count):.3f}"
+            avg_alpha = f"{(sum(alphas) / count):.3f}"
         if (
             count != self._last_item_count
             or note != self._last_step_note
@@ -2047,8 +4507,8 @@ class DyxtenEngine:
                 self._debug(
                     "\tstate snapshot: distribution=%s appearance.opacity=%s"
                     % (
-                        dict(self.state.get("distribution", {})),
-                        self.state.get("appearance", {}).get("opacity", 1.0),
+                        dict(self._frame_params.get("distribution", {})),
+                        self._frame_params.get("appearance", {}).get("opacity", 1.0),
                     )
                 )
             self._last_item_count = count
@@ -2056,7 +4516,8 @@ class DyxtenEngine:
             self._last_visible_count = visible
             self._last_avg_alpha = avg_alpha
             self._last_bounds = bounds
-        return items
+        prof.mark(STAGE_SORT)
+        return buf
 
 
 class _ViewWidgetBase:
@@ -2069,10 +4530,27 @@ class _ViewWidgetBase:
         self.setAutoFillBackground(False)
         self._gl: Optional[object] = None
         self.engine = DyxtenEngine()
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(lambda: self.engine.set_simulation_thread(False))
+            app.aboutToQuit.connect(self.engine.shutdown_workers)
+            # DYXTEN_PROFILE_DUMP=chemin.csv|.json écrit les temps par frame en quittant.
+            dump_path = os.environ.get("DYXTEN_PROFILE_DUMP", "").strip()
+            if dump_path:
+                app.aboutToQuit.connect(lambda: self.engine.dump_profile(dump_path))
         self._shape = "circle"
         self._transparent = True
+        # Calque des empreintes, redessiné seulement quand elles changent.
+        self._imprint_layer: Optional[QtGui.QImage] = None
+        self._imprint_layer_revision = -1
+        self._imprint_layer_next_id = 0
         self._timer = QtCore.QTimer(self)
         self._frame_interval_ms = 16
+        # Intervalle demandé (system.frameIntervalMs) et coût moyen du rendu,
+        # pour system.adaptivePacing.
+        self._configured_interval_ms = 16
+        self._adaptive_pacing = False
+        self._paint_cost_ms = 0.0
         self._timer.timeout.connect(self.update)
         self._timer.start(self._frame_interval_ms)
 
@@ -2094,6 +4572,18 @@ class _ViewWidgetBase:
         else:
             self._timer.start(interval_ms)
 
+    def _pace_frames(self, cost_ms: float) -> None:
+        """Stretch the timer interval while painting overruns it (``system.adaptivePacing``)."""
+
+        self._paint_cost_ms += (cost_ms - self._paint_cost_ms) * 0.1
+        base = self._configured_interval_ms
+        if not self._adaptive_pacing or base <= 0:
+            return
+        # 20 % de marge, au plus quatre fois l'intervalle réglé.
+        target = min(base * 4, max(base, int(math.ceil(self._paint_cost_ms * 1.2))))
+        if target == base or abs(target - self._frame_interval_ms) >= 2:
+            self._apply_frame_interval(target)
+
     def _compute_marker_radii(self, width: float, height: float) -> Tuple[float, float, float]:
         """Return the radii of the red, yellow and blue marker circles."""
 
@@ -2110,11 +4600,12 @@ class _ViewWidgetBase:
         radius_yellow = min(radius_yellow, max_radius)
         radius_blue = min(radius_blue, max_radius)
 
-        system = self.engine.state.get("system", {})
-        # The widget stores the live state on the engine instance. Use
-        # engine.state here instead of self.state (which only exists on the
-        # engine) to avoid AttributeError on the widget instances.
-        indicator_cfg = self.engine.state.get("indicator")
+        # Read the engine's published snapshot (the widget has no state of
+        # its own, and the snapshot is safe to read while a simulation
+        # thread is running).
+        params = self.engine.params
+        system = params.get("system", {})
+        indicator_cfg = params.get("indicator")
         yellow_override_ratio: Optional[float] = None
         if isinstance(indicator_cfg, Mapping):
             raw_yellow = indicator_cfg.get("yellowCircleRatio")
@@ -2231,9 +4722,14 @@ class _ViewWidgetBase:
                 target_interval = int(float(frame_interval))
             except (TypeError, ValueError):
                 target_interval = 16
+        self._configured_interval_ms = max(target_interval, 0)
+        self._adaptive_pacing = bool(system.get("adaptivePacing", False))
         self._apply_frame_interval(target_interval)
         if transparent != self._transparent:
             self.set_transparent(transparent)
+        self.engine.set_simulation_thread(
+            bool(system.get("simulationThread", False)), (max(1, self.width()), max(1, self.height()))
+        )
         if previous_shape != self._shape:
             self.update()
 
@@ -2255,8 +4751,117 @@ class _ViewWidgetBase:
         self.update()
 
     # ------------------------------------------------------------------ Rendering helpers
+    def _draw_imprints(self, painter: QtGui.QPainter, store: ImprintStore) -> None:
+        """Composite the cached imprint layer, rasterising only what changed.
+
+        Imprints added since the last pass are painted on top of the layer;
+        a removal, an eviction or a resize redraws it from scratch.
+        """
+
+        # Le calque ne dépasse pas system.dprClamp pixels physiques par pixel.
+        system = self.engine.params.get("system", {})
+        dpr_clamp = _coerce_float(system.get("dprClamp") if isinstance(system, Mapping) else None, 2.0)
+        dpr = min(self.devicePixelRatioF(), max(1.0, dpr_clamp))
+        size = QtCore.QSize(
+            int(math.ceil(max(1, self.width()) * dpr)), int(math.ceil(max(1, self.height()) * dpr))
+        )
+        layer = self._imprint_layer
+        if layer is None or layer.size() != size or self._imprint_layer_revision != store.revision:
+            layer = QtGui.QImage(size, QtGui.QImage.Format_ARGB32_Premultiplied)
+            layer.setDevicePixelRatio(dpr)
+            layer.fill(QtCore.Qt.transparent)
+            pending = ((x, y, rgba, r) for x, y, rgba, r, _time, _id in store)
+        elif self._imprint_layer_next_id < store.next_id:
+            pending = store.since(self._imprint_layer_next_id)
+        else:
+            pending = None
+        if pending is not None:
+            layer_painter = QtGui.QPainter(layer)
+            layer_painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+            layer_painter.setPen(QtCore.Qt.NoPen)
+            color = QtGui.QColor()
+            rect = QtCore.QRectF()
+            for imp_x, imp_y, imp_rgba, imp_radius in pending:
+                color.setRgba(imp_rgba)
+                color.setAlphaF(0.6)
+                layer_painter.setBrush(color)
+                rect.setRect(imp_x - imp_radius, imp_y - imp_radius, imp_radius * 2, imp_radius * 2)
+                layer_painter.drawEllipse(rect)
+            layer_painter.end()
+            self._imprint_layer = layer
+            self._imprint_layer_revision = store.revision
+            self._imprint_layer_next_id = store.next_id
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+        painter.drawImage(QtCore.QPointF(0.0, 0.0), layer)
+
+    def _draw_orbiters(
+        self, painter: QtGui.QPainter, orbiters: Sequence[Tuple[float, float, QtGui.QColor, float, float]]
+    ) -> None:
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+        painter.setPen(QtCore.Qt.NoPen)
+        for sx, sy, color, r_draw, alpha in orbiters:
+            col = QtGui.QColor(color)
+            col.setAlphaF(clamp01(alpha))
+            painter.setBrush(col)
+            painter.drawEllipse(QtCore.QRectF(sx - r_draw, sy - r_draw, r_draw * 2, r_draw * 2))
+
+    def _square_particles(self) -> bool:
+        """Squares for ``appearance.shape == "square"`` or at the lowest detail levels."""
+
+        return self._shape == "square" or self.engine.quality.square_shapes
+
+    def _draw_particles(
+        self,
+        painter: QtGui.QPainter,
+        buf: FrameBuffer,
+        blend_mode: str,
+        clip: Optional[Tuple[float, float, float]],
+    ) -> None:
+        if clip is not None:
+            # Create circular clipping path
+            clip_x, clip_y, clip_r = clip
+            clip_path = QtGui.QPainterPath()
+            clip_path.addEllipse(QtCore.QRectF(clip_x - clip_r, clip_y - clip_r, clip_r * 2.0, clip_r * 2.0))
+            painter.setClipPath(clip_path)
+        painter.setCompositionMode(_map_blend_mode(blend_mode))
+        painter.setPen(QtCore.Qt.NoPen)
+        draw = painter.drawRect if self._square_particles() else painter.drawEllipse
+        color = QtGui.QColor()
+        rect = QtCore.QRectF()
+        xs, ys, rs = buf.sx, buf.sy, buf.r
+        rgba, alphas = buf.rgba, buf.alpha
+        for i in buf.order[: buf.count]:
+            r = rs[i]
+            color.setRgba(rgba[i])
+            color.setAlphaF(clamp01(alphas[i]))
+            painter.setBrush(color)
+            rect.setRect(xs[i] - r, ys[i] - r, r * 2, r * 2)
+            draw(rect)
+        # Remove clipping for marker circles
+        painter.setClipping(False)
+
     def _render_with_painter(self, painter: QtGui.QPainter) -> None:
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        started = time.perf_counter()
+        width = max(1, self.width())
+        height = max(1, self.height())
+        # Avec un thread de simulation, on dessine la dernière frame terminée
+        # (paramètres compris) ; sinon on avance le moteur ici.
+        simulation = self.engine.simulation
+        frame: Optional[SimulationFrame] = None
+        if simulation is not None:
+            simulation.viewport = (width, height)
+            frame = simulation.acquire()
+        params = frame.params if frame is not None else self.engine.params
+        system_cfg = params.get("system", {})
+        if not isinstance(system_cfg, Mapping):
+            system_cfg = {}
+        profiling = bool(system_cfg.get("frameProfiler", False))
+        # Le thread de simulation mesure ses propres étapes ; le dessin de sa
+        # dernière frame est mesuré ici, à part.
+        profiler = self.engine.profiler if frame is None else self.engine.paint_profiler
+        if profiling:
+            profiler.begin_frame()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, self.engine.quality.antialias)
         painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
         if self._transparent:
             painter.setBackgroundMode(QtCore.Qt.TransparentMode)
@@ -2265,82 +4870,50 @@ class _ViewWidgetBase:
             painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
         else:
             painter.fillRect(self.rect(), QtGui.QColor("black"))
-        width = max(1, self.width())
-        height = max(1, self.height())
         radius_red, radius_yellow, radius_blue = self._compute_marker_radii(width, height)
 
         # Apply circular mask based on red circle
         center_x = width / 2.0
         center_y = height / 2.0
 
-        system_cfg = self.engine.state.get("system", {})
-        if not isinstance(system_cfg, Mapping):
-            system_cfg = {}
         show_imprints = bool(system_cfg.get("showImprints", True))
 
+        imprints = frame.imprints if frame is not None else self.engine._imprints
+        orbiters = frame.orbiters if frame is not None else self.engine._orbiters_draw
+
         # Draw imprints first (under everything)
-        if show_imprints and self.engine._imprints:
-            painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
-            painter.setPen(QtCore.Qt.NoPen)
-            current_time = self.engine.now_ms
-            imprints_to_keep = []
-            for imp_x, imp_y, imp_color, imp_radius, imp_time, imp_id in self.engine._imprints:
-                # Fade out old imprints over time (optional, or keep them permanent)
-                age_sec = (current_time - imp_time) / 1000.0
-                # Make imprints permanent by not fading them
-                alpha = 0.6  # Permanent opacity
-                if alpha > 0.01:
-                    color = QtGui.QColor(imp_color)
-                    color.setAlphaF(alpha)
-                    painter.setBrush(color)
-                    painter.drawEllipse(QtCore.QRectF(imp_x - imp_radius, imp_y - imp_radius, imp_radius * 2, imp_radius * 2))
-                    imprints_to_keep.append((imp_x, imp_y, imp_color, imp_radius, imp_time, imp_id))
-            self.engine._imprints = imprints_to_keep
+        if show_imprints and imprints:
+            self._draw_imprints(painter, imprints)
 
         # Dessiner les orbiters avant le clipping (ils peuvent dépasser le cercle)
-        if self.engine._orbiters_draw:
-            painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
-            painter.setPen(QtCore.Qt.NoPen)
-            for sx, sy, color, r_draw, alpha in self.engine._orbiters_draw:
-                col = QtGui.QColor(color)
-                col.setAlphaF(clamp01(alpha))
-                painter.setBrush(col)
-                painter.drawEllipse(QtCore.QRectF(sx - r_draw, sy - r_draw, r_draw * 2, r_draw * 2))
-        
-        # Apply circular mask based on red circle
-        if radius_red > 0:
-            # Create circular clipping path
-            clip_path = QtGui.QPainterPath()
-            clip_path.addEllipse(
-                QtCore.QRectF(
-                    center_x - radius_red,
-                    center_y - radius_red,
-                    radius_red * 2.0,
-                    radius_red * 2.0
-                )
-            )
-            painter.setClipPath(clip_path)
-        
-        items = self.engine.step(width, height)
+        if orbiters:
+            self._draw_orbiters(painter, orbiters)
+
+        if frame is None:
+            # Empreintes et orbiters déjà dessinés.
+            profiler.mark(STAGE_PAINT)
+            try:
+                buf = self.engine.step(width, height)
+            except Exception:
+                profiler.end_frame()
+                raise
+        else:
+            buf = frame.buffer
         blend_mode = (
-            self.engine.state.get("appearance", {}).get("blendMode", "source-over")
+            params.get("appearance", {}).get("blendMode", "source-over")
         )
-        painter.setCompositionMode(_map_blend_mode(blend_mode))
-        for item in items:
-            color = QtGui.QColor(item.color)
-            color.setAlphaF(clamp01(item.alpha))
-            painter.setBrush(color)
-            painter.setPen(QtCore.Qt.NoPen)
-            if self._shape == "square":
-                painter.drawRect(QtCore.QRectF(item.sx - item.r, item.sy - item.r, item.r * 2, item.r * 2))
-            else:
-                painter.drawEllipse(QtCore.QRectF(item.sx - item.r, item.sy - item.r, item.r * 2, item.r * 2))
-
-        # Remove clipping for marker circles
-        painter.setClipping(False)
-
-        indicator_cfg = self.engine.state.get("indicator", {})
-        donut_centers, _donut_radii, fallback_orbit_radius = self.engine._compute_donut_orbits(width, height)
+        # Particles are clipped to the red circle
+        clip = (center_x, center_y, radius_red) if radius_red > 0 else None
+        self._draw_particles(painter, buf, blend_mode, clip)
+        profiler.mark(STAGE_PAINT)
+
+        indicator_cfg = params.get("indicator", {})
+        if frame is not None and frame.donut is not None:
+            donut = frame.donut
+        else:
+            donut = self.engine._donut_orbits(width, height)
+        donut_centers = donut.centers
+        fallback_orbit_radius = donut.fallback_radius
         donut_count = len(donut_centers)
 
         if donut_count > 0 and isinstance(indicator_cfg, Mapping):
@@ -2438,7 +5011,7 @@ class _ViewWidgetBase:
                         painter.drawLine(QtCore.QLineF(hub_x, hub_y, ex, ey))
 
         # Dessiner les boutons donut directement dans le view widget
-        donut_cfg = self.engine.state.get("donut", {})
+        donut_cfg = params.get("donut", {})
         if isinstance(donut_cfg, Mapping) and donut_centers:
             painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
             
@@ -2514,7 +5087,10 @@ class _ViewWidgetBase:
                 painter.setPen(QtGui.QPen(color, 2.0))
                 painter.drawEllipse(QtCore.QRectF(center_x - radius, center_y - radius, diameter, diameter))
 
-            radius_red, radius_yellow, radius_blue = self.engine.marker_radii(width, height)
+            if frame is not None:
+                radius_red, radius_yellow, radius_blue = frame.marker_radii
+            else:
+                radius_red, radius_yellow, radius_blue = self.engine.marker_radii(width, height)
             if radius_red > 0 and bool(system_cfg.get("redCircleHalo", False)):
                 painter.save()
                 inner_radius = max(0.0, radius_red - 10.0)
@@ -2552,6 +5128,44 @@ class _ViewWidgetBase:
             if radius_blue > 0:
                 _draw_marker_circle(QtGui.QColor("blue"), radius_blue)
 
+        profiler.mark(STAGE_OVERLAY)
+        profiler.end_frame()
+        if profiling:
+            self._draw_profiler_overlay(painter)
+        cost_ms = (time.perf_counter() - started) * 1000.0
+        self._pace_frames(cost_ms)
+        # Avec un thread de simulation, la frame dure au moins son pas.
+        if simulation is not None:
+            cost_ms = max(cost_ms, simulation.step_ms)
+        self.engine.quality.update(cost_ms, max(0.0, _coerce_float(system_cfg.get("targetFrameMs"), 0.0)))
+
+    def _draw_profiler_overlay(self, painter: QtGui.QPainter) -> None:
+        """Average stage times of the last frames, top-left of the view."""
+
+        averages = self.engine.profile_averages(60)
+        total = averages.pop("total")
+        fps = 1000.0 / total if total > 0.0 else 0.0
+        lines = [f"frame {total:6.2f} ms  ({fps:5.1f} fps)"]
+        lines.extend(f"{name:<10} {averages[name]:6.2f} ms" for name in PROFILE_STAGES)
+        quality = self.engine.quality
+        if quality.level < quality.LEVELS:
+            lines.append(f"{'detail':<10} {quality.fraction * 100.0:5.1f} %")
+        painter.save()
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+        font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
+        painter.setFont(font)
+        metrics = QtGui.QFontMetrics(font)
+        line_height = metrics.height()
+        box_width = max(metrics.horizontalAdvance(line) for line in lines) + 12
+        box_height = line_height * len(lines) + 8
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(QtGui.QColor(0, 0, 0, 160))
+        painter.drawRect(QtCore.QRectF(6.0, 6.0, box_width, box_height))
+        painter.setPen(QtGui.QColor(230, 230, 230))
+        for k, line in enumerate(lines):
+            painter.drawText(QtCore.QPointF(12.0, 10.0 + metrics.ascent() + k * line_height), line)
+        painter.restore()
+
 
 class _OpenGLViewWidget(QtWidgets.QOpenGLWidget, _ViewWidgetBase):
     """OpenGL-backed renderer when the system can create a GL context."""
@@ -2559,16 +5173,116 @@ class _OpenGLViewWidget(QtWidgets.QOpenGLWidget, _ViewWidgetBase):
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         QtWidgets.QOpenGLWidget.__init__(self, parent)
         self._gl: Optional[object] = None
+        # Rendu des points par point sprites; None = repli sur QPainter.
+        self._points_gl: Optional[_GLPointRenderer] = None
         self._init_view_widget()
 
     def initializeGL(self) -> None:  # pragma: no cover - requires GUI context
-        self._gl, error = _create_opengl_functions()
+        self._gl, error = _create_opengl_functions(self.context())
         if error is not None:  # pragma: no cover - depends on bindings/runtime
             print(
                 f"[Dyxten][WARN] OpenGL initialisation failed: {error}. Falling back to raster clear handling.",
                 file=sys.stderr,
             )
         self._apply_clear_color()
+        # Un nouveau contexte invalide les ressources GL précédentes.
+        self._points_gl = None
+        if self._gl is not None and os.environ.get("DYXTEN_GL_POINTS", "1").strip().lower() not in {"0", "false", "no"}:
+            renderer = _GLPointRenderer()
+            try:
+                point_error = renderer.initialize(self.context(), self._gl)
+            except Exception as exc:  # pragma: no cover - depends on bindings/runtime
+                point_error = repr(exc)
+            if point_error:
+                print(
+                    f"[Dyxten][WARN] GL point renderer unavailable: {point_error}. Using QPainter for particles.",
+                    file=sys.stderr,
+                )
+            else:
+                self._points_gl = renderer
+                self.context().aboutToBeDestroyed.connect(self._release_point_renderer)
+
+    def _release_point_renderer(self) -> None:  # pragma: no cover - requires GUI context
+        renderer = self._points_gl
+        self._points_gl = None
+        if renderer is None:
+            return
+        self.makeCurrent()
+        try:
+            renderer.release()
+        finally:
+            self.doneCurrent()
+
+    def _draw_points_native(
+        self,
+        painter: QtGui.QPainter,
+        data: object,
+        count: int,
+        max_radius: float,
+        *,
+        square: bool = False,
+        clip: Optional[Tuple[float, float, float]] = None,
+        blend_mode: str = "source-over",
+    ) -> bool:  # pragma: no cover - requires GUI context
+        renderer = self._points_gl
+        if renderer is None:
+            return False
+        painter.beginNativePainting()
+        try:
+            return renderer.draw(
+                self._gl,
+                data,
+                count,
+                max_radius,
+                viewport=(max(1, self.width()), max(1, self.height())),
+                dpr=self.devicePixelRatioF(),
+                square=square,
+                clip=clip,
+                blend_mode=blend_mode,
+            )
+        except Exception as exc:
+            print(
+                f"[Dyxten][WARN] GL point rendering failed ({exc!r}). Using QPainter for particles.",
+                file=sys.stderr,
+            )
+            self._points_gl = None
+            return False
+        finally:
+            painter.endNativePainting()
+
+    def _draw_orbiters(
+        self, painter: QtGui.QPainter, orbiters: Sequence[Tuple[float, float, QtGui.QColor, float, float]]
+    ) -> None:  # pragma: no cover - requires GUI context
+        if self._points_gl is not None:
+            entries = [
+                (sx, sy, r_draw, QtGui.QColor(color).rgba(), alpha)
+                for sx, sy, color, r_draw, alpha in orbiters
+            ]
+            data, max_radius = _pack_discs_gl(entries)
+            if self._draw_points_native(painter, data, len(entries), max_radius):
+                return
+        super()._draw_orbiters(painter, orbiters)
+
+    def _draw_particles(
+        self,
+        painter: QtGui.QPainter,
+        buf: FrameBuffer,
+        blend_mode: str,
+        clip: Optional[Tuple[float, float, float]],
+    ) -> None:  # pragma: no cover - requires GUI context
+        if self._points_gl is not None:
+            data, max_radius = _pack_frame_gl(buf)
+            if self._draw_points_native(
+                painter,
+                data,
+                buf.count,
+                max_radius,
+                square=self._square_particles(),
+                clip=clip,
+                blend_mode=blend_mode,
+            ):
+                return
+        super()._draw_particles(painter, buf, blend_mode, clip)
 
     def resizeGL(self, width: int, height: int) -> None:  # pragma: no cover - requires GUI context
         # No custom viewport management required but keep method for completeness
@@ -2818,16 +5532,20 @@ def _wrap_builtin_generator(generator: GeometryGenerator) -> GeometryGenerator:
 
 
 _JSON_TOPOLOGY_LIBRARY = get_topology_library()
-_json_generators = _JSON_TOPOLOGY_LIBRARY.generators()
-for name, generator in _json_generators.items():
-    definition = _JSON_TOPOLOGY_LIBRARY.get(name)
-    if definition is None:
-        continue
+for definition in _JSON_TOPOLOGY_LIBRARY.definitions():
 
-    def _wrap(gen: GeometryGenerator, *, defaults: Mapping[str, object]):
+    def _wrap(name: str, *, defaults: Mapping[str, object]):
+        # Le code JSON n'est compilé qu'au premier rendu de la topologie.
         def _adapter(geo: Mapping[str, object], cap: int) -> List[Point3D]:
+            gen = _JSON_TOPOLOGY_LIBRARY.generator(name)
+            if gen is None:
+                # Définition JSON inutilisable : elle ne masque pas le générateur intégré
+                fallback = _DEFAULT_GENERATORS.get(name)
+                if fallback is None:
+                    raise ValueError(f"Topologie indisponible: {name}")
+                return _wrap_point_list(fallback(geo, cap), cap)
             params: Dict[str, object] = dict(defaults)
-            extra = {k: v for k, v in geo.items() if isinstance(k, str) and k not in {"code", "topology"}}
+            extra = {k: v for k, v in geo.items() if isinstance(k, str) and k not in {"code", "topology", "uses"}}
             params.update(extra)
             def _as_positive_int(value: object) -> int:
                 try:
@@ -2848,7 +5566,11 @@ for name, generator in _json_generators.items():
 
         return _adapter
 
-    DyxtenEngine._GEOMETRY_GENERATORS[name] = _wrap(generator, defaults=definition.defaults)
+    DyxtenEngine._GEOMETRY_GENERATORS[definition.name] = _wrap(definition.name, defaults=definition.defaults)
+    _defaults = definition.defaults
+    DyxtenEngine._GEOMETRY_PARAMETERS[definition.name] = tuple(
+        (param, _defaults.get(param)) for param in dict.fromkeys((*definition.parameters, *_defaults))
+    )
 
 for name, generator in _DEFAULT_GENERATORS.items():
     if name not in DyxtenEngine._GEOMETRY_GENERATORS:
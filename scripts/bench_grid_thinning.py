@@ -0,0 +1,58 @@
+"""Compare the array and dict versions of ``thin_mask`` and time both.
+
+Each case checks that the two versions keep exactly the same points, then
+prints their wall time.  The dense cases pile every point into a few cells
+(camera zoomed out, small sphere with a large ``dmin``), where pairwise
+comparison is quadratic in the cell occupancy.
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from core.grid_thinning import thin_mask
+
+
+def _unit_sphere(rng, count):
+    vectors = rng.normal(size=(count, 3))
+    return vectors / np.linalg.norm(vectors, axis=1)[:, None]
+
+
+def _cases(rng):
+    yield "screen 20k points, 1280x720, dmin 3 px", rng.uniform(0.0, 1.0, (20000, 2)) * (1280.0, 720.0), 3.0
+    yield "screen 50k points, 1280x720, dmin 2 px", rng.uniform(0.0, 1.0, (50000, 2)) * (1280.0, 720.0), 2.0
+    yield "world 20k points, unit sphere, dmin 0.05", _unit_sphere(rng, 20000), 0.05
+    # Amas denses
+    yield "dense 20k points in a 10 px box, dmin 5 px", rng.uniform(0.0, 10.0, (20000, 2)), 5.0
+    yield "dense 20k points, unit sphere, dmin 0.3", _unit_sphere(rng, 20000), 0.3
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = np.random.default_rng(7)
+    ok = True
+    for label, coords, min_dist in _cases(rng):
+        array_mask, array_s = _timed(thin_mask, coords, min_dist)
+        dict_mask, dict_s = _timed(thin_mask, [tuple(p) for p in coords.tolist()], min_dist)
+        same = array_mask.tolist() == dict_mask
+        ok = ok and same
+        print(
+            f"{label:<44} kept {sum(dict_mask):>6}  array {array_s * 1000.0:8.1f} ms"
+            f"  dict {dict_s * 1000.0:8.1f} ms  {'same' if same else 'MISMATCH'}"
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
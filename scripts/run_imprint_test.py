@@ -25,4 +25,4 @@ print('Total frames:', len(imprint_counts))
 print('Final imprint count:', len(engine._imprints))
 print('Imprint count progression sample (first 20):', imprint_counts[:20])
 print('Any imprint created?', any(c>0 for c in imprint_counts))
-print('Sample imprint entries:', engine._imprints[:5])
+print('Sample imprint entries:', list(engine._imprints)[:5])